@@ -34,9 +34,6 @@ License: See LICENSE file
 
 import sys
 import os
-import shutil
-import tempfile
-import uuid
 import logging
 from pathlib import Path
 from typing import Optional, List
@@ -353,13 +350,11 @@ class InkAutoGen(Effect if INKSCAPE_AVAILABLE else object):
         """
         generated_files: List[str] = []
         pdf_files: List[str] = []
-        temp_working_dir = tempfile.mkdtemp()
 
         if self.logger:
             self.logger.info("=" * 80)
             self.logger.info("BATCH PROCESSING")
             self.logger.info("=" * 80)
-            self.logger.info(f"Temp working directory: {temp_working_dir}")
             self.logger.info(f"Processing {len(csv_data)} rows...")
 
         if apply_layer_visibility:
@@ -374,9 +369,6 @@ class InkAutoGen(Effect if INKSCAPE_AVAILABLE else object):
                 self.logger.debug(f"Row data keys: {list(row.keys())}")
                 self.logger.debug(f"Row data values: {list(row.values())}")
 
-            # Generate unique temporary SVG filename
-            temp_svg_file = os.path.join(temp_working_dir, f'temp_{uuid.uuid4().hex}.svg')
-
             if apply_layer_visibility:
                 svg_root = copy.deepcopy(tmp_svg_root)
 
@@ -438,15 +430,9 @@ class InkAutoGen(Effect if INKSCAPE_AVAILABLE else object):
                 
                 # Serialize to string with proper UTF-8 encoding for Unicode support
                 output_bytes = etree.tostring(svg_root, encoding='utf-8', pretty_print=False, xml_declaration=False)
-                output_str = output_bytes.decode('utf-8')
-
-                # Write processed SVG to temporary file
-                with open(temp_svg_file, 'w', encoding='utf-8', newline='') as f:
-                    f.write(output_str)
 
                 if self.logger:
-                    self.logger.debug(f"Temporary SVG written: {temp_svg_file}")
-                    self.logger.debug(f"Output SVG size: {len(output_str)} characters")
+                    self.logger.debug(f"Output SVG size: {len(output_bytes)} bytes")
 
                 # Generate output filename with CSV column support
                 output_filename = utilities.generate_output_filename(filename_pattern, idx, row, None if len(removed_csv_data) <= idx else removed_csv_data[idx] , self.logger, len(csv_data))
@@ -460,9 +446,9 @@ class InkAutoGen(Effect if INKSCAPE_AVAILABLE else object):
                 if self.logger:
                     self.logger.info(f"Output file: {output_file}")
 
-                # Export to final format
-                export_success = self.file_exporter.export_file( temp_svg_file, output_file
-                                                                , export_format, dpi, overwrite)
+                # Export to final format straight from memory
+                export_success = self.file_exporter.export_svg_data( output_bytes, output_file
+                                                                    , export_format, dpi, overwrite)
 
                 if export_success:
                     generated_files.append(output_file)
@@ -477,34 +463,11 @@ class InkAutoGen(Effect if INKSCAPE_AVAILABLE else object):
                     if self.logger:
                         self.logger.warning(f"Skipped (overwrite disabled): {output_file}")
 
-                # Clean up temporary SVG file
-                if os.path.exists(temp_svg_file):
-                    os.remove(temp_svg_file)
-
-                if self.logger:
-                    self.logger.debug(f"Temporary SVG cleaned up: {temp_svg_file}")
-
             except Exception as e:
                 error_msg = f"Error processing row {idx + 1}: {e}"
                 print(error_msg, file=sys.stderr)
                 if self.logger:
                     self.logger.error(error_msg, exc_info=True)
-                if os.path.exists(temp_svg_file):
-                    try:
-                        os.remove(temp_svg_file)
-                    except:
-                        pass
-
-        # Clean up temporary working directory
-        try:
-            shutil.rmtree(temp_working_dir)
-            if self.logger:
-                self.logger.info(f"Removed temp directory: {temp_working_dir}")
-        except Exception as e:
-            error_msg = f"Failed to remove temp directory: {e}"
-            print(error_msg, file=sys.stderr)
-            if self.logger:
-                self.logger.error(error_msg)
 
         return generated_files, pdf_files
 
@@ -609,7 +572,6 @@ class InkAutoGen(Effect if INKSCAPE_AVAILABLE else object):
             4. Read CSV data
             5. Process each row and generate output files
             6. Merge PDFs if requested
-            7. Cleanup temporary files
         
         Processing Flow:
             - CSV data is read once
@@ -618,10 +580,9 @@ class InkAutoGen(Effect if INKSCAPE_AVAILABLE else object):
                 * Parse template string to create new XML tree
                 * Apply data replacements
                 * Remove blank text nodes
-                * Serialize and save to temporary file
-                * Export to final format
+                * Serialize to bytes
+                * Export to final format from memory
             - Merge PDFs if requested
-            - Clean up temporary files
         
         Error Handling Strategy:
             - Configuration errors: Stop processing immediately
@@ -635,7 +596,6 @@ class InkAutoGen(Effect if INKSCAPE_AVAILABLE else object):
         
         Side Effects:
             - Creates output files in the specified directory
-            - Creates temporary files in temp directory
             - Creates log file if logging is enabled
             - Modifies Inkscape document (temporary changes only)
         
@@ -912,6 +872,9 @@ class InkAutoGen(Effect if INKSCAPE_AVAILABLE else object):
                                                         , filename_pattern=filename_pattern, overwrite=overwrite
                                                         , apply_layer_visibility=apply_layer_visibility, removed_csv_data=removed_csv_data)
 
+        # All exports are done; stop the Inkscape shell process they shared
+        self.file_exporter.close()
+
         # ====================================================================
         # Phase 6: PDF Merging (if requested)
         # ====================================================================
@@ -33,13 +33,19 @@ EXPORT_CSV_FILENAME: str = "inkautogen.csv"
 CACHE_ENABLED: bool = True
 MAX_CACHE_SIZE: int = 100
 CACHE_TTL: int = 3600  # 1 hour
+CACHE_SHARDS: int = 16  # Max independently locked cache stripes (power of two)
+CACHE_MIN_SHARD_SIZE: int = 16  # Fewer stripes are used rather than smaller ones
+CACHE_WAIT_TIMEOUT: float = 30.0  # seconds to wait for another thread's result before computing it
 
 # Performance Settings
 MAX_CSV_ROWS: int = 10000
+CSV_FAST_PATH_MAX_SIZE: int = 4 * 1024 * 1024  # 4MB, quote-free CSVs below this skip the csv module
+CSV_PARALLEL_THRESHOLD: int = 32 * 1024 * 1024  # 32MB, larger quote-free CSVs are parsed in parallel chunks
+CSV_PARALLEL_MAX_WORKERS: int = 8  # Upper bound on worker processes for parallel CSV parsing
 
 # File Security
 MAX_FILE_SIZE: int = 100 * 1024 * 1024  # 100MB
-ALLOWED_CSV_EXTENSIONS: Set[str] = {".csv"}
+ALLOWED_CSV_EXTENSIONS: Final[FrozenSet[str]] = frozenset({".csv"})
 
 # Validation Rules
 VALIDATION_RULES: Dict[str, Tuple[int, int]] = {
@@ -50,7 +56,7 @@ VALIDATION_RULES: Dict[str, Tuple[int, int]] = {
 
 # Row Selection Patterns
 ROW_SELECTION_PATTERNS: Dict[str, str] = {
-    "range": r'(\d+)-(\d+)',  # 1-5
+    "range": r'(\d+)\s*-\s*(\d+)',  # 1-5, 1 - 5
     "single": r'(\d+)',       # 1,4,5,9
     "even": r'even',          # even rows only
     "odd": r'odd'             # odd rows only
@@ -95,6 +101,19 @@ VECTOR_FORMATS: Final[FrozenSet[str]] = frozenset({
 # All formats (derived from subsets for consistency)
 SUPPORTED_EXPORT_FORMATS: Final[FrozenSet[str]] = RASTER_FORMATS | VECTOR_FORMATS
 
+# Inkscape Command Line
+INKSCAPE_EXECUTABLE: str = "inkscape"
+INKSCAPE_TIMEOUT: int = 120  # seconds for a single export
+INKSCAPE_SHELL_TIMEOUT: int = 600  # seconds for one batch of shell-mode exports
+INKSCAPE_PERSISTENT_SHELL: bool = True  # reuse one `inkscape --shell` process per FileExporter
+INKSCAPE_SHELL_MAX_FAILURES: int = 3  # consecutive missing shell outputs before falling back for good
+
+# PDF Merging
+NATIVE_PDF_MERGE_MIN_FILES: int = 3  # use qpdf/pdftk (when installed) from this many files
+PDF_MERGE_CHUNK_THRESHOLD: int = 64  # PyPDF2 merges of more files are done in chunks
+PDF_MERGE_CHUNK_SIZE: int = 64  # files per chunk
+PDF_MERGE_ARGFILE_THRESHOLD: int = 100_000  # total path length passed to qpdf via an @file
+
 # Supported CSV Encodings
 SUPPORTED_ENCODINGS: List[str] = [
     "utf-8", "utf-8-sig", "utf-16", "utf-16-le", "utf-16-be",
@@ -255,10 +274,10 @@ SUPPORTED_PROPERTY_ELEMENTS: Set[str] = {
 }
 
 # File Security
-ALLOWED_IMAGE_EXTENSIONS: Set[str] = {
+ALLOWED_IMAGE_EXTENSIONS: Final[FrozenSet[str]] = frozenset({
     ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".svg", ".webp", ".tiff",
     ".pdf", ".eps", ".ps"
-}
+})
 
 # Performance Settings
 XML_PARSER_OPTIONS: Dict[str, bool] = {
@@ -21,11 +21,19 @@ Classes:
     CSVReader: Main class for reading and processing CSV files
 """
 
+import contextlib
 import csv
+import gc
+import io
+import itertools
+import mmap
 import os
+import sys
 import logging
 import re
-from typing import List, Dict, Optional, Any, Iterator, Tuple
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Optional, Any, Callable, Iterator, Tuple, TextIO
 from pathlib import Path
 
 try:
@@ -42,6 +50,173 @@ from exceptions import CSVProcessingError, PerformanceError
 from security import FileValidator
 from performance import cached, timed
 
+# Single-pass tokenizer for row range specs, built from the shared
+# ROW_SELECTION_PATTERNS: groups 1-2 range, 3 single row, 4 even, 5 odd
+_ROW_SELECTION_TOKEN_PATTERN = re.compile(
+    r'^\s*(?:{range}|{single}|({even})|({odd}))\s*$'.format(**config.ROW_SELECTION_PATTERNS),
+    re.IGNORECASE
+)
+
+
+@contextlib.contextmanager
+def _gc_suspended() -> Iterator[None]:
+    """
+    Suspend the cyclic garbage collector for the duration of the block.
+    
+    Parsed rows are acyclic lists and dicts of strings, so building many of
+    them only triggers generation scans that find nothing to collect. The
+    collector is re-enabled afterwards unless it was already disabled.
+    """
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def _parse_csv_chunk(csv_path: str, start: int, end: int, encoding: str,
+                     max_rows: int) -> List[List[str]]:
+    """
+    Parse one byte range of a CSV file (worker for parallel reading).
+    
+    The worker reads its own range so only parsed rows travel back to the
+    parent process. Ranges always start and end on a line boundary.
+    
+    Args:
+        csv_path: Path to the CSV file
+        start: Byte offset of the first line in the chunk
+        end: Byte offset just past the last line in the chunk
+        encoding: Text encoding of the file
+        max_rows: Stop after this many non-blank rows; more than that
+                  already exceeds the row limit
+        
+    Returns:
+        List of parsed rows in file order
+    """
+    with open(csv_path, 'rb') as f:
+        f.seek(start)
+        chunk = f.read(end - start)
+    
+    rows: List[List[str]] = []
+    filled = 0
+    for row in csv.reader(io.StringIO(chunk.decode(encoding, errors='replace'))):
+        rows.append(row)
+        if row:
+            filled += 1
+            if filled >= max_rows:
+                break
+    return rows
+
+
+def _find_chunk_boundaries(mm: mmap.mmap, chunk_count: int) -> List[int]:
+    """
+    Split a mapped file into roughly equal chunks ending on newlines.
+    
+    Each target offset is moved back to just after the preceding newline,
+    so no line is split between two chunks. Targets without a newline
+    before them are dropped and their bytes merge into the next chunk.
+    
+    Args:
+        mm: Memory-mapped file contents
+        chunk_count: Desired number of chunks
+        
+    Returns:
+        Sorted byte offsets, starting with 0 and ending with the file size
+    """
+    size = len(mm)
+    boundaries = [0]
+    for index in range(1, chunk_count):
+        newline = mm.rfind(b'\n', boundaries[-1], size * index // chunk_count)
+        if newline != -1:
+            boundaries.append(newline + 1)
+    boundaries.append(size)
+    return boundaries
+
+
+def _build_row_projector(keys: List[Optional[str]]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Build a function that copies the given keys out of a row.
+    
+    The values are fetched in one operator.itemgetter call and zipped back
+    with the fixed key tuple, which avoids iterating every item and testing
+    membership per key.
+    
+    Args:
+        keys: Row keys to copy, in output order
+        
+    Returns:
+        Function mapping a row dict to a new dict holding only ``keys``
+        (raises KeyError if a row lacks one of them)
+    """
+    key_tuple = tuple(keys)
+    if not key_tuple:
+        return lambda row: {}
+    
+    getter = itemgetter(*key_tuple)
+    if len(key_tuple) == 1:
+        # itemgetter returns the bare value, not a 1-tuple, for a single key
+        key = key_tuple[0]
+        return lambda row: {key: getter(row)}
+    return lambda row: dict(zip(key_tuple, getter(row)))
+
+
+@cached(ttl=config.CACHE_TTL)
+def _compile_row_range(row_range: str) -> Tuple[Tuple[Tuple[int, int], ...], Tuple[int, ...],
+                                                Tuple[int, ...], Tuple[str, ...]]:
+    """
+    Parse a row range specification into reusable row selectors.
+    
+    The result only depends on the spec string, so it is cached and reused
+    when the same range is applied to many CSV files in a batch.
+    
+    Args:
+        row_range: Range specification (e.g. "1-5,7,even")
+        
+    Returns:
+        Tuple of (ranges, singles, parities, invalid_parts):
+        - ranges: 1-based inclusive (start, end) pairs
+        - singles: 1-based row numbers
+        - parities: Row number remainders modulo 2 to keep (0 even, 1 odd)
+        - invalid_parts: Parts that could not be parsed
+    """
+    ranges = []
+    singles = []
+    parities = []
+    invalid_parts = []
+    
+    for part in row_range.split(','):
+        # Fast path for the common well-formed "7" and "1-5" (or "1 - 5")
+        # parts; isdecimal() only accepts characters int() can convert
+        token = part.strip()
+        if token.isdecimal():
+            singles.append(int(token))
+            continue
+        range_start, sep, range_end = token.partition('-')
+        range_start = range_start.rstrip()
+        range_end = range_end.lstrip()
+        if sep and range_start.isdecimal() and range_end.isdecimal():
+            ranges.append((int(range_start), int(range_end)))
+            continue
+        
+        match = _ROW_SELECTION_TOKEN_PATTERN.match(part)
+        if not match:
+            invalid_parts.append(part.strip())
+            continue
+        
+        range_start, range_end, single, even, odd = match.groups()
+        if range_start is not None:
+            ranges.append((int(range_start), int(range_end)))
+        elif single is not None:
+            singles.append(int(single))
+        elif even is not None:
+            parities.append(0)
+        elif odd is not None:
+            parities.append(1)
+    
+    return tuple(ranges), tuple(singles), tuple(parities), tuple(invalid_parts)
+
 
 class CSVReader:
     """
@@ -62,7 +237,7 @@ class CSVReader:
         >>> print(f"Read {len(data)} rows")
     
     Performance:
-        - Encoding detection is cached with 1-hour TTL
+        - Encoding detection is cached per reader, by file path
         - CSV reading is timed for performance monitoring
         - CSV info retrieval is cached
     """
@@ -85,7 +260,6 @@ class CSVReader:
             self.logger.debug(f"Supported encodings: {len(config.SUPPORTED_ENCODINGS)}")
             self.logger.debug(f"Max CSV rows: {config.MAX_CSV_ROWS}")
     
-    @cached(ttl=3600)
     def detect_encoding(self, file_path: str) -> str:
         """
         Detect file encoding using multiple methods for better accuracy.
@@ -734,15 +908,30 @@ class CSVReader:
         if not data or not missing_elements:
             return data, []
         
-        filtered_data = []
-        removed_data = []
         missing_set = set(missing_elements)
+        header = list(data[0])
+        
+        if all(len(row) == len(header) for row in data):
+            # Every row shares the first row's keys: fetch each side's
+            # values with one itemgetter call instead of testing each key
+            keep_row = _build_row_projector([key for key in header if key not in missing_set])
+            remove_row = _build_row_projector([key for key in header if key in missing_set])
+            try:
+                filtered_data = list(map(keep_row, data))
+                removed_data = list(map(remove_row, data))
+            except KeyError:
+                filtered_data = None
+        else:
+            filtered_data = None
         
-        for row in data:
-            filtered_row = {k: v for k, v in row.items() if k not in missing_set}
-            filtered_data.append(filtered_row)
-            removed_row = {k: v for k, v in row.items() if k in missing_set}
-            removed_data.append(removed_row)
+        if filtered_data is None:
+            filtered_data = []
+            removed_data = []
+            for row in data:
+                filtered_row = {k: v for k, v in row.items() if k not in missing_set}
+                filtered_data.append(filtered_row)
+                removed_row = {k: v for k, v in row.items() if k in missing_set}
+                removed_data.append(removed_row)
         
         if self.logger:
             original_cols = len(data[0]) if data else 0
@@ -752,7 +941,7 @@ class CSVReader:
             self.logger.info(f"Total filtered cells: {total_filtered_cells}")
         
         return filtered_data, removed_data
-        
+
     def filter_rows_by_range(self, data: List[Dict[str, str]], row_range: str) -> List[Dict[str, str]]:
         """
         Filter CSV rows based on range specification.
@@ -780,35 +969,27 @@ class CSVReader:
         total_rows = len(data)
         selected_indices = set()
         
-        # Parse range specification
-        parts = [part.strip() for part in row_range.split(',')]
-        
-        for part in parts:
-            if part.lower() == 'even':
-                selected_indices.update(i for i in range(total_rows) if (i + 1) % 2 == 0)
-            elif part.lower() == 'odd':
-                selected_indices.update(i for i in range(total_rows) if (i + 1) % 2 == 1)
-            elif '-' in part:
-                # Range like "1-5"
-                try:
-                    start, end = map(int, part.split('-'))
-                    # Convert to 0-based indices
-                    start_idx = max(0, start - 1)
-                    end_idx = min(total_rows, end)
-                    selected_indices.update(range(start_idx, end_idx))
-                except ValueError:
-                    if self.logger:
-                        self.logger.warning(f"Invalid range format: {part}")
-            else:
-                # Single number
-                try:
-                    row_num = int(part)
-                    idx = row_num - 1  # Convert to 0-based
-                    if 0 <= idx < total_rows:
-                        selected_indices.add(idx)
-                except ValueError:
-                    if self.logger:
-                        self.logger.warning(f"Invalid row number: {part}")
+        # Parse range specification (cached per spec string)
+        ranges, singles, parities, invalid_parts = _compile_row_range(row_range)
+        
+        for part in invalid_parts:
+            if self.logger:
+                self.logger.warning(f"Invalid row range part: {part}")
+        
+        for parity in parities:
+            # Row numbers are 1-based, so index i is row i + 1
+            selected_indices.update(range(1 - parity, total_rows, 2))
+        
+        for start, end in ranges:
+            # Convert to 0-based indices
+            start_idx = max(0, start - 1)
+            end_idx = min(total_rows, end)
+            selected_indices.update(range(start_idx, end_idx))
+        
+        for row_num in singles:
+            idx = row_num - 1  # Convert to 0-based
+            if 0 <= idx < total_rows:
+                selected_indices.add(idx)
         
         # Sort indices and create filtered data
         filtered_indices = sorted(selected_indices)
@@ -852,6 +1033,56 @@ class CSVReader:
             >>> print(data[0])
             {'column1': 'value1', 'column2': 'value2'}
         """
+        fieldnames, row_values = self._read_csv_rows(csv_path, encoding)
+        column_count = len(fieldnames)
+        
+        with _gc_suspended():
+            data = [dict(zip(fieldnames, values)) for values in row_values]
+            if set(map(len, row_values)) - {column_count}:
+                for row, values in zip(data, row_values):
+                    if len(values) != column_count:
+                        self._fill_ragged_row(row, fieldnames, values)
+        
+        if self.logger:
+            # Log first few rows for debugging
+            for row_number, row in enumerate(data[:5], 1):
+                self.logger.debug(f"  Row {row_number}: {row}")
+            if len(data) > 5:
+                self.logger.debug(f"  ... (remaining rows suppressed)")
+            self.logger.info(f"✓ Read {len(data)} rows successfully")
+            self.logger.info(f"Memory usage: ~{len(str(data))} bytes")
+        
+        # Validate we have data
+        if not data:
+            if self.logger:
+                self.logger.error("CSV file is empty")
+            raise CSVProcessingError(config.ERROR_MESSAGES["no_data"], file_path=csv_path)
+        
+        if self.logger:
+            self.logger.info("="*60)
+            self.logger.info("CSV READING COMPLETED SUCCESSFULLY")
+            self.logger.info("="*60)
+        
+        return data
+    
+    def _read_csv_rows(self, csv_path: str, encoding: str) -> Tuple[Tuple[str, ...], List[List[str]]]:
+        """
+        Open a CSV file and parse its header and raw row values.
+        
+        Used by read_csv_data(). Handles existence checks, encoding
+        detection, BOM removal from headers and the MAX_CSV_ROWS limit.
+        
+        Args:
+            csv_path: Path to the CSV file
+            encoding: File encoding ('autodetect' for automatic detection)
+            
+        Returns:
+            Tuple of (interned header tuple, list of non-blank row value lists)
+            
+        Raises:
+            CSVProcessingError: If CSV file doesn't exist, cannot be parsed,
+                                or exceeds MAX_CSV_ROWS
+        """
         if self.logger:
             self.logger.info("="*60)
             self.logger.info("CSV READING STARTED")
@@ -886,79 +1117,62 @@ class CSVReader:
         
         # Read and parse CSV
         try:
-            data = []
-            
             if self.logger:
                 self.logger.debug("Opening CSV file for reading")
             
-            with open(csv_path, 'r', encoding=encoding, errors='replace') as f:
-                reader = csv.DictReader(f)
+            # utf-8-sig strips a leading BOM in the decoder (and reads BOM-less
+            # files unchanged), so headers need no per-field BOM scrubbing
+            open_encoding = encoding
+            if encoding.lower().replace('-', '').replace('_', '') == 'utf8':
+                open_encoding = 'utf-8-sig'
+            
+            with open(csv_path, 'r', encoding=open_encoding, errors='replace') as f:
+                reader = self._create_row_reader(f, csv_path)
+                header = next(reader, None)
+                fieldnames: Tuple[str, ...] = ()
                 
-                # Clean fieldnames to remove BOM if present
-                if reader.fieldnames:
+                if header:
                     if self.logger:
-                        self.logger.debug(f"Raw headers: {reader.fieldnames}")
+                        self.logger.debug(f"Raw headers: {header}")
                     
-                    cleaned_fieldnames = []
-                    for field in reader.fieldnames:
-                        if field and field.startswith('\ufeff'):
-                            cleaned_field = field.replace('\ufeff', '')
-                            cleaned_fieldnames.append(cleaned_field)
-                            if self.logger:
-                                self.logger.debug(f"✓ Removed BOM from fieldname: '{field}' -> '{cleaned_field}'")
-                        else:
-                            cleaned_fieldnames.append(field)
+                    # A BOM can only precede the first field; explicit
+                    # utf-16-le/be decoding keeps it, so drop it here
+                    if header[0].startswith('\ufeff'):
+                        header[0] = header[0].lstrip('\ufeff')
+                        if self.logger:
+                            self.logger.debug(f"✓ Removed BOM from fieldname: '{header[0]}'")
                     
-                    reader.fieldnames = cleaned_fieldnames
+                    # Intern headers once so every row dict shares the same key
+                    # objects and later lookups hit the identity fast path
+                    fieldnames = tuple(map(sys.intern, header))
                     
                     if self.logger:
-                        self.logger.info(f"CSV headers: {reader.fieldnames}")
-                        self.logger.info(f"Column count: {len(reader.fieldnames)}")
+                        self.logger.info(f"CSV headers: {list(fieldnames)}")
+                        self.logger.info(f"Column count: {len(fieldnames)}")
                 
                 # Check performance limits and read data
-                row_count = 0
-                
                 if self.logger:
                     self.logger.info("Reading CSV rows...")
                 
-                for row in reader:
-                    row_count += 1
-                    
-                    # Enforce performance limits
-                    if row_count > config.MAX_CSV_ROWS:
-                        if self.logger:
-                            self.logger.error(f"Performance limit exceeded: {row_count} > {config.MAX_CSV_ROWS}")
-                        raise PerformanceError(
-                            f"CSV has too many rows: {row_count} (max: {config.MAX_CSV_ROWS})",
-                            limit_type="row_count",
-                            current_value=row_count,
-                            limit=config.MAX_CSV_ROWS
-                        )
-                    
-                    data.append(row)
-                    
-                    if self.logger and row_count <= 5:
-                        # Log first few rows for debugging
-                        self.logger.debug(f"  Row {row_count}: {row}")
-                    elif self.logger and row_count == 6:
-                        self.logger.debug(f"  ... (remaining rows suppressed)")
+                # filter() drops blank lines (matches csv.DictReader behaviour)
+                # and islice() reads at most one row past the limit, so the
+                # limit is checked once instead of on every row
+                with _gc_suspended():
+                    row_values = list(itertools.islice(filter(None, reader), config.MAX_CSV_ROWS + 1))
                 
-                if self.logger:
-                    self.logger.info(f"✓ Read {len(data)} rows successfully")
-                    self.logger.info(f"Memory usage: ~{len(str(data))} bytes")
-            
-            # Validate we have data
-            if not data:
-                if self.logger:
-                    self.logger.error("CSV file is empty")
-                raise CSVProcessingError(config.ERROR_MESSAGES["no_data"], file_path=csv_path)
-            
-            if self.logger:
-                self.logger.info("="*60)
-                self.logger.info("CSV READING COMPLETED SUCCESSFULLY")
-                self.logger.info("="*60)
+                # Enforce performance limits
+                row_count = len(row_values)
+                if row_count > config.MAX_CSV_ROWS:
+                    if self.logger:
+                        self.logger.error(f"Performance limit exceeded: {row_count} > {config.MAX_CSV_ROWS}")
+                    raise PerformanceError(
+                        f"CSV has too many rows: {row_count} (max: {config.MAX_CSV_ROWS})",
+                        limit_type="row_count",
+                        current_value=row_count,
+                        limit=config.MAX_CSV_ROWS
+                    )
             
-            return data
+            return fieldnames, row_values
             
         except csv.Error as e:
             error_msg = f"CSV parsing error: {e}"
@@ -979,4 +1193,124 @@ class CSVReader:
                 error_msg,
                 file_path=csv_path
             ) from e
-
+    
+    def _create_row_reader(self, csv_file: TextIO, csv_path: str) -> Iterator[List[str]]:
+        """
+        Create an iterator of parsed rows for an open CSV file.
+        
+        Small files without quote or NUL characters cannot contain quoted
+        fields or embedded newlines, so they are read in one call and split
+        on newlines and commas directly. Large quote-free files are parsed
+        in parallel chunks when several CPUs are available. Everything else
+        goes through the csv module's parser.
+        
+        Args:
+            csv_file: CSV file opened in text mode
+            csv_path: Path of the open file (used for the size check)
+            
+        Returns:
+            Iterator yielding one list of values per line
+        """
+        file_size = os.path.getsize(csv_path)
+        if file_size > config.CSV_PARALLEL_THRESHOLD and (os.cpu_count() or 1) > 1:
+            rows = self._read_rows_parallel(csv_path, csv_file.encoding)
+            if rows is not None:
+                return rows
+        
+        if file_size > config.CSV_FAST_PATH_MAX_SIZE:
+            return csv.reader(csv_file)
+        
+        content = csv_file.read()
+        if '"' in content or '\0' in content:
+            return csv.reader(io.StringIO(content))
+        
+        if self.logger:
+            self.logger.debug("No quoted fields found, using fast split parser")
+        
+        lines = content.split('\n')
+        if lines and not lines[-1]:
+            lines.pop()
+        # Empty lines become [] exactly as csv.reader reports them
+        return (line.split(',') if line else [] for line in lines)
+    
+    def _read_rows_parallel(self, csv_path: str, encoding: str) -> Optional[Iterator[List[str]]]:
+        """
+        Parse a large CSV file in parallel chunks.
+        
+        The file is memory-mapped to check that it contains no quotes (so a
+        newline always ends a record) and to place chunk boundaries on
+        newlines. Each chunk is parsed by csv.reader in a worker process and
+        the results are chained back together in file order. Workers and the
+        collection loop stop once enough rows were read to exceed
+        MAX_CSV_ROWS, so an oversized file is rejected without parsing all
+        of it.
+        
+        Args:
+            csv_path: Path to the CSV file
+            encoding: Text encoding of the file
+            
+        Returns:
+            Iterator over all rows, or None if the file is not eligible
+            (quoted fields, non ASCII-compatible encoding) or parallel
+            parsing failed for any reason
+        """
+        # Byte-level newline splitting is only valid when '\n' is encoded
+        # as the single 0x0A byte (rules out UTF-16/32)
+        if '\n'.encode(encoding, errors='replace') != b'\n':
+            return None
+        
+        with open(csv_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm.find(b'"') != -1:
+                return None
+            workers = min(os.cpu_count() or 1, config.CSV_PARALLEL_MAX_WORKERS)
+            boundaries = _find_chunk_boundaries(mm, workers)
+        
+        if self.logger:
+            self.logger.info(f"Parsing CSV in {len(boundaries) - 1} parallel chunks")
+        
+        # Header plus one row past the limit is enough for the caller to
+        # report the file as too large
+        max_rows = config.MAX_CSV_ROWS + 2
+        chunks: List[List[List[str]]] = []
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_parse_csv_chunk, csv_path, start, end, encoding, max_rows)
+                    for start, end in zip(boundaries[:-1], boundaries[1:])
+                ]
+                filled = 0
+                for future in futures:
+                    chunk = future.result()
+                    chunks.append(chunk)
+                    filled += sum(1 for row in chunk if row)
+                    if filled >= max_rows:
+                        for pending in futures:
+                            pending.cancel()
+                        break
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"Parallel CSV parsing unavailable, falling back to sequential: {e}")
+            return None
+        
+        return itertools.chain.from_iterable(chunks)
+    
+    @staticmethod
+    def _fill_ragged_row(row: Dict[str, Any], fieldnames: Tuple[str, ...],
+                         values: List[str]) -> None:
+        """
+        Normalize a row whose length differs from the header.
+        
+        Mirrors csv.DictReader: missing trailing columns are set to None and
+        surplus values are collected as a list under the None key.
+        
+        Args:
+            row: Row dictionary built from the zipped header and values
+            fieldnames: Interned header tuple
+            values: Raw values parsed for the row
+        """
+        column_count = len(fieldnames)
+        if len(values) > column_count:
+            row[None] = values[column_count:]
+        else:
+            for field in fieldnames[len(values):]:
+                row[field] = None
@@ -3,17 +3,40 @@
 Custom exception classes for InkAutoGen extension.
 """
 
-from typing import Optional, Any, Dict
+import types
+from typing import Optional, Any, Dict, Mapping
+
+# Shared read-only context for errors raised without any context details
+_EMPTY_CONTEXT: Mapping[str, Any] = types.MappingProxyType({})
+
+
+def _add_context(context: Optional[Dict[str, Any]], key: str, value: Any) -> Dict[str, Any]:
+    """Set key in context, creating the dict on first use."""
+    if context is None:
+        context = {}
+    context[key] = value
+    return context
+
 
 class InkAutoGenError(Exception):
-    """Base exception class for InkAutoGen extension."""
+    """
+    Base exception class for InkAutoGen extension.
+    
+    Attributes:
+        message: Error message
+        error_code: Short code prefixed to str(error), if any
+        context: Details about the error. Errors raised without any details
+            share one read-only empty mapping instead of allocating a dict,
+            so only a non-empty context is a mutable dict; use
+            ``dict(error.context)`` to get a copy that can always be changed.
+    """
     
     def __init__(self, message: str, error_code: Optional[str] = None, 
                  context: Optional[Dict[str, Any]] = None):
         super().__init__(message)
         self.message = message
         self.error_code = error_code
-        self.context = context or {}
+        self.context = context if context else _EMPTY_CONTEXT
     
     def __str__(self) -> str:
         if self.error_code:
@@ -25,11 +48,12 @@ class CSVProcessingError(InkAutoGenError):
     
     def __init__(self, message: str, file_path: Optional[str] = None, 
                  line_number: Optional[int] = None, **kwargs):
-        context = kwargs.get('context', {})
+        context = kwargs.pop('context', None)
+        context = dict(context) if context else None
         if file_path:
-            context['file_path'] = file_path
+            context = _add_context(context, 'file_path', file_path)
         if line_number:
-            context['line_number'] = line_number
+            context = _add_context(context, 'line_number', line_number)
         super().__init__(message, error_code="CSV_ERROR", context=context, **kwargs)
 
 
@@ -38,11 +62,12 @@ class SVGTemplateError(InkAutoGenError):
     
     def __init__(self, message: str, element_type: Optional[str] = None,
                  element_id: Optional[str] = None, **kwargs):
-        context = kwargs.get('context', {})
+        context = kwargs.pop('context', None)
+        context = dict(context) if context else None
         if element_type:
-            context['element_type'] = element_type
+            context = _add_context(context, 'element_type', element_type)
         if element_id:
-            context['element_id'] = element_id
+            context = _add_context(context, 'element_id', element_id)
         super().__init__(message, error_code="SVG_ERROR", context=context, **kwargs)
 
 
@@ -51,11 +76,12 @@ class FileSecurityError(InkAutoGenError):
     
     def __init__(self, message: str, file_path: Optional[str] = None,
                  reason: Optional[str] = None, **kwargs):
-        context = kwargs.get('context', {})
+        context = kwargs.pop('context', None)
+        context = dict(context) if context else None
         if file_path:
-            context['file_path'] = file_path
+            context = _add_context(context, 'file_path', file_path)
         if reason:
-            context['reason'] = reason
+            context = _add_context(context, 'reason', reason)
         super().__init__(message, error_code="SECURITY_ERROR", context=context, **kwargs)
 
 
@@ -64,11 +90,12 @@ class ExportError(InkAutoGenError):
     
     def __init__(self, message: str, export_format: Optional[str] = None,
                  output_path: Optional[str] = None, **kwargs):
-        context = kwargs.get('context', {})
+        context = kwargs.pop('context', None)
+        context = dict(context) if context else None
         if export_format:
-            context['export_format'] = export_format
+            context = _add_context(context, 'export_format', export_format)
         if output_path:
-            context['output_path'] = output_path
+            context = _add_context(context, 'output_path', output_path)
         super().__init__(message, error_code="EXPORT_ERROR", context=context, **kwargs)
 
 
@@ -77,11 +104,12 @@ class ValidationError(InkAutoGenError):
     
     def __init__(self, message: str, field_name: Optional[str] = None,
                  field_value: Optional[Any] = None, **kwargs):
-        context = kwargs.get('context', {})
+        context = kwargs.pop('context', None)
+        context = dict(context) if context else None
         if field_name:
-            context['field_name'] = field_name
+            context = _add_context(context, 'field_name', field_name)
         if field_value is not None:
-            context['field_value'] = str(field_value)
+            context = _add_context(context, 'field_value', str(field_value))
         super().__init__(message, error_code="VALIDATION_ERROR", context=context, **kwargs)
 
 
@@ -90,13 +118,14 @@ class PerformanceError(InkAutoGenError):
     
     def __init__(self, message: str, limit_type: Optional[str] = None,
                  current_value: Optional[Any] = None, limit: Optional[Any] = None, **kwargs):
-        context = kwargs.get('context', {})
+        context = kwargs.pop('context', None)
+        context = dict(context) if context else None
         if limit_type:
-            context['limit_type'] = limit_type
+            context = _add_context(context, 'limit_type', limit_type)
         if current_value is not None:
-            context['current_value'] = str(current_value)
+            context = _add_context(context, 'current_value', str(current_value))
         if limit is not None:
-            context['limit'] = str(limit)
+            context = _add_context(context, 'limit', str(limit))
         super().__init__(message, error_code="PERFORMANCE_ERROR", context=context, **kwargs)
 
 
@@ -105,9 +134,10 @@ class ConfigurationError(InkAutoGenError):
     
     def __init__(self, message: str, config_key: Optional[str] = None,
                  config_value: Optional[Any] = None, **kwargs):
-        context = kwargs.get('context', {})
+        context = kwargs.pop('context', None)
+        context = dict(context) if context else None
         if config_key:
-            context['config_key'] = config_key
+            context = _add_context(context, 'config_key', config_key)
         if config_value is not None:
-            context['config_value'] = str(config_value)
+            context = _add_context(context, 'config_value', str(config_value))
         super().__init__(message, error_code="CONFIG_ERROR", context=context, **kwargs)
@@ -40,9 +40,11 @@ Export Format Support:
     - png600: PNG at 600 DPI
 
 PDF Merge Strategy:
-    1. Try PyPDF2 (pure Python, no external dependencies)
-    2. Fallback to pdfunite (external command-line tool)
-    3. Raise error if both methods fail
+    1. For 3+ files, try qpdf or pdftk (fast native tools) when installed
+    2. Try pikepdf (qpdf bindings) when installed, unless bookmarks are kept
+    3. Try PyPDF2 (pure Python, no external dependencies)
+    4. Fallback to qpdf (if not tried yet), then pdfunite
+    5. Raise error if all methods fail
 
 Performance:
     All export operations are decorated with @timed for performance monitoring.
@@ -78,7 +80,8 @@ Usage Examples:
 
 Dependencies:
     - inkex: Inkscape extension API (optional, for Inkscape integration)
-    - PyPDF2: Optional PDF merge library (pip install PyPDF2)
+    - pikepdf: Optional, faster PDF merge library (pip install pikepdf)
+    - pypdf or PyPDF2: Optional PDF merge library (pip install pypdf)
     - pdfunite: Optional command-line tool (system package)
     - lxml: For SVG XML manipulation (indirect via svg_processor)
     
@@ -91,11 +94,23 @@ Version: 1.5.0
 License: See LICENSE file
 """
 
+import atexit
+import codecs
+import contextlib
+import copy
+import itertools
+import logging
 import os
+import re
+import select
 import shutil
 import subprocess
+import sys
 import tempfile
-from typing import List, Optional, Dict, Any
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Callable, Set, Tuple
 from pathlib import Path
 
 try:
@@ -103,11 +118,227 @@ try:
 except ImportError:
     inkscape = None
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# qpdf bindings: fastest in-process PDF merge when installed
+try:
+    import pikepdf
+except ImportError:
+    pikepdf = None
+
+# PDF library for merging: prefer pypdf, fall back to the older PyPDF2
+try:
+    from pypdf import PdfWriter
+except ImportError:
+    try:
+        from PyPDF2 import PdfWriter
+    except ImportError:
+        PdfWriter = None
+
 import config
 from exceptions import ExportError, ValidationError
 from security import FileValidator
 from performance import timed
 
+# Bytes read to find the XML declaration; it must be the first thing in the file
+_SVG_HEAD_SIZE = 256
+_UTF8_XML_DECLARATION = b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+# Optional UTF-8 BOM, then an XML declaration with an encoding attribute
+_XML_ENCODING_PATTERN = re.compile(rb'\A(?:\xef\xbb\xbf)?<\?xml[^?>]{0,200}encoding\s*=')
+
+# Bytes of Inkscape stderr kept in export error messages
+_STDERR_TAIL_SIZE = 4096
+
+# Threads used to read SVG headers concurrently before a raster batch
+_SVG_PREFETCH_WORKERS = 32
+
+# External PDF merge tools, resolved once at import time
+_QPDF = shutil.which("qpdf")
+_PDFTK = shutil.which("pdftk")
+_PDFUNITE = shutil.which("pdfunite")
+
+# ioctl request to share file extents (copy-on-write clone) on Linux
+_FICLONE = 0x40049409
+# os.sendfile accepts regular files as the destination only on these platforms
+_SENDFILE_COPY = hasattr(os, 'sendfile') and sys.platform.startswith(('linux', 'freebsd'))
+
+# The persistent Inkscape shell waits for its prompt with select(), which
+# only works on pipes on POSIX systems
+_PERSISTENT_SHELL_SUPPORTED = os.name == 'posix'
+_SHELL_PROMPT = b'> '
+
+# Named temp files are created exclusively and close-on-exec, so their
+# descriptors can never reach a child process
+_TEMP_FILE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_CLOEXEC', 0)
+
+# Temp files are unlinked relative to an open directory descriptor where supported
+_UNLINK_DIR_FD = os.unlink in os.supports_dir_fd and hasattr(os, 'O_DIRECTORY')
+
+# Temp entries are removed from a thread pool from this many entries on, so
+# removals overlap on high-latency (network) filesystems
+_CLEANUP_PARALLEL_MIN = 4
+_CLEANUP_WORKERS = 32
+
+
+def _has_encoding_declaration(head: bytes) -> bool:
+    """
+    Check whether the start of an SVG file declares its encoding.
+    
+    Args:
+        head: First bytes of the file (a UTF-8 BOM is allowed)
+        
+    Returns:
+        True if the file starts with an XML declaration naming an encoding
+    """
+    return _XML_ENCODING_PATTERN.match(head) is not None
+
+
+def _with_utf8_declaration(content: bytes) -> bytes:
+    """
+    Give SVG content an XML declaration with UTF-8 encoding.
+    
+    An existing declaration without encoding is replaced; otherwise the
+    declaration is inserted at the beginning. A UTF-8 BOM is kept.
+    
+    Args:
+        content: SVG file content
+        
+    Returns:
+        Content starting with the UTF-8 XML declaration (after any BOM)
+    """
+    bom = codecs.BOM_UTF8 if content.startswith(codecs.BOM_UTF8) else b''
+    content = content[len(bom):]
+    
+    if content.startswith(b'<?xml'):
+        # Replace existing declaration without encoding
+        declaration_end = content.find(b'?>')
+        body = content[declaration_end + 2:] if declaration_end != -1 else content
+    else:
+        # Insert XML declaration at the beginning
+        body = b'\n' + content
+    
+    return bom + _UTF8_XML_DECLARATION + body
+
+
+def _temp_output_path(output_path: str) -> str:
+    """
+    Return a temp file path next to ``output_path``.
+    
+    Writing there and then calling os.replace() keeps the final file from
+    ever being seen half-written; the rename is atomic because both paths
+    are on the same filesystem.
+    
+    Args:
+        output_path: Final output path
+        
+    Returns:
+        Process-unique temp path in the same directory
+    """
+    return f"{output_path}.{os.getpid()}.tmp"
+
+
+def _discard_temp_output(temp_path: str) -> None:
+    """
+    Remove a temp output left behind by a failed write.
+    
+    Args:
+        temp_path: Path returned by _temp_output_path()
+    """
+    try:
+        os.unlink(temp_path)
+    except OSError:
+        pass
+
+
+def _kernel_copy(src_fd: int, dst_fd: int) -> None:
+    """
+    Copy an open file to another entirely inside the kernel.
+    
+    Tries a FICLONE reflink first (Linux only), then loops os.sendfile
+    until the full source size has been sent.
+    
+    Args:
+        src_fd: Source file descriptor (opened for reading)
+        dst_fd: Destination file descriptor (opened for writing, empty)
+        
+    Raises:
+        OSError: If sendfile is not supported for these files
+    """
+    if fcntl is not None and sys.platform.startswith('linux'):
+        try:
+            fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+            return
+        except OSError:
+            pass
+    
+    size = os.fstat(src_fd).st_size
+    sent = 0
+    while sent < size:
+        count = os.sendfile(dst_fd, src_fd, sent, size - sent)
+        if count == 0:
+            break
+        sent += count
+
+
+def _fast_copy(src: str, dst: str) -> None:
+    """
+    Copy a file using the cheapest mechanism the platform offers.
+    
+    Strategies, in order:
+    1. Copy-on-write clone via the FICLONE ioctl (Btrfs, XFS, ...)
+    2. os.sendfile over the whole file (Linux/FreeBSD), which never
+       copies the data through user space
+    3. shutil.copyfile
+    Metadata is then copied with shutil.copystat, as shutil.copy2 does.
+    
+    Args:
+        src: Source file path
+        dst: Destination file path (overwritten if it exists)
+        
+    Raises:
+        shutil.SameFileError: If src and dst are the same file, which
+            shutil.copy2 also refuses (truncating or unlinking dst would
+            destroy src)
+    """
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+    
+    if _SENDFILE_COPY:
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                _kernel_copy(fsrc.fileno(), fdst.fileno())
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass
+    
+    shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def _output_signature(path: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Identify the current state of an output file.
+    
+    Used to tell whether an export wrote the file. The size and inode are
+    compared along with the mtime, because on filesystems with coarse
+    timestamps a rewrite within the same tick leaves st_mtime_ns unchanged.
+    
+    Args:
+        path: Output file path
+        
+    Returns:
+        (st_mtime_ns, st_size, st_ino), or None if the file does not exist
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
 
 class FileExporter:
     """
@@ -121,6 +352,8 @@ class FileExporter:
     - DPI support for raster formats
     - SVG encoding preservation for raster export
     - Overwrite control to prevent data loss
+    - One Inkscape shell process reused across exports (stopped by close()
+      or by using the exporter as a context manager)
     - Performance monitoring via @timed decorator
     - Detailed logging at all levels
     
@@ -151,33 +384,105 @@ class FileExporter:
             This is useful for unit testing without Inkscape installed.
         """
         self.logger = logger
+        # Level checks are done once; disabled levels then skip building messages
+        self._log_info = bool(logger) and logger.isEnabledFor(logging.INFO)
+        self._log_debug = bool(logger) and logger.isEnabledFor(logging.DEBUG)
         self.allow_mock = allow_mock
-        
-        if self.logger:
+        # (abspath, mtime_ns, size) of SVGs whose XML declaration is known good
+        self._encoding_ok: Set[Tuple[str, int, int]] = set()
+        # Output directories that already passed full path validation
+        self._validated_dirs: Set[str] = set()
+        # Long-lived `inkscape --shell` process reused by single exports
+        self._shell: Optional[subprocess.Popen] = None
+        self._shell_lock = threading.Lock()
+        self._shell_unavailable = False
+        # Consecutive shell exports that returned without writing their output
+        self._shell_failures = 0
+        # Inkscape executable on PATH, looked up on first use
+        self._inkscape_path: Optional[str] = None
+        self._inkscape_resolved = False
+        
+        if self._log_info:
             self.logger.info("FileExporter initialized")
             self.logger.debug(f"Mock mode: {allow_mock}")
         
         if not allow_mock:
             self._validate_inkscape_availability()
     
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - stops the Inkscape shell process."""
+        self.close()
+        return False
+    
+    def __del__(self):
+        """Stop the Inkscape shell process when the exporter is collected."""
+        try:
+            self.close()
+        except Exception:
+            pass
+    
+    def close(self) -> None:
+        """
+        Stop the persistent Inkscape shell process, if one is running.
+        
+        The shell is asked to quit and is terminated if it does not exit
+        promptly. The exporter stays usable; the next export starts a new
+        shell.
+        """
+        shell, self._shell = self._shell, None
+        if shell is None:
+            return
+        
+        try:
+            if shell.poll() is None:
+                shell.stdin.write(b"quit\n")
+                shell.stdin.flush()
+                shell.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            shell.kill()
+            shell.wait()
+        finally:
+            for stream in (shell.stdin, shell.stdout):
+                with contextlib.suppress(OSError):
+                    stream.close()
+        
+        if self._log_debug:
+            self.logger.debug("Inkscape shell process stopped")
+    
+    def _inkscape_executable(self) -> Optional[str]:
+        """
+        Return the Inkscape executable path, searching PATH only once.
+        
+        Returns:
+            Absolute executable path, or None if Inkscape is not on PATH
+        """
+        if not self._inkscape_resolved:
+            self._inkscape_path = shutil.which(config.INKSCAPE_EXECUTABLE)
+            self._inkscape_resolved = True
+        return self._inkscape_path
+    
     def _validate_inkscape_availability(self) -> None:
         """
         Validate that Inkscape is available for export operations.
         
-        This check ensures that the Inkscape command interface is available.
-        If Inkscape is not available and mock mode is disabled,
-        an ExportError is raised.
+        This check ensures that the Inkscape command interface (inkex) or
+        the Inkscape executable is available. If neither is available and
+        mock mode is disabled, an ExportError is raised.
         
         Raises:
             ExportError: If Inkscape command interface is not available
         """
-        if inkscape is None and not self.allow_mock:
+        if inkscape is None and not self.allow_mock and self._inkscape_executable() is None:
             if self.logger:
                 self.logger.error("Inkscape command interface not available")
                 self.logger.error("Ensure Inkscape is installed and inkex module is available")
             raise ExportError("Inkscape command interface not available")
         
-        if self.logger:
+        if self._log_debug:
             self.logger.debug("Inkscape command interface validated successfully")
     
     @timed(operation="file_exporter.export_file")
@@ -229,7 +534,7 @@ class FileExporter:
             >>> exporter.export_file('template.svg', 'output.pdf', 'pdf', overwrite=False)
             False  # File exists and overwrite is False
         """
-        if self.logger:
+        if self._log_info:
             self.logger.info("=" * 60)
             self.logger.info("FILE EXPORT OPERATION")
             self.logger.info("=" * 60)
@@ -239,36 +544,17 @@ class FileExporter:
             self.logger.info(f"DPI: {dpi}")
             self.logger.info(f"Overwrite: {overwrite}")
         
-        # Validate parameters
-        self._validate_export_parameters(input_svg_path, output_path, export_format, dpi)
-        
-        if self.logger:
-            self.logger.debug("Export parameters validated successfully")
-        
-        # Check if file exists and overwrite setting
-        if os.path.exists(output_path) and not overwrite:
-            if self.logger:
-                self.logger.info(f"File exists and overwrite disabled, skipping: {output_path}")
+        if not self._prepare_export(input_svg_path, output_path, export_format, dpi, overwrite):
             return False
         
-        # Ensure output directory exists
-        output_dir = os.path.dirname(output_path)
-        if output_dir and not os.path.exists(output_dir):
-            if self.logger:
-                self.logger.info(f"Creating output directory: {output_dir}")
-            os.makedirs(output_dir, exist_ok=True)
-        else:
-            if self.logger:
-                self.logger.debug(f"Output directory exists: {output_dir}")
-        
         try:
             # Export based on format type
             if export_format == 'svg':
-                if self.logger:
+                if self._log_info:
                     self.logger.info("Exporting as SVG (direct copy)")
                 return self._export_svg(input_svg_path, output_path)
             else:
-                if self.logger:
+                if self._log_info:
                     self.logger.info(f"Exporting via Inkscape ({export_format} format)")
                 return self._export_via_inkscape(input_svg_path, output_path, export_format, dpi)
         
@@ -282,7 +568,152 @@ class FileExporter:
                 output_path=output_path
             ) from e
     
-    def _validate_export_parameters(self, input_svg_path: str, output_path: str,
+    @timed(operation="file_exporter.export_svg_data")
+    def export_svg_data(self, svg_data: bytes, output_path: str, export_format: str,
+                        dpi: int = config.DEFAULT_DPI, overwrite: bool = True) -> bool:
+        """
+        Export in-memory SVG data to specified format.
+        
+        Same as export_file() for SVG documents that only exist in memory,
+        such as a template after CSV values were applied. Writing such a
+        document to a temporary file just so Inkscape can read it back
+        costs two disk round trips per file, so:
+        - SVG format: The data is written straight to output_path
+        - Inkscape shell in use: The data goes through a temporary file,
+          as starting a process per file costs more than the disk I/O
+        - Otherwise: ``inkscape --pipe`` reads the SVG from stdin and
+          writes the result to stdout; only the final file is written
+        
+        Args:
+            svg_data: Serialized SVG document (UTF-8)
+            output_path: Path to output file (with extension)
+            export_format: Export format (pdf, png, svg, jpg, eps, etc.)
+            dpi: DPI for raster formats (72-1200, default: 300)
+            overwrite: Whether to overwrite existing files (default: True)
+            
+        Returns:
+            True if export successful, False if skipped (file exists, overwrite=False)
+            
+        Raises:
+            ExportError: If export fails (Inkscape error, file system error)
+            ValidationError: If parameters are invalid (bad path, unsupported format, invalid DPI)
+        """
+        if self._log_info:
+            self.logger.info("=" * 60)
+            self.logger.info("SVG DATA EXPORT OPERATION")
+            self.logger.info("=" * 60)
+            self.logger.info(f"SVG data size: {len(svg_data)} bytes")
+            self.logger.info(f"Output path: {output_path}")
+            self.logger.info(f"Export format: {export_format}")
+            self.logger.info(f"DPI: {dpi}")
+            self.logger.info(f"Overwrite: {overwrite}")
+        
+        if not self._prepare_export(None, output_path, export_format, dpi, overwrite):
+            return False
+        
+        try:
+            if export_format in config.RASTER_FORMATS and not _has_encoding_declaration(svg_data[:_SVG_HEAD_SIZE]):
+                svg_data = _with_utf8_declaration(svg_data)
+            
+            executable = self._inkscape_executable()
+            if export_format == 'svg':
+                if self._log_info:
+                    self.logger.info("Exporting as SVG (direct write)")
+                exported_data = svg_data
+            elif executable is None or self._shell_usable():
+                return self._export_data_via_temp_file(svg_data, output_path, export_format, dpi)
+            else:
+                if self._log_info:
+                    self.logger.info(f"Exporting via Inkscape pipe ({export_format} format)")
+                exported_data = self._export_via_inkscape_pipe(executable, svg_data, export_format, dpi, output_path)
+            
+            with open(output_path, 'wb') as f:
+                f.write(exported_data)
+            
+            if self._log_info:
+                self.logger.info(f"Output file created: {output_path}")
+                self.logger.info(f"Output file size: {len(exported_data)} bytes")
+            
+            return True
+        
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Export failed with exception: {type(e).__name__}")
+                self.logger.error(f"Exception details: {e}")
+            raise ExportError(
+                config.ERROR_MESSAGES["export_failed"].format(error=e),
+                export_format=export_format,
+                output_path=output_path
+            ) from e
+    
+    def _export_data_via_temp_file(self, svg_data: bytes, output_path: str,
+                                   export_format: str, dpi: int) -> bool:
+        """
+        Export in-memory SVG data through a temporary SVG file.
+        
+        Args:
+            svg_data: Serialized SVG document (UTF-8)
+            output_path: Output file path
+            export_format: Export format (pdf, png, jpg, eps, etc.)
+            dpi: DPI for raster formats
+            
+        Returns:
+            True if export successful
+        """
+        fd, temp_svg_path = tempfile.mkstemp(suffix='.svg')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(svg_data)
+            return self._export_via_inkscape(temp_svg_path, output_path, export_format, dpi)
+        finally:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_svg_path)
+    
+    def _prepare_export(self, input_svg_path: Optional[str], output_path: str, export_format: str,
+                        dpi: int, overwrite: bool) -> bool:
+        """
+        Validate an export and make sure its output location is ready.
+        
+        Shared by export_file(), export_svg_data() and batch_export() so
+        they all apply the same validation, overwrite and directory rules.
+        
+        Args:
+            input_svg_path: Path to input SVG file to export, or None for
+                            in-memory SVG data
+            output_path: Path to output file (with extension)
+            export_format: Export format (pdf, png, svg, jpg, eps, etc.)
+            dpi: DPI for raster formats
+            overwrite: Whether to overwrite existing files
+            
+        Returns:
+            True if the export should proceed, False if it is skipped
+            (file exists, overwrite=False)
+            
+        Raises:
+            ValidationError: If parameters are invalid
+        """
+        # Validate parameters
+        self._validate_export_parameters(input_svg_path, output_path, export_format, dpi)
+        
+        if self._log_debug:
+            self.logger.debug("Export parameters validated successfully")
+        
+        # Check if file exists and overwrite setting
+        if not overwrite and os.path.exists(output_path):
+            if self._log_info:
+                self.logger.info(f"File exists and overwrite disabled, skipping: {output_path}")
+            return False
+        
+        # Ensure output directory exists (a single mkdir that no-ops if present)
+        output_dir = os.path.dirname(output_path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+            if self._log_debug:
+                self.logger.debug(f"Output directory ready: {output_dir}")
+        
+        return True
+    
+    def _validate_export_parameters(self, input_svg_path: Optional[str], output_path: str,
                                    export_format: str, dpi: int) -> None:
         """
         Validate export parameters.
@@ -304,38 +735,55 @@ class FileExporter:
             ValidationError: If any parameter is invalid
             
         Validation Rules:
-        - Input SVG must exist and be readable
+        - Input SVG must exist and be readable (unless None, for in-memory data)
         - Output path must not be empty
         - Output path must not contain invalid characters
         - Export format must be in SUPPORTED_EXPORT_FORMATS
         - DPI must be integer between 72 and 1200
         """
-        if self.logger:
+        if self._log_debug:
             self.logger.debug("Validating export parameters...")
         
-        # Consolidated validation checks
-        validation_checks = [
-            (input_svg_path and os.path.exists(input_svg_path), 
-             "Input SVG file does not exist", "input_svg_path"),
-            (output_path, 
-             "Output path cannot be empty", "output_path"),
-            (export_format in config.SUPPORTED_EXPORT_FORMATS,
-             f"Unsupported export format: {export_format}", "export_format"),
-            (isinstance(dpi, int) and 72 <= dpi <= 1200,
-             f"DPI must be between 72 and 1200, got: {dpi}", "dpi")
-        ]
-        
-        for check, error_msg, field_name in validation_checks:
-            if not check:
-                if self.logger:
-                    self.logger.error(error_msg)
-                raise ValidationError(error_msg, field_name=field_name, value=str(dpi) if field_name == "dpi" else None)
+        # Checks run in order and stop at the first failure; messages are
+        # only formatted when a check fails
+        min_dpi, max_dpi = config.VALIDATION_RULES["dpi"]
+        if input_svg_path is not None and not (input_svg_path and os.path.exists(input_svg_path)):
+            self._raise_validation_error("Input SVG file does not exist", "input_svg_path", input_svg_path)
+        if not output_path:
+            self._raise_validation_error("Output path cannot be empty", "output_path", output_path)
+        if export_format not in config.SUPPORTED_EXPORT_FORMATS:
+            self._raise_validation_error(f"Unsupported export format: {export_format}",
+                                         "export_format", export_format)
+        if not (isinstance(dpi, int) and min_dpi <= dpi <= max_dpi):
+            self._raise_validation_error(f"DPI must be between {min_dpi} and {max_dpi}, got: {dpi}", "dpi", dpi)
+        
+        # Validate output path security separately; batch outputs share a
+        # directory, so after its first full check only the name is checked
+        output_dir = os.path.dirname(output_path)
+        if output_dir in self._validated_dirs:
+            FileValidator.validate_file_name(output_path, config.ALLOWED_IMAGE_EXTENSIONS)
+        else:
+            FileValidator.validate_file_path(output_path, config.ALLOWED_IMAGE_EXTENSIONS)
+            self._validated_dirs.add(output_dir)
         
-        # Validate output path security separately
-        FileValidator.validate_file_path(output_path, config.ALLOWED_IMAGE_EXTENSIONS)
+        if self._log_debug:
+            self.logger.debug("All export parameters validated successfully")
+    
+    def _raise_validation_error(self, error_msg: str, field_name: str, field_value: Any) -> None:
+        """
+        Log and raise a ValidationError for an export parameter.
         
+        Args:
+            error_msg: Error message
+            field_name: Name of the invalid parameter
+            field_value: Rejected value
+            
+        Raises:
+            ValidationError: Always
+        """
         if self.logger:
-            self.logger.debug("All export parameters validated successfully")
+            self.logger.error(error_msg)
+        raise ValidationError(error_msg, field_name=field_name, field_value=field_value)
     
     def _export_svg(self, input_svg_path: str, output_path: str) -> bool:
         """
@@ -344,7 +792,7 @@ class FileExporter:
         For SVG format, we perform a direct file copy since no conversion
         is needed. This is much faster than going through Inkscape.
         
-        Uses shutil.copy2 to preserve metadata.
+        Uses _fast_copy() (reflink or in-kernel copy) and preserves metadata.
         
         Args:
             input_svg_path: Input SVG path
@@ -358,12 +806,12 @@ class FileExporter:
         - Does not go through Inkscape (fast path)
         - No DPI setting needed for SVG format
         """
-        if self.logger:
+        if self._log_info:
             self.logger.info(f"Copying SVG file: {input_svg_path} -> {output_path}")
         
-        shutil.copy2(input_svg_path, output_path)
+        _fast_copy(input_svg_path, output_path)
         
-        if self.logger:
+        if self._log_info:
             self.logger.debug(f"SVG file copied successfully to: {output_path}")
             self.logger.info(f"File size: {os.path.getsize(output_path)} bytes")
         
@@ -381,7 +829,10 @@ class FileExporter:
         Export Process:
         1. Build export arguments (type, filename, DPI for raster)
         2. For raster formats: Ensure SVG has UTF-8 encoding declaration
-        3. Execute Inkscape command via inkex
+        3. Send the export to the persistent Inkscape shell; if that is not
+           possible or produces no output, execute the Inkscape executable
+           directly (stdout discarded, own session, timeout), or via inkex
+           if it is not on PATH
         4. Verify output file was created
         
         Args:
@@ -394,7 +845,7 @@ class FileExporter:
             True if export successful
             
         Raises:
-            ExportError: If Inkscape command interface is not available
+            ExportError: If Inkscape is not available, fails or times out
         """
         # Build export arguments
         export_args = {
@@ -405,47 +856,280 @@ class FileExporter:
         # Add DPI for raster formats
         if export_format in config.RASTER_FORMATS:
             export_args['export_dpi'] = dpi
-            if self.logger:
+            if self._log_info:
                 self.logger.info(f"Raster format detected, using DPI: {dpi}")
         
-        if self.logger:
-            cmd_preview = f"inkscape {input_svg_path} --export-type {export_format} --export-filename {output_path}"
-            if export_format in config.RASTER_FORMATS:
-                cmd_preview += f" --export-dpi {dpi}"
-            self.logger.debug(f"Export command: {cmd_preview}")
+        executable = self._inkscape_executable()
+        if executable is None and inkscape is None:
+            if self.logger:
+                self.logger.error("Inkscape command interface not available")
+            raise ExportError("Inkscape command interface not available")
         
-        # Execute export with encoding considerations
-        if inkscape is not None:
-            # For raster formats, ensure text encoding is preserved
-            if export_format in config.RASTER_FORMATS:
-                if self.logger:
-                    self.logger.info("Ensuring UTF-8 encoding for raster export...")
-                self._ensure_svg_encoding(input_svg_path, export_format)
-            
+        # Same options inkex would pass: --export-type=png ...
+        cmd = [executable or config.INKSCAPE_EXECUTABLE, input_svg_path]
+        cmd += [f"--{option.replace('_', '-')}={value}" for option, value in export_args.items()]
+        
+        if self._log_debug:
+            self.logger.debug(f"Export command: {' '.join(cmd)}")
+        
+        # For raster formats, ensure text encoding is preserved
+        if export_format in config.RASTER_FORMATS:
+            if self._log_info:
+                self.logger.info("Ensuring UTF-8 encoding for raster export...")
+            self._ensure_svg_encoding(input_svg_path, export_format)
+        
+        if self._log_info:
+            self.logger.info("Executing Inkscape export command...")
+        
+        if executable is not None:
+            if not self._export_via_shell(executable, input_svg_path, output_path, export_format, dpi):
+                self._run_inkscape(cmd, export_format, output_path)
+        else:
+            inkscape(input_svg_path, **export_args)
+        
+        # Verify output file was created (one stat gives existence and size)
+        try:
+            file_size = os.stat(output_path).st_size
+        except OSError:
             if self.logger:
-                self.logger.info("Executing Inkscape export command...")
+                self.logger.error(f"Export command completed but output file not found: {output_path}")
+        else:
+            if self._log_info:
+                self.logger.info(f"Export completed successfully")
+                self.logger.info(f"Output file created: {output_path}")
+                self.logger.info(f"Output file size: {file_size} bytes")
+        
+        if self._log_debug:
+            self.logger.debug("Export command completed successfully")
+        
+        return True
+    
+    def _export_via_shell(self, executable: str, input_svg_path: str, output_path: str,
+                          export_format: str, dpi: int) -> bool:
+        """
+        Export one file through the persistent Inkscape shell process.
+        
+        Starting Inkscape dominates the cost of a single export, so one
+        ``inkscape --shell`` process is started lazily and reused for every
+        export of this exporter until close() is called. Each export writes
+        one action line and waits for the shell prompt.
+        
+        Inkscape does not report per-action results in shell mode, so the
+        export counts as done only if the output file was written. Any
+        failure stops the shell and returns False so the caller can fall
+        back to a one-off Inkscape run, which reports a proper error.
+        A shell that fails, hangs or exits is not started again for this
+        exporter, and neither is one that answers but leaves its output
+        unwritten INKSCAPE_SHELL_MAX_FAILURES times in a row, so a broken
+        shell does not cost every later file a prompt timeout.
+        
+        Args:
+            executable: Inkscape executable path
+            input_svg_path: Input SVG path
+            output_path: Output file path
+            export_format: Export format (pdf, png, jpg, eps, etc.)
+            dpi: DPI for raster formats
             
-            inkscape(input_svg_path, **export_args)
+        Returns:
+            True if the shell exported the file, False otherwise
+        """
+        if not self._shell_usable():
+            return False
+        # ';' separates actions and a newline ends the command line
+        if any(char in path for path in (input_svg_path, output_path) for char in ';\r\n'):
+            return False
+        
+        actions = [
+            f"file-open:{input_svg_path}",
+            f"export-filename:{output_path}",
+            f"export-type:{export_format}",
+        ]
+        if export_format in config.RASTER_FORMATS:
+            actions.append(f"export-dpi:{dpi}")
+        actions += ["export-do", "file-close"]
+        command = ("; ".join(actions) + "\n").encode('utf-8')
+        
+        with self._shell_lock:
+            previous_signature = _output_signature(output_path)
             
-            # Verify output file was created
-            if os.path.exists(output_path):
-                file_size = os.path.getsize(output_path)
-                if self.logger:
-                    self.logger.info(f"Export completed successfully")
-                    self.logger.info(f"Output file created: {output_path}")
-                    self.logger.info(f"Output file size: {file_size} bytes")
-            else:
+            try:
+                shell = self._start_shell(executable)
+                shell.stdin.write(command)
+                shell.stdin.flush()
+                self._wait_for_shell_prompt(shell)
+            except (OSError, subprocess.SubprocessError) as e:
                 if self.logger:
-                    self.logger.error(f"Export command completed but output file not found: {output_path}")
-        else:
+                    self.logger.warning(f"Inkscape shell export failed: {type(e).__name__}: {e}")
+                self._shell_unavailable = True
+                self.close()
+                return False
+            
+            signature = _output_signature(output_path)
+            if signature is not None and signature != previous_signature:
+                self._shell_failures = 0
+                return True
+            
+            self._shell_failures += 1
+            if self._shell_failures >= config.INKSCAPE_SHELL_MAX_FAILURES:
+                self._shell_unavailable = True
+            self.close()
+            return False
+    
+    def _shell_usable(self) -> bool:
+        """
+        Check whether exports may go through the persistent Inkscape shell.
+        
+        Returns:
+            True if the shell is enabled, supported and can be started
+        """
+        return config.INKSCAPE_PERSISTENT_SHELL and _PERSISTENT_SHELL_SUPPORTED and not self._shell_unavailable
+    
+    def _start_shell(self, executable: str) -> subprocess.Popen:
+        """
+        Return the running Inkscape shell, starting it if needed.
+        
+        Args:
+            executable: Inkscape executable path
+            
+        Returns:
+            The shell process, ready for the next command
+            
+        Raises:
+            OSError: If the process cannot be started
+            subprocess.SubprocessError: If it exits or hangs before its prompt
+        """
+        if self._shell is not None and self._shell.poll() is None:
+            return self._shell
+        
+        try:
+            self._shell = subprocess.Popen(
+                [executable, '--shell'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
+            )
+        except OSError:
+            # Do not retry a process that cannot be started for every file
+            self._shell_unavailable = True
+            raise
+        
+        if self._log_info:
+            self.logger.info(f"Started Inkscape shell process (pid {self._shell.pid})")
+        
+        self._wait_for_shell_prompt(self._shell)
+        return self._shell
+    
+    def _wait_for_shell_prompt(self, shell: subprocess.Popen) -> None:
+        """
+        Read Inkscape shell output until its prompt appears.
+        
+        Args:
+            shell: Inkscape shell process
+            
+        Raises:
+            subprocess.TimeoutExpired: If no prompt arrives within INKSCAPE_TIMEOUT
+            subprocess.SubprocessError: If the shell exits first
+        """
+        fd = shell.stdout.fileno()
+        deadline = time.monotonic() + config.INKSCAPE_TIMEOUT
+        tail = b''
+        
+        while not tail.endswith(_SHELL_PROMPT):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(shell.args, config.INKSCAPE_TIMEOUT)
+            
+            readable, _, _ = select.select([fd], [], [], remaining)
+            if not readable:
+                continue
+            
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                raise subprocess.SubprocessError("Inkscape shell exited unexpectedly")
+            tail = (tail + chunk)[-len(_SHELL_PROMPT):]
+    
+    def _export_via_inkscape_pipe(self, executable: str, svg_data: bytes, export_format: str,
+                                  dpi: int, output_path: str) -> bytes:
+        """
+        Export SVG data with ``inkscape --pipe``, without temporary files.
+        
+        The SVG is written to Inkscape's stdin and the exported file is
+        read back from its stdout (``--export-filename=-``).
+        
+        Args:
+            executable: Inkscape executable path
+            svg_data: Serialized SVG document (UTF-8)
+            export_format: Export format (pdf, png, jpg, eps, etc.)
+            dpi: DPI for raster formats
+            output_path: Output file path (for error context)
+            
+        Returns:
+            Exported file content
+            
+        Raises:
+            ExportError: If Inkscape fails, times out or produces no output
+        """
+        cmd = [executable, '--pipe', f'--export-type={export_format}', '--export-filename=-']
+        if export_format in config.RASTER_FORMATS:
+            cmd.append(f'--export-dpi={dpi}')
+        
+        if self._log_debug:
+            self.logger.debug(f"Export command: {' '.join(cmd)}")
+        
+        exported_data = self._run_inkscape(cmd, export_format, output_path, input_data=svg_data)
+        if not exported_data:
+            error_msg = "Inkscape produced no output"
             if self.logger:
-                self.logger.error("Inkscape command interface not available")
-            raise ExportError("Inkscape command interface not available")
+                self.logger.error(error_msg)
+            raise ExportError(error_msg, export_format=export_format, output_path=output_path)
         
-        if self.logger:
-            self.logger.debug("Export command completed successfully")
+        return exported_data
+    
+    def _run_inkscape(self, cmd: List[str], export_format: str, output_path: str,
+                      input_data: Optional[bytes] = None) -> bytes:
+        """
+        Run one Inkscape export command.
         
-        return True
+        Unless input_data is given, stdout is discarded rather than buffered
+        through a pipe. The child gets its own session so it can be killed
+        cleanly on timeout, and stderr is captured for error reporting.
+        
+        Args:
+            cmd: Full Inkscape command line
+            export_format: Export format (for error context)
+            output_path: Output file path (for error context)
+            input_data: Data written to Inkscape's stdin (``--pipe`` mode);
+                        stdout is then captured and returned
+            
+        Returns:
+            Inkscape's stdout if input_data was given, else b''
+            
+        Raises:
+            ExportError: If Inkscape exits with an error or times out
+        """
+        try:
+            result = subprocess.run(
+                cmd,
+                input=input_data,
+                stdout=subprocess.DEVNULL if input_data is None else subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                start_new_session=True,
+                timeout=config.INKSCAPE_TIMEOUT,
+                check=True
+            )
+            return result.stdout or b''
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+            stderr = (e.stderr or b'')[-_STDERR_TAIL_SIZE:].decode('utf-8', errors='replace').strip()
+            if isinstance(e, subprocess.TimeoutExpired):
+                error_msg = f"Inkscape timed out after {config.INKSCAPE_TIMEOUT}s"
+            else:
+                error_msg = f"Inkscape exited with status {e.returncode}"
+            if stderr:
+                error_msg += f": {stderr}"
+            if self.logger:
+                self.logger.error(error_msg)
+            raise ExportError(error_msg, export_format=export_format, output_path=output_path) from e
     
     def _ensure_svg_encoding(self, svg_path: str, export_format: str) -> None:
         """
@@ -455,49 +1139,48 @@ class FileExporter:
         the SVG file has a proper XML declaration with UTF-8 encoding.
         Without this, text elements may be rendered incorrectly.
         
+        Files already checked by this exporter are skipped while their
+        modification time and size are unchanged, so templates exported
+        repeatedly in a batch are only read once.
+        
         Process:
-        1. Read SVG file content
-        2. Check if XML declaration with encoding exists
-        3. If not, add/fix XML declaration
-        4. Write back with proper encoding
+        1. Read the first bytes of the SVG file
+        2. Return if the XML declaration already has an encoding (common case)
+        3. Otherwise replace or insert the XML declaration and rewrite once
         
         Args:
             svg_path: Path to SVG file
             export_format: Export format (for logging only)
         """
-        if self.logger:
+        if self._log_info:
             self.logger.info(f"Checking SVG encoding for {export_format} export...")
         
         try:
-            # Read the SVG file
-            with open(svg_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            svg_key = self._svg_file_key(svg_path)
+            if svg_key in self._encoding_ok:
+                if self._log_debug:
+                    self.logger.debug("SVG encoding already verified, skipping check")
+                return
+            
+            with open(svg_path, 'rb') as f:
+                head = f.read(_SVG_HEAD_SIZE)
             
             # Check if content already has proper XML declaration with encoding
-            first_line = content.split('\n')[0] if '\n' in content else content
-            if content.startswith('<?xml') and 'encoding=' in first_line:
-                if self.logger:
+            if _has_encoding_declaration(head):
+                if self._log_debug:
                     self.logger.debug("SVG already has proper XML encoding declaration")
+                self._encoding_ok.add(svg_key)
                 return
             
-            # Add proper XML declaration with encoding
-            lines = content.split('\n')
-            if lines[0].startswith('<?xml'):
-                # Replace existing declaration without encoding
-                lines[0] = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
-                if self.logger:
-                    self.logger.debug("Replacing existing XML declaration with UTF-8 encoding")
-            else:
-                # Insert XML declaration at the beginning
-                lines.insert(0, '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>')
-                if self.logger:
-                    self.logger.debug("Adding XML declaration with UTF-8 encoding")
+            with open(svg_path, 'r+b') as f:
+                content = _with_utf8_declaration(f.read())
+                f.seek(0)
+                f.write(content)
+                f.truncate()
             
-            # Write back with proper encoding
-            with open(svg_path, 'w', encoding='utf-8', newline='') as f:
-                f.write('\n'.join(lines))
+            self._encoding_ok.add(self._svg_file_key(svg_path))
             
-            if self.logger:
+            if self._log_info:
                 self.logger.info(f"Added UTF-8 encoding declaration to SVG for {export_format} export")
         
         except Exception as e:
@@ -506,15 +1189,64 @@ class FileExporter:
                 self.logger.warning("Continuing anyway - Inkscape might still work")
             # Continue anyway - Inkscape might still work
     
+    def _prefetch_svg_encodings(self, svg_paths: List[str]) -> None:
+        """
+        Check the XML declarations of many SVG files concurrently.
+        
+        Header reads are small and independent, so they are issued from a
+        thread pool instead of one by one. Files that already declare an
+        encoding are recorded as verified, which turns the per-file
+        _ensure_svg_encoding() call into a single stat. Files that need a
+        rewrite (or cannot be read) are left for the per-file check.
+        
+        Args:
+            svg_paths: SVG files about to be exported
+        """
+        def check_header(svg_path: str) -> Optional[Tuple[str, int, int]]:
+            try:
+                svg_key = self._svg_file_key(svg_path)
+                with open(svg_path, 'rb') as f:
+                    head = f.read(_SVG_HEAD_SIZE)
+            except OSError:
+                return None
+            return svg_key if _has_encoding_declaration(head) else None
+        
+        unique_paths = [path for path in dict.fromkeys(svg_paths) if path]
+        if not unique_paths:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(_SVG_PREFETCH_WORKERS, len(unique_paths))) as executor:
+            verified = [key for key in executor.map(check_header, unique_paths) if key is not None]
+        self._encoding_ok.update(verified)
+        
+        if self._log_debug:
+            self.logger.debug(f"Prefetched SVG headers: {len(verified)}/{len(unique_paths)} already declare an encoding")
+    
+    @staticmethod
+    def _svg_file_key(svg_path: str) -> Tuple[str, int, int]:
+        """
+        Build a key identifying the current contents of a file.
+        
+        Args:
+            svg_path: Path to SVG file
+            
+        Returns:
+            Tuple of (absolute path, modification time in ns, size in bytes)
+        """
+        stat_result = os.stat(svg_path)
+        return os.path.abspath(svg_path), stat_result.st_mtime_ns, stat_result.st_size
+    
     def batch_export(self, input_svg_paths: List[str], output_dir: str,
                     export_format: str, dpi: int = config.DEFAULT_DPI,
                     filename_pattern: str = "output_{}",
-                    overwrite: bool = True) -> List[str]:
+                    overwrite: bool = True, max_workers: Optional[int] = None) -> List[str]:
         """
         Export multiple SVG files.
         
         This method processes a list of SVG files, exporting each one
-        with an incrementing filename based on the pattern.
+        with an incrementing filename based on the pattern. Non-SVG
+        formats are split across up to ``max_workers`` concurrent Inkscape
+        shell processes; files they fail to produce are retried individually.
         
         Args:
             input_svg_paths: List of input SVG paths
@@ -523,6 +1255,7 @@ class FileExporter:
             dpi: DPI for raster formats
             filename_pattern: Filename pattern with {} placeholder
             overwrite: Whether to overwrite existing files
+            max_workers: Maximum concurrent Inkscape processes (default: CPU count)
             
         Returns:
             List of successfully exported file paths
@@ -533,7 +1266,7 @@ class FileExporter:
             >>> exported = exporter.batch_export(files, '/output', 'png', dpi=300)
             ['/output/doc1.png', '/output/doc2.png', '/output/doc3.png']
         """
-        if self.logger:
+        if self._log_info:
             self.logger.info("=" * 60)
             self.logger.info("BATCH EXPORT OPERATION")
             self.logger.info("=" * 60)
@@ -543,21 +1276,73 @@ class FileExporter:
             self.logger.info(f"Filename pattern: {filename_pattern}")
         
         exported_files = []
+        shell_jobs = []
+        
+        # Non-SVG exports share one Inkscape shell process when the
+        # executable is available; otherwise each file is exported directly
+        executable = self._inkscape_executable()
+        use_shell = export_format != 'svg' and executable is not None
+        
+        if use_shell and export_format in config.RASTER_FORMATS:
+            self._prefetch_svg_encodings(input_svg_paths)
+        
+        # When existing outputs are kept, one directory listing replaces a
+        # stat per output (names with subdirectories still go through
+        # the per-file check)
+        existing_names: Set[str] = set()
+        if not overwrite:
+            try:
+                with os.scandir(output_dir) as entries:
+                    existing_names = {entry.name for entry in entries}
+            except OSError:
+                pass
+        
+        # A pattern with a single bare "{}" is assembled from its two halves
+        # instead of going through str.format for every file
+        name_parts = None
+        if filename_pattern.count('{') == 1 and filename_pattern.count('}') == 1:
+            prefix, placeholder, suffix = filename_pattern.partition('{}')
+            if placeholder:
+                name_parts = (prefix, f"{suffix}.{export_format}")
+        
+        # Hoisted out of the per-file loop
+        join_path = os.path.join
+        file_count = len(input_svg_paths)
+        log_debug = self._log_debug
+        log_info = self._log_info
+        is_raster = export_format in config.RASTER_FORMATS
         
         for idx, input_path in enumerate(input_svg_paths):
-            if self.logger:
-                self.logger.debug(f"Processing file {idx + 1}/{len(input_svg_paths)}: {input_path}")
+            if log_debug:
+                self.logger.debug(f"Processing file {idx + 1}/{file_count}: {input_path}")
             
             try:
-                filename = filename_pattern.format(idx + 1)
-                output_path = os.path.join(output_dir, f"{filename}.{export_format}")
+                if name_parts is not None:
+                    output_name = f"{name_parts[0]}{idx + 1}{name_parts[1]}"
+                else:
+                    output_name = f"{filename_pattern.format(idx + 1)}.{export_format}"
+                output_path = join_path(output_dir, output_name)
                 
-                if self.logger:
+                if output_name in existing_names:
+                    if self.logger:
+                        self.logger.warning(f"Skipped (overwrite disabled): {output_path}")
+                    continue
+                
+                if log_info:
                     self.logger.info(f"Exporting to: {output_path}")
                 
+                if use_shell:
+                    if self._prepare_export(input_path, output_path, export_format, dpi, overwrite):
+                        if is_raster:
+                            self._ensure_svg_encoding(input_path, export_format)
+                        shell_jobs.append((idx, input_path, output_path))
+                    elif self.logger:
+                        self.logger.warning(f"Skipped (overwrite disabled): {output_path}")
+                    continue
+                
                 if self.export_file(input_path, output_path, export_format, dpi, overwrite):
-                    exported_files.append(output_path)
-                    if self.logger:
+                    exported_files.append((idx, output_path))
+                    if log_info:
                         self.logger.info(f"Successfully exported: {output_path}")
                 else:
                     if self.logger:
@@ -567,7 +1352,42 @@ class FileExporter:
                 if self.logger:
                     self.logger.error(f"Failed to export {input_path}: {e}")
         
-        if self.logger:
+        if shell_jobs:
+            # Each Inkscape process renders on its own core; threads only
+            # wait on the subprocesses, so they are enough to drive them
+            worker_count = max(1, min(max_workers or os.cpu_count() or 1, len(shell_jobs)))
+            job_groups = [shell_jobs[offset::worker_count] for offset in range(worker_count)]
+            
+            if self._log_info:
+                self.logger.info(f"Running {worker_count} Inkscape shell process(es)")
+            
+            with ThreadPoolExecutor(max_workers=worker_count) as executor:
+                failed_jobs = set().union(*executor.map(
+                    lambda group: self._batch_export_via_inkscape_shell(executable, group, export_format, dpi),
+                    job_groups
+                ))
+            
+            for idx, input_path, output_path in shell_jobs:
+                if idx not in failed_jobs:
+                    exported_files.append((idx, output_path))
+                    if self._log_info:
+                        self.logger.info(f"Successfully exported: {output_path}")
+                    continue
+                
+                # Retry only the failed jobs through the per-file path
+                try:
+                    if self.logger:
+                        self.logger.warning(f"Shell export failed, retrying individually: {input_path}")
+                    self._export_via_inkscape(input_path, output_path, export_format, dpi)
+                    exported_files.append((idx, output_path))
+                except Exception as e:
+                    if self.logger:
+                        self.logger.error(f"Failed to export {input_path}: {e}")
+        
+        # Keep results in input order regardless of which path exported them
+        exported_files = [output_path for _, output_path in sorted(exported_files)]
+        
+        if self._log_info:
             self.logger.info("=" * 60)
             self.logger.info(f"BATCH EXPORT SUMMARY")
             self.logger.info("=" * 60)
@@ -577,6 +1397,98 @@ class FileExporter:
         
         return exported_files
 
+    def _batch_export_via_inkscape_shell(self, executable: str, jobs: List[Tuple[int, str, str]],
+                                         export_format: str, dpi: int) -> Set[int]:
+        """
+        Export several SVG files through a single Inkscape shell process.
+        
+        Starting Inkscape dominates the cost of small exports, so all jobs
+        are written as action lines to one ``inkscape --shell`` process:
+        
+            file-open:in.svg; export-filename:out.png; export-type:png; export-dpi:300; export-do; file-close
+        
+        Inkscape does not report per-action results in shell mode, so each
+        job is checked afterwards by whether its output file was written.
+        
+        Args:
+            executable: Inkscape executable path, as resolved for single exports
+            jobs: (index, input_svg_path, output_path) tuples, already validated
+            export_format: Export format (pdf, png, jpg, eps, etc.)
+            dpi: DPI for raster formats
+            
+        Returns:
+            Set of job indices whose output was not produced
+        """
+        failed_jobs = set()
+        previous_signatures = {}
+        commands = []
+        
+        for idx, input_path, output_path in jobs:
+            # ';' separates actions and a newline ends the command line
+            if any(char in path for path in (input_path, output_path) for char in ';\r\n'):
+                failed_jobs.add(idx)
+                continue
+            
+            previous_signatures[idx] = _output_signature(output_path)
+            
+            actions = [
+                f"file-open:{input_path}",
+                f"export-filename:{output_path}",
+                f"export-type:{export_format}",
+            ]
+            if export_format in config.RASTER_FORMATS:
+                actions.append(f"export-dpi:{dpi}")
+            actions += ["export-do", "file-close"]
+            commands.append("; ".join(actions))
+        
+        if not commands:
+            return failed_jobs
+        
+        if self._log_info:
+            self.logger.info(f"Exporting {len(commands)} files via Inkscape shell mode...")
+        
+        try:
+            # Results are checked through the output files, so Inkscape's
+            # chatter is discarded instead of being buffered and decoded
+            subprocess.run(
+                [executable, '--shell'],
+                input=("\n".join(commands) + "\nquit\n").encode('utf-8'),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=config.INKSCAPE_SHELL_TIMEOUT
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            if self.logger:
+                self.logger.warning(f"Inkscape shell mode failed: {type(e).__name__}: {e}")
+            return {idx for idx, _, _ in jobs}
+        
+        for idx, _, output_path in jobs:
+            if idx in failed_jobs:
+                continue
+            signature = _output_signature(output_path)
+            if signature is None or signature == previous_signatures[idx]:
+                failed_jobs.add(idx)
+        
+        if self._log_info:
+            self.logger.info(f"Inkscape shell exported {len(jobs) - len(failed_jobs)}/{len(jobs)} files")
+        
+        return failed_jobs
+
+
+def _merge_pdf_chunk(pdf_files: List[str], output_path: str, preserve_bookmarks: bool) -> bool:
+    """
+    Merge one chunk of PDFs (worker for PDFMerger._try_chunked_merge).
+    
+    Args:
+        pdf_files: PDF files in this chunk
+        output_path: Intermediate output path
+        preserve_bookmarks: Whether to import each input's outline
+        
+    Returns:
+        True if the chunk was merged
+    """
+    return PDFMerger()._try_pypdf2_merge(pdf_files, output_path, preserve_bookmarks)
+
 
 class PDFMerger:
     """
@@ -587,11 +1499,14 @@ class PDFMerger:
     across different environments.
     
     Merge Strategy:
+        0. For 3+ files, qpdf or pdftk when installed (fastest)
+           then pikepdf when installed (unless bookmarks are kept)
         1. Try PyPDF2 (pure Python library)
            - Pros: No external dependencies
            - Cons: May have issues with some PDF features
-        2. Fallback to pdfunite (command-line tool)
-           - Pros: More robust PDF handling
+        2. Fallback to qpdf (if not tried in step 0), then pdfunite
+           (command-line tools)
+           - Pros: More robust PDF handling; qpdf merges in one streaming pass
            - Cons: Requires external installation
         
     Special Cases:
@@ -616,25 +1531,31 @@ class PDFMerger:
             logger: Optional logging instance for debug output
         """
         self.logger = logger
+        # Level checks are done once; disabled levels then skip building messages
+        self._log_info = bool(logger) and logger.isEnabledFor(logging.INFO)
+        self._log_debug = bool(logger) and logger.isEnabledFor(logging.DEBUG)
         
-        if self.logger:
+        if self._log_info:
             self.logger.info("PDFMerger initialized")
     
     @timed(operation="file_exporter.merge_pdfs")
-    def merge_pdfs(self, pdf_files: List[str], output_path: str) -> bool:
+    def merge_pdfs(self, pdf_files: List[str], output_path: str, preserve_bookmarks: bool = False) -> bool:
         """
         Merge multiple PDF files into one.
         
         This is the main merge method that orchestrates:
         1. PDF count validation
-        2. Single PDF special case (just copy)
-        3. PyPDF2 merge attempt
-        4. pdfunite merge attempt (fallback)
+        2. Single PDF special case (reflink/copy)
+        3. qpdf/pdftk, pikepdf and PyPDF2 merge attempts
+        4. qpdf/pdfunite merge attempts (fallback)
         5. Error handling if all attempts fail
         
         Args:
             pdf_files: List of PDF file paths to merge
             output_path: Output path for merged PDF
+            preserve_bookmarks: Copy each input's outline (bookmarks) when
+                                merging with PyPDF2; skipped by default as
+                                generated PDFs rarely have one
             
         Returns:
             True if merge successful
@@ -647,7 +1568,7 @@ class PDFMerger:
             >>> merger.merge_pdfs(['doc1.pdf', 'doc2.pdf', 'doc3.pdf'], 'merged_output.pdf')
             True
         """
-        if self.logger:
+        if self._log_info:
             self.logger.info("=" * 60)
             self.logger.info("PDF MERGE OPERATION")
             self.logger.info("=" * 60)
@@ -662,23 +1583,35 @@ class PDFMerger:
         
         if len(pdf_files) == 1:
             # Only one file, just copy it
-            if self.logger:
-                self.logger.info("Only one PDF file, performing copy instead of merge")
-            shutil.copy2(pdf_files[0], output_path)
-            if self.logger:
-                self.logger.info(f"Copied single PDF to: {output_path}")
-            return True
+            if self._copy_single_pdf(pdf_files[0], output_path):
+                return True
+            raise ExportError(config.ERROR_MESSAGES["pdf_merge_failed"].format(error="Could not copy single PDF"))
         
-        if self.logger:
+        if self._log_debug:
             self.logger.debug(f"Processing {len(pdf_files)} PDF files for merge")
             for idx, pdf in enumerate(pdf_files):
                 self.logger.debug(f"  PDF {idx + 1}: {pdf}")
         
-        # Try PyPDF2 first
-        if self._try_pypdf2_merge(pdf_files, output_path):
+        # Prefer native tools for larger merges
+        native_tried = len(pdf_files) >= config.NATIVE_PDF_MERGE_MIN_FILES
+        if native_tried and self._try_native_merge(pdf_files, output_path):
+            return True
+        
+        # Then pikepdf, which copies pages without re-serializing them in
+        # Python; it does not carry bookmarks over
+        if not preserve_bookmarks and self._try_pikepdf_merge(pdf_files, output_path):
             return True
         
-        # Fallback to pdfunite
+        # Try PyPDF2 next; very large merges are done in chunks
+        if len(pdf_files) > config.PDF_MERGE_CHUNK_THRESHOLD:
+            if self._try_chunked_merge(pdf_files, output_path, preserve_bookmarks):
+                return True
+        elif self._try_pypdf2_merge(pdf_files, output_path, preserve_bookmarks):
+            return True
+        
+        # Fallback to qpdf (unless already tried), then pdfunite
+        if not native_tried and self._try_qpdf_merge(pdf_files, output_path):
+            return True
         if self._try_pdfunite_merge(pdf_files, output_path):
             return True
         
@@ -690,7 +1623,100 @@ class PDFMerger:
         
         raise ExportError(error_msg)
     
-    def _try_pypdf2_merge(self, pdf_files: List[str], output_path: str) -> bool:
+    def _copy_single_pdf(self, pdf_file: str, output_path: str) -> bool:
+        """
+        Produce the "merge" of a single PDF by copying it.
+        
+        Used by merge_pdfs() and by every merge strategy, so a one-file
+        list never goes through PDF parsing or an external tool. The output
+        is an independent copy (reflink or in-kernel copy), just as a real
+        merge would be.
+        
+        Args:
+            pdf_file: The only input PDF
+            output_path: Output path
+            
+        Returns:
+            True if successful, False if the copy failed
+        """
+        if self._log_info:
+            self.logger.info("Only one PDF file, performing copy instead of merge")
+        
+        try:
+            _fast_copy(pdf_file, output_path)
+        except OSError as e:
+            if self.logger:
+                self.logger.error(f"Failed to copy single PDF: {e}")
+            return False
+        
+        if self._log_info:
+            self.logger.info(f"Copied single PDF to: {output_path}")
+        return True
+    
+    def _try_pikepdf_merge(self, pdf_files: List[str], output_path: str) -> bool:
+        """
+        Try merging using pikepdf.
+        
+        pikepdf wraps the qpdf C++ library. Pages are appended to a new
+        document's page tree and shared resources are copied once, so this
+        is much faster and lighter on memory than PyPDF2's object rebuild.
+        
+        Args:
+            pdf_files: List of PDF files
+            output_path: Output path
+            
+        Returns:
+            True if successful, False if pikepdf not available or merge failed
+        """
+        if len(pdf_files) == 1:
+            return self._copy_single_pdf(pdf_files[0], output_path)
+        
+        if pikepdf is None:
+            if self._log_debug:
+                self.logger.debug("pikepdf not available")
+            return False
+        
+        temp_path = _temp_output_path(output_path)
+        try:
+            if self._log_info:
+                self.logger.info("Attempting to merge PDF files using pikepdf...")
+            
+            with contextlib.ExitStack() as stack:
+                merged = stack.enter_context(pikepdf.Pdf.new())
+                for pdf_file in pdf_files:
+                    source = stack.enter_context(pikepdf.Pdf.open(pdf_file))
+                    merged.pages.extend(source.pages)
+                
+                merged.save(temp_path, linearize=False,
+                            object_stream_mode=pikepdf.ObjectStreamMode.generate)
+            
+            # Verify output file was created (one stat gives existence and
+            # size), then move it into place
+            try:
+                file_size = os.stat(temp_path).st_size
+            except FileNotFoundError:
+                if self.logger:
+                    self.logger.error("pikepdf merge completed but output file not found")
+                return False
+            
+            os.replace(temp_path, output_path)
+            if self._log_info:
+                self.logger.info("PDF merge completed using pikepdf")
+                self.logger.info(f"Merged PDF created: {output_path}")
+                self.logger.info(f"File size: {file_size} bytes")
+            return True
+        
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"pikepdf merge failed: {type(e).__name__}")
+                self.logger.error(f"Error details: {e}")
+            return False
+        
+        finally:
+            _discard_temp_output(temp_path)
+    
+    def _try_pypdf2_merge(self, pdf_files: List[str], output_path: str,
+                          preserve_bookmarks: bool = False) -> bool:
         """
         Try merging using PyPDF2.
         
@@ -698,67 +1724,136 @@ class PDFMerger:
         It's the preferred method as it doesn't require external tools.
         
         Process:
-        1. Import PyPDF2
-        2. Create PdfMerger instance
-        3. Append each PDF file
-        4. Write merged output
-        5. Close merger
+        1. Return early if neither pypdf nor PyPDF2 was importable
+        2. Open each PDF once and PdfWriter.append() it (outline only if requested)
+        3. Deduplicate identical objects (shared fonts/images, pypdf >= 4)
+        4. Write merged output once to a temp file, then close the writer and the inputs
+        5. Atomically replace output_path with the temp file
         
         Args:
             pdf_files: List of PDF files
             output_path: Output path
+            preserve_bookmarks: Whether to import each input's outline
             
         Returns:
             True if successful, False if PyPDF2 not available or merge failed
         """
-        try:
-            from PyPDF2 import PdfMerger
-            
+        if len(pdf_files) == 1:
+            return self._copy_single_pdf(pdf_files[0], output_path)
+        
+        if PdfWriter is None:
             if self.logger:
+                self.logger.warning("pypdf/PyPDF2 not available (pip install pypdf)")
+            return False
+        
+        temp_path = _temp_output_path(output_path)
+        try:
+            if self._log_info:
                 self.logger.info("Attempting to merge PDF files using PyPDF2...")
             
-            merger = PdfMerger()
+            writer = PdfWriter()
             
-            for idx, pdf in enumerate(pdf_files):
-                if self.logger:
-                    self.logger.debug(f"Adding to merge ({idx + 1}/{len(pdf_files)}): {pdf}")
+            # Pages reference their source streams until the output is
+            # written, so every input stays open until then
+            with contextlib.ExitStack() as open_files:
+                for idx, pdf in enumerate(pdf_files):
+                    if self._log_debug:
+                        self.logger.debug(f"Adding to merge ({idx + 1}/{len(pdf_files)}): {pdf}")
+                    
+                    # Verify PDF file exists before adding
+                    if not os.path.exists(pdf):
+                        if self.logger:
+                            self.logger.warning(f"PDF file does not exist, skipping: {pdf}")
+                        continue
+                    
+                    pdf_file = open_files.enter_context(open(pdf, 'rb'))
+                    writer.append(pdf_file, import_outline=preserve_bookmarks)
                 
-                # Verify PDF file exists before adding
-                if not os.path.exists(pdf):
-                    if self.logger:
-                        self.logger.warning(f"PDF file does not exist, skipping: {pdf}")
-                    continue
+                # PDFs rendered from one template repeat the same fonts and
+                # images; store each identical object only once
+                if hasattr(writer, 'compress_identical_objects'):
+                    writer.compress_identical_objects()
                 
-                merger.append(pdf)
-            
-            if self.logger:
-                self.logger.info("Writing merged PDF...")
-            
-            merger.write(output_path)
-            merger.close()
+                if self._log_info:
+                    self.logger.info("Writing merged PDF...")
+                
+                writer.write(temp_path)
+                writer.close()
             
-            # Verify output file was created
-            if os.path.exists(output_path):
-                file_size = os.path.getsize(output_path)
-                if self.logger:
-                    self.logger.info("PDF merge completed using PyPDF2")
-                    self.logger.info(f"Merged PDF created: {output_path}")
-                    self.logger.info(f"File size: {file_size} bytes")
-                return True
-            else:
+            # Verify output file was created (one stat gives existence and
+            # size), then move it into place
+            try:
+                file_size = os.stat(temp_path).st_size
+            except FileNotFoundError:
                 if self.logger:
                     self.logger.error("PyPDF2 merge completed but output file not found")
                 return False
+            
+            os.replace(temp_path, output_path)
+            if self._log_info:
+                self.logger.info("PDF merge completed using PyPDF2")
+                self.logger.info(f"Merged PDF created: {output_path}")
+                self.logger.info(f"File size: {file_size} bytes")
+            return True
         
-        except ImportError:
+        except Exception as e:
             if self.logger:
-                self.logger.warning("PyPDF2 not available (pip install PyPDF2)")
+                self.logger.error(f"PyPDF2 merge failed: {type(e).__name__}")
+                self.logger.error(f"Error details: {e}")
             return False
         
+        finally:
+            _discard_temp_output(temp_path)
+    
+    def _try_chunked_merge(self, pdf_files: List[str], output_path: str,
+                           preserve_bookmarks: bool = False) -> bool:
+        """
+        Merge a very large list of PDFs hierarchically.
+        
+        PyPDF2 slows down sharply as one writer accumulates pages, so the
+        inputs are merged in chunks of PDF_MERGE_CHUNK_SIZE files in
+        parallel worker processes. The intermediate PDFs are then merged
+        with PyPDF2 as well; merge_pdfs() only gets here after qpdf/pdftk
+        were unavailable or failed on the inputs.
+        
+        Args:
+            pdf_files: List of PDF files
+            output_path: Output path
+            preserve_bookmarks: Whether to import each input's outline
+            
+        Returns:
+            True if successful, False if PyPDF2 not available or merge failed
+        """
+        if PdfWriter is None:
+            return self._try_pypdf2_merge(pdf_files, output_path, preserve_bookmarks)
+        
+        chunk_size = config.PDF_MERGE_CHUNK_SIZE
+        chunks = [pdf_files[start:start + chunk_size] for start in range(0, len(pdf_files), chunk_size)]
+        
+        if self._log_info:
+            self.logger.info(f"Merging {len(pdf_files)} PDFs in {len(chunks)} chunks...")
+        
+        try:
+            with TempFileManager(self.logger) as temp_manager:
+                temp_dir = temp_manager.create_temp_dir()
+                chunk_outputs = [os.path.join(temp_dir, f"chunk_{idx:04d}.pdf") for idx in range(len(chunks))]
+                
+                with ProcessPoolExecutor() as executor:
+                    results = list(executor.map(
+                        _merge_pdf_chunk, chunks, chunk_outputs, itertools.repeat(preserve_bookmarks)
+                    ))
+                
+                if not all(results):
+                    if self.logger:
+                        self.logger.error("Chunked PDF merge failed: a chunk could not be merged")
+                    return False
+                
+                return self._try_pypdf2_merge(chunk_outputs, output_path, preserve_bookmarks)
+        
         except Exception as e:
+            # Let merge_pdfs() move on to the command-line tools
             if self.logger:
-                self.logger.error(f"PyPDF2 merge failed: {type(e).__name__}")
-                self.logger.error(f"Error details: {e}")
+                self.logger.error(f"Chunked PDF merge failed: {type(e).__name__}: {e}")
             return False
     
     def _try_pdfunite_merge(self, pdf_files: List[str], output_path: str) -> bool:
@@ -768,11 +1863,6 @@ class PDFMerger:
         pdfunite is a command-line tool for PDF manipulation.
         It's used as a fallback when PyPDF2 is not available.
         
-        Process:
-        1. Build command with input files and output
-        2. Execute via subprocess
-        3. Verify output file was created
-        
         Args:
             pdf_files: List of PDF files
             output_path: Output path
@@ -780,37 +1870,139 @@ class PDFMerger:
         Returns:
             True if successful, False if pdfunite not available or merge failed
         """
+        if len(pdf_files) == 1:
+            return self._copy_single_pdf(pdf_files[0], output_path)
+        
+        # Build command: pdfunite input1.pdf input2.pdf ... output.pdf
+        return self._run_merge_command('pdfunite', _PDFUNITE, lambda target: pdf_files + [target], output_path)
+    
+    def _try_native_merge(self, pdf_files: List[str], output_path: str) -> bool:
+        """
+        Try merging with a native merge tool (qpdf, then pdftk).
+        
+        Both tools copy page objects without re-serializing them in Python
+        and are much faster than PyPDF2 on larger merges.
+        
+        Args:
+            pdf_files: List of PDF files
+            output_path: Output path
+            
+        Returns:
+            True if successful, False if neither tool is installed or both failed
+        """
+        if self._try_qpdf_merge(pdf_files, output_path):
+            return True
+        
+        # pdftk input1.pdf input2.pdf ... cat output output.pdf
+        return self._run_merge_command('pdftk', _PDFTK, lambda target: pdf_files + ['cat', 'output', target],
+                                       output_path)
+    
+    def _try_qpdf_merge(self, pdf_files: List[str], output_path: str) -> bool:
+        """
+        Try merging using qpdf.
+        
+        ``qpdf --empty --pages ... --`` copies page objects in a single
+        streaming pass and writes one new cross-reference table, while
+        pdfunite and PyPDF2 rebuild every input's objects first. It is
+        therefore preferred over both whenever it is installed.
+        
+        File lists longer than PDF_MERGE_ARGFILE_THRESHOLD characters are
+        passed in an ``@file`` instead of on the command line.
+        
+        Args:
+            pdf_files: List of PDF files
+            output_path: Output path
+            
+        Returns:
+            True if successful, False if qpdf is not installed or failed
+        """
+        if len(pdf_files) == 1:
+            return self._copy_single_pdf(pdf_files[0], output_path)
+        
+        # qpdf --empty --pages input1.pdf input2.pdf ... -- output.pdf
+        def build_args(target: str) -> List[str]:
+            return ['--empty', '--pages'] + pdf_files + ['--', target]
+        
+        # Very long file lists would exceed the OS argument size limit
+        # (E2BIG); qpdf then reads its arguments from a file, one per line
+        if (_QPDF is not None and sum(map(len, pdf_files)) > config.PDF_MERGE_ARGFILE_THRESHOLD
+                and not any('\n' in pdf_file or '\r' in pdf_file for pdf_file in pdf_files)):
+            with TempFileManager(self.logger) as temp_manager:
+                arg_file = temp_manager.create_temp_file('.args', prefix='qpdf_')
+                
+                def build_argfile_args(target: str) -> List[str]:
+                    with open(arg_file, 'w', encoding='utf-8') as f:
+                        f.write('\n'.join(build_args(target)) + '\n')
+                    return [f'@{arg_file}']
+                
+                return self._run_merge_command('qpdf', _QPDF, build_argfile_args, output_path)
+        
+        return self._run_merge_command('qpdf', _QPDF, build_args, output_path)
+    
+    def _run_merge_command(self, tool_name: str, executable: Optional[str],
+                           build_args: Callable[[str], List[str]], output_path: str) -> bool:
+        """
+        Run an external PDF merge command.
+        
+        Process:
+        1. Skip if the tool was not found on PATH at import time
+        2. Execute via subprocess, writing to a temp file next to output_path
+        3. Atomically move the temp file into place (fails if it is missing)
+        
+        Args:
+            tool_name: Tool name used in log messages
+            executable: Resolved executable path, or None if not installed
+            build_args: Returns the command arguments (after the executable)
+                        for a given output file
+            output_path: Output path
+            
+        Returns:
+            True if successful, False if the tool is not available or merge failed
+        """
+        if executable is None:
+            if self._log_debug:
+                self.logger.debug(f"{tool_name} not found on PATH")
+            return False
+        
+        temp_path = _temp_output_path(output_path)
         try:
-            if self.logger:
-                self.logger.info("Attempting to merge PDF files using pdfunite...")
+            if self._log_info:
+                self.logger.info(f"Attempting to merge PDF files using {tool_name}...")
             
-            # Build command: pdfunite input1.pdf input2.pdf ... output.pdf
-            cmd = ['pdfunite'] + pdf_files + [output_path]
+            cmd = [executable] + build_args(temp_path)
             
-            if self.logger:
+            if self._log_debug:
                 self.logger.debug(f"Running: {' '.join(cmd)}")
             
-            # Execute command
-            subprocess.run(cmd, check=True, capture_output=True, text=True)
+            # Execute command; only stderr is kept, and only decoded on failure.
+            # With an absolute executable and close_fds=False, CPython starts
+            # the tool with posix_spawn instead of fork+exec, which does not
+            # copy this process's page tables. Descriptors Python opens are
+            # non-inheritable (PEP 446), so none leak into the tool.
+            subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, close_fds=False)
             
-            # Verify output file was created
-            if os.path.exists(output_path):
-                file_size = os.path.getsize(output_path)
-                if self.logger:
-                    self.logger.info("PDF merge completed using pdfunite")
-                    self.logger.info(f"Merged PDF created: {output_path}")
-                    self.logger.info(f"File size: {file_size} bytes")
-                return True
-            else:
-                if self.logger:
-                    self.logger.error("pdfunite merge completed but output file not found")
-                return False
+            # A failed run already raised (check=True), and os.replace fails
+            # if the tool wrote nothing, so the output needs no stat unless
+            # its size is logged
+            os.replace(temp_path, output_path)
+            if self._log_info:
+                self.logger.info(f"PDF merge completed using {tool_name}")
+                self.logger.info(f"Merged PDF created: {output_path}")
+                self.logger.info(f"File size: {os.stat(output_path).st_size} bytes")
+            return True
         
-        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        except (subprocess.CalledProcessError, OSError) as e:
             if self.logger:
-                self.logger.error(f"pdfunite merge failed: {type(e).__name__}")
+                self.logger.error(f"{tool_name} merge failed: {type(e).__name__}")
                 self.logger.error(f"Error details: {e}")
+                stderr = getattr(e, 'stderr', None)
+                if stderr:
+                    stderr = stderr[-_STDERR_TAIL_SIZE:].decode('utf-8', errors='replace').strip()
+                    self.logger.error(f"{tool_name} output: {stderr}")
             return False
+        
+        finally:
+            _discard_temp_output(temp_path)
 
 
 class TempFileManager:
@@ -825,10 +2017,12 @@ class TempFileManager:
     - Automatic cleanup on context exit
     - Tracking of temp files and directories
     - Customizable file prefixes and suffixes
+    - Optional background cleanup on context exit
     - Error handling during cleanup
     
     Attributes:
         logger: Optional logging instance for debug output
+        async_cleanup: If True, context exit hands cleanup to a background thread
         temp_dirs: List of created temporary directories
         temp_files: List of created temporary files
     
@@ -839,20 +2033,45 @@ class TempFileManager:
         ...     # Auto-cleanup on exit
     """
     
-    def __init__(self, logger: Optional[Any] = None):
+    # Shared by all managers using async_cleanup; created on the first
+    # background cleanup and waited for at interpreter exit
+    _cleanup_pool: Optional[ThreadPoolExecutor] = None
+    _cleanup_pool_lock = threading.Lock()
+    
+    def __init__(self, logger: Optional[Any] = None, async_cleanup: bool = False):
         """
         Initialize TempFileManager with optional logger.
         
         Args:
             logger: Optional logging instance for debug output
+            async_cleanup: If True, leaving the 'with' block schedules
+                           cleanup() on a background thread and returns
+                           immediately; pending cleanups finish before the
+                           interpreter exits
         """
         self.logger = logger
-        self.temp_dirs: List[str] = []
-        self.temp_files: List[str] = []
+        # Level checks are done once; disabled levels then skip building messages
+        self._log_info = bool(logger) and logger.isEnabledFor(logging.INFO)
+        self._log_debug = bool(logger) and logger.isEnabledFor(logging.DEBUG)
+        self.async_cleanup = async_cleanup
+        self._reset_tracking()
         
-        if self.logger:
+        if self._log_info:
             self.logger.info("TempFileManager initialized")
     
+    def _reset_tracking(self) -> None:
+        """Start with no tracked temporary files or directories."""
+        self.temp_dirs: List[str] = []
+        self.temp_files: List[str] = []
+        # temp_files split once at creation: (index into _temp_file_dirs,
+        # basename), with each containing directory stored once
+        self._temp_file_dirs: List[str] = []
+        self._temp_dir_index: Dict[str, int] = {}
+        self._temp_file_names: List[Tuple[int, str]] = []
+        # Private directory holding the named temp files, created on first use
+        self._pool_dir: Optional[str] = None
+        self._name_counter = itertools.count()
+    
     def create_temp_dir(self) -> str:
         """
         Create a temporary directory.
@@ -871,7 +2090,7 @@ class TempFileManager:
         temp_dir = tempfile.mkdtemp()
         self.temp_dirs.append(temp_dir)
         
-        if self.logger:
+        if self._log_info:
             self.logger.info(f"Created temporary directory: {temp_dir}")
         
         return temp_dir
@@ -882,7 +2101,9 @@ class TempFileManager:
         
         Creates a temporary file with specified suffix and prefix.
         The file is created but not deleted, allowing it to be used
-        and then cleaned up later.
+        and then cleaned up later. Files are numbered inside one private
+        directory per manager (created on first use), which cleanup()
+        removes together with them.
         
         Args:
             suffix: File suffix/extension (e.g., '.svg', '.tmp')
@@ -894,19 +2115,34 @@ class TempFileManager:
         Examples:
             >>> temp_mgr = TempFileManager()
             >>> temp_file = temp_mgr.create_temp_file('.svg')
-            '/tmp/inkautogen_XXXXXX.svg'
+            '/tmp/inkautogen_XXXXXX/inkautogen_0.svg'
         """
-        temp_file = tempfile.NamedTemporaryFile(
-            suffix=suffix, prefix=prefix, delete=False
-        )
-        temp_file.close()
-        
-        self.temp_files.append(temp_file.name)
-        
-        if self.logger:
-            self.logger.info(f"Created temporary file: {temp_file.name}")
-        
-        return temp_file.name
+        # Files are numbered inside one private directory, so no random
+        # names or retries are needed
+        if self._pool_dir is None:
+            self._pool_dir = tempfile.mkdtemp(prefix="inkautogen_")
+            self.temp_dirs.append(self._pool_dir)
+        
+        while True:
+            name = f"{prefix}{next(self._name_counter)}{suffix}"
+            temp_path = os.path.join(self._pool_dir, name)
+            try:
+                os.close(os.open(temp_path, _TEMP_FILE_FLAGS, 0o600))
+                break
+            except FileExistsError:
+                continue
+        
+        self.temp_files.append(temp_path)
+        dir_idx = self._temp_dir_index.get(self._pool_dir)
+        if dir_idx is None:
+            dir_idx = self._temp_dir_index[self._pool_dir] = len(self._temp_file_dirs)
+            self._temp_file_dirs.append(self._pool_dir)
+        self._temp_file_names.append((dir_idx, name))
+        
+        if self._log_info:
+            self.logger.info(f"Created temporary file: {temp_path}")
+        
+        return temp_path
     
     def cleanup(self) -> None:
         """
@@ -924,48 +2160,114 @@ class TempFileManager:
         Errors during cleanup are logged but don't raise exceptions,
         ensuring cleanup doesn't break the application.
         """
-        if self.logger:
+        if self._log_info:
             self.logger.info("=" * 60)
             self.logger.info("CLEANUP OPERATION")
             self.logger.info("=" * 60)
         
-        # Clean up temporary files
-        for temp_file in self.temp_files:
-            try:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-                    if self.logger:
-                        self.logger.debug(f"Removed temporary file: {temp_file}")
-            except Exception as e:
-                if self.logger:
-                    self.logger.warning(f"Failed to remove temporary file {temp_file}: {e}")
+        # Clean up temporary files, unlinking relative to one descriptor per
+        # directory so each removal skips the full path walk
+        dir_fds: List[Optional[int]] = [None] * len(self._temp_file_dirs)
+        try:
+            if _UNLINK_DIR_FD:
+                for dir_idx, directory in enumerate(self._temp_file_dirs):
+                    with contextlib.suppress(OSError):
+                        dir_fds[dir_idx] = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            self._for_each(lambda entry: self._remove_temp_file(entry, dir_fds), self._temp_file_names)
+        finally:
+            for dir_fd in dir_fds:
+                if dir_fd is not None:
+                    os.close(dir_fd)
         
         # Clean up temporary directories
-        for temp_dir in self.temp_dirs:
-            try:
-                if os.path.exists(temp_dir):
-                    shutil.rmtree(temp_dir)
-                    if self.logger:
-                        self.logger.debug(f"Removed temporary directory: {temp_dir}")
-            except Exception as e:
-                if self.logger:
-                    self.logger.warning(f"Failed to remove temporary directory {temp_dir}: {e}")
+        self._for_each(self._remove_temp_dir, self.temp_dirs)
         
         # Clear lists
         self.temp_files.clear()
+        self._temp_file_dirs.clear()
+        self._temp_dir_index.clear()
+        self._temp_file_names.clear()
+        self._pool_dir = None
         self.temp_dirs.clear()
         
-        if self.logger:
+        if self._log_info:
             remaining_files = len(self.temp_files) + len(self.temp_dirs)
             self.logger.info(f"Cleanup completed. Remaining tracked items: {remaining_files}")
     
+    @staticmethod
+    def _for_each(remove: Callable[[str], None], entries: List[str]) -> None:
+        """
+        Apply a removal function to temp entries, in parallel when many.
+        
+        Each removal is mostly waiting on the filesystem, so from
+        _CLEANUP_PARALLEL_MIN entries on they are spread over a thread pool.
+        Fewer entries are removed inline to avoid thread startup.
+        
+        Args:
+            remove: Function removing one entry (must not raise)
+            entries: Paths to remove
+        """
+        if len(entries) < _CLEANUP_PARALLEL_MIN:
+            for entry in entries:
+                remove(entry)
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(_CLEANUP_WORKERS, len(entries))) as executor:
+            for _ in executor.map(remove, entries):
+                pass
+    
+    def _remove_temp_dir(self, temp_dir: str) -> None:
+        """
+        Remove one temporary directory tree, ignoring one that is already gone.
+        
+        Args:
+            temp_dir: Temporary directory path
+        """
+        # rmtree already unlinks relative to directory descriptors where the
+        # platform supports it; ignoring errors lets it remove the rest of
+        # the tree after one failure, which is then reported once
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        
+        if os.path.lexists(temp_dir):
+            if self.logger:
+                self.logger.warning(f"Failed to remove temporary directory {temp_dir}")
+        elif self._log_debug:
+            self.logger.debug(f"Removed temporary directory: {temp_dir}")
+    
+    def _remove_temp_file(self, entry: Tuple[int, str], dir_fds: List[Optional[int]]) -> None:
+        """
+        Remove one temporary file, ignoring files that are already gone.
+        
+        Args:
+            entry: (directory index, basename) from _temp_file_names
+            dir_fds: Open descriptor per directory index, or None to remove
+                     by full path
+        """
+        dir_idx, name = entry
+        dir_fd = dir_fds[dir_idx]
+        try:
+            if dir_fd is not None:
+                os.unlink(name, dir_fd=dir_fd)
+            else:
+                os.unlink(os.path.join(self._temp_file_dirs[dir_idx], name))
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"Failed to remove temporary file "
+                                    f"{os.path.join(self._temp_file_dirs[dir_idx], name)}: {e}")
+            return
+        
+        if self._log_debug:
+            self.logger.debug(f"Removed temporary file: {os.path.join(self._temp_file_dirs[dir_idx], name)}")
+    
     def __enter__(self):
         """
         Context manager entry.
         
         Returns self for use in 'with' statement.
         """
-        if self.logger:
+        if self._log_debug:
             self.logger.debug("Entering TempFileManager context")
         return self
     
@@ -975,10 +2277,37 @@ class TempFileManager:
         
         Calls cleanup() when exiting 'with' block.
         Handles exceptions gracefully.
+        
+        With async_cleanup, the tracked resources are moved to a detached
+        manager whose cleanup() runs on a background thread, so the caller
+        does not wait for unlinks and this manager can be reused at once.
         """
-        if self.logger:
+        if self._log_debug:
             self.logger.debug("Exiting TempFileManager context")
             if exc_type is not None:
                 self.logger.debug(f"Exception occurred: {exc_type}")
         
-        self.cleanup()
+        if self.async_cleanup:
+            detached = copy.copy(self)
+            self._reset_tracking()
+            TempFileManager._get_cleanup_pool().submit(detached.cleanup)
+        else:
+            self.cleanup()
+    
+    @staticmethod
+    def _get_cleanup_pool() -> ThreadPoolExecutor:
+        """
+        Return the shared background cleanup pool, creating it on first use.
+        
+        The pool is registered with atexit when created, so cleanups it
+        still has pending finish before the interpreter exits.
+        
+        Returns:
+            Thread pool running detached cleanup() calls
+        """
+        with TempFileManager._cleanup_pool_lock:
+            if TempFileManager._cleanup_pool is None:
+                TempFileManager._cleanup_pool = ThreadPoolExecutor(max_workers=2,
+                                                                   thread_name_prefix='tempcleanup')
+                atexit.register(TempFileManager._cleanup_pool.shutdown, wait=True)
+            return TempFileManager._cleanup_pool
@@ -16,18 +16,22 @@ Architecture Overview:
 
 Thread Safety:
     All public classes (LRUCache, PerformanceMonitor) are thread-safe and
-    designed for concurrent access. Use the decorators in multi-threaded
+    designed for concurrent access. LRUCache stripes entries over shards
+    with readers-writer locks so cache hits do not serialize. Use the decorators in multi-threaded
     environments without additional synchronization.
 
 Configuration:
     Cache behavior is controlled via config.py:
-    - CACHE_ENABLED: Global switch for caching
+    - CACHE_ENABLED: Global switch for caching (read when @cached decorates;
+      use set_cache_enabled() to toggle at runtime)
     - MAX_CACHE_SIZE: Default maximum cache entries
     - CACHE_TTL: Default time-to-live in seconds
 
 Performance Considerations:
-    - Cache keys are MD5 hashes for O(1) lookup
-    - LRU eviction maintains constant-time operations
+    - Cache keys are the hashable argument tuples themselves for O(1)
+      lookup; calls with unhashable arguments bypass the cache
+    - LRU eviction maintains constant-time operations (in C when the
+      optional lru-dict package is installed)
     - Monitor has minimal overhead (< 1% in most cases)
     - Memory usage scales linearly with cache size
 
@@ -60,66 +64,270 @@ Anti-Patterns:
 """
 
 import time
-import hashlib
 import functools
-from typing import Any, Dict, Optional, Callable, TypeVar, Union
+import inspect
+from typing import Any, Dict, Hashable, Optional, Callable, Set, Tuple, TypeVar, Union
 from collections import OrderedDict
 import threading
+import types
+import weakref
 
 import config
 
+# C-backed LRU store: much cheaper per lookup than OrderedDict when installed
+try:
+    import lru
+except ImportError:
+    lru = None
+
 F = TypeVar('F', bound=Callable[..., Any])
 
-class CacheEntry:
+_monotonic_ns = time.monotonic_ns
+
+
+class _WeakValue(weakref.ref):
+    """Weak reference to a cached value, told apart from cached weakrefs."""
+    
+    __slots__ = ()
+
+
+class RWLock:
     """
-    Cache entry with TTL (Time To Live) support.
+    Readers-writer lock built from two plain locks and a reader counter.
     
-    Wraps a cached value with metadata to track its age and expiration.
-    This is a lightweight wrapper that adds minimal overhead to cached values.
+    Any number of readers may hold the lock together; a writer waits until
+    the last reader leaves and then excludes everyone else. The first
+    reader in takes the write lock on behalf of all readers and the last
+    reader out releases it.
     
     Attributes:
-        value: The cached value (any Python object)
-        created_at: Unix timestamp when entry was created
-        ttl: Time to live in seconds (from CACHE_TTL config by default)
+        write_lock: threading.Lock held by writers (use as a context manager)
     
     Design Notes:
-        - Uses time.time() for monotonic timestamps
-        - Value is stored by reference, not copied
-        - Expired entries return None to force re-computation
-        - Immutable after creation (no methods modify value)
+        - Readers are preferred; a steady stream of readers can delay writers,
+          which is acceptable for short cache lookups
+        - Not reentrant: a thread must not take the write lock while holding
+          a read lock
+        - The write lock may be released by a different reader thread than
+          the one that acquired it, which threading.Lock permits
     
     Example:
-        >>> entry = CacheEntry("result", ttl=60)
-        >>> entry.is_expired()  # Returns False if within 60 seconds
-        False
-        >>> entry.get_value()
-        'result'
+        >>> rwlock = RWLock()
+        >>> rwlock.acquire_read()
+        >>> rwlock.release_read()
+        >>> with rwlock.write_lock:
+        ...     pass
+    """
+    
+    def __init__(self):
+        self._readers = 0
+        self._readers_lock = threading.Lock()
+        self.write_lock = threading.Lock()
+    
+    def acquire_read(self) -> None:
+        """Acquire a shared read lock, waiting for any active writer."""
+        with self._readers_lock:
+            self._readers += 1
+            if self._readers == 1:
+                self.write_lock.acquire()
+    
+    def release_read(self) -> None:
+        """Release a shared read lock, letting writers in after the last reader."""
+        with self._readers_lock:
+            self._readers -= 1
+            if self._readers == 0:
+                self.write_lock.release()
+
+
+class _CacheShard:
+    """
+    One independently locked stripe of an LRUCache.
+    
+    Holds up to max_size entries with its own RWLock, so operations on
+    different shards never contend. Eviction is LRU via lru-dict when
+    installed, otherwise CLOCK / second chance over an OrderedDict ring.
+    
+    Entries are plain (expires_at_ns, value) tuples: the deadline is a
+    time.monotonic_ns() reading, so expiry is one integer compare and is
+    unaffected by wall-clock jumps, and a tuple is much cheaper to build
+    and unpack than an entry object.
+    
+    Attributes:
+        max_size: Maximum number of entries in this shard
+        ttl: Time-to-live for entries in seconds
+        weak_values: Whether values are held through weak references
+        cache: lru.LRU (or OrderedDict fallback) mapping keys to entries
+        lock: RWLock for thread safety
     """
     
-    def __init__(self, value: Any, ttl: int = config.CACHE_TTL):
-        self.value = value
-        self.created_at = time.time()
+    def __init__(self, max_size: int = config.MAX_CACHE_SIZE, ttl: int = config.CACHE_TTL,
+                 weak_values: bool = False):
+        self.max_size = max_size
         self.ttl = ttl
+        self._ttl_ns = int(ttl * 1_000_000_000)
+        self.weak_values = weak_values
+        # lru.LRU needs a positive capacity
+        self._native_lru = lru is not None and max_size > 0
+        if self._native_lru:
+            self.cache = lru.LRU(max_size)
+        else:
+            self.cache: OrderedDict[Hashable, Tuple[int, Any]] = OrderedDict()
+        # CLOCK reference bits for the OrderedDict fallback
+        self._referenced: Set[Hashable] = set()
+        self.lock = RWLock()
     
-    def is_expired(self) -> bool:
+    def get(self, key: Hashable) -> Optional[Any]:
         """
-        Check if cache entry is expired.
+        Get value from cache.
+        
+        Marks the entry as recently used on successful retrieval.
+        Expired entries are automatically removed and return None.
         
+        Args:
+            key: Cache key to retrieve
+            
         Returns:
-            True if entry has exceeded its TTL, False otherwise
+            Cached value if found and not expired, None otherwise
+            
+        Thread Safety:
+            Safe for concurrent calls; hits only take the read lock
         """
-        return time.time() - self.created_at > self.ttl
+        self.lock.acquire_read()
+        try:
+            # lru.LRU.get() also marks the entry as most recently used
+            entry = self.cache.get(key)
+            if entry is None:
+                return None
+            
+            expires_at_ns, value = entry
+            if _monotonic_ns() <= expires_at_ns:
+                if self.weak_values and isinstance(value, _WeakValue):
+                    value = value()
+                    alive = value is not None
+                else:
+                    alive = True
+                if alive:
+                    if not self._native_lru:
+                        # Reference bit spares the entry from the next sweep
+                        self._referenced.add(key)
+                    return value
+        finally:
+            self.lock.release_read()
+        
+        # Expired or collected: remove it unless another thread already
+        # replaced it
+        with self.lock.write_lock:
+            if self.cache.get(key) is entry:
+                del self.cache[key]
+                self._referenced.discard(key)
+        return None
     
-    def get_value(self) -> Any:
+    def put(self, key: Hashable, value: Any) -> None:
         """
-        Get value if not expired.
+        Put value into cache.
+        
+        If the key already exists, the old entry is replaced and marked as
+        recently used. Least recently used entries are evicted if the cache
+        exceeds max_size.
+        
+        Args:
+            key: Cache key to store value under
+            value: Value to cache
+            
+        Thread Safety:
+            Safe for concurrent calls
+        """
+        if self.weak_values:
+            try:
+                value = _WeakValue(value)
+            except TypeError:
+                # str, int, tuple, ... cannot be weakly referenced
+                pass
+        
+        with self.lock.write_lock:
+            # Add or replace entry; lru.LRU evicts at capacity on its own
+            if not self._native_lru and key in self.cache:
+                self._referenced.add(key)
+            self.cache[key] = (_monotonic_ns() + self._ttl_ns, value)
+            if self._native_lru:
+                return
+            
+            # CLOCK sweep: evict from the head, re-queueing referenced entries
+            while len(self.cache) > self.max_size:
+                oldest_key, oldest_entry = self.cache.popitem(last=False)
+                if oldest_key in self._referenced:
+                    self._referenced.remove(oldest_key)
+                    self.cache[oldest_key] = oldest_entry
+    
+    def clear(self) -> None:
+        """
+        Clear all cache entries.
+        
+        Thread Safety:
+            Safe for concurrent calls
+        """
+        with self.lock.write_lock:
+            self.cache.clear()
+            self._referenced.clear()
+    
+    def size(self) -> int:
+        """
+        Get current cache size.
         
         Returns:
-            The cached value if not expired, None otherwise
+            Number of entries currently in the cache
+            
+        Thread Safety:
+            Safe for concurrent calls; len() is a single C call, so no
+            lock is taken
         """
-        if self.is_expired():
-            return None
-        return self.value
+        return len(self.cache)
+    
+    def cleanup_expired(self) -> int:
+        """
+        Remove expired entries.
+        
+        Note: This method only removes expired entries. It does not affect
+        the LRU order of valid entries.
+        
+        Returns:
+            Number of entries removed
+            
+        Thread Safety:
+            Safe for concurrent calls; the scan runs under the read lock
+            and the write lock is only taken when something has expired
+        """
+        self.lock.acquire_read()
+        try:
+            now_ns = time.monotonic_ns()
+            any_expired = any(
+                now_ns > entry[0]
+                for entry in self.cache.values()
+            )
+        finally:
+            self.lock.release_read()
+        if not any_expired:
+            return 0
+        
+        with self.lock.write_lock:
+            before = len(self.cache)
+            now_ns = time.monotonic_ns()
+            if self._native_lru:
+                expired_keys = [
+                    key for key, entry in self.cache.items()
+                    if now_ns > entry[0]
+                ]
+                for key in expired_keys:
+                    del self.cache[key]
+            else:
+                # One rebuild beats many deletes; iteration keeps ring order
+                self.cache = OrderedDict(
+                    (key, entry) for key, entry in self.cache.items()
+                    if now_ns <= entry[0]
+                )
+                self._referenced.intersection_update(self.cache)
+            
+            return before - len(self.cache)
 
 
 class LRUCache:
@@ -128,29 +336,44 @@ class LRUCache:
     
     Implements a thread-safe cache with two eviction policies:
     - LRU: Evicts least recently used items when max_size is reached
+      (approximated with CLOCK / second chance without lru-dict)
     - TTL: Expired items are removed on access or explicit cleanup
     
     Thread Safety:
-        All operations are protected by a reentrant lock, making this cache
-        safe for concurrent access from multiple threads. RLock allows the
-        same thread to acquire the lock multiple times (for internal calls).
+        Entries are striped across independently locked shards by key hash,
+        so threads working on different keys rarely contend. Within a shard,
+        lookups share a read lock so cache hits proceed concurrently;
+        inserts, deletions and cleanup take the write lock. Recency updates
+        on a hit are single C-level calls (lru.LRU.get or a set.add of the
+        reference bit), which the GIL keeps atomic between readers.
     
     Performance Characteristics:
         - get/put operations: O(1) average time
         - cleanup_expired: O(n) where n is cache size
-        - Memory overhead: ~72 bytes per entry (excluding value)
+        - Memory overhead: one 2-tuple per entry (excluding key and value)
     
     Attributes:
         max_size: Maximum number of entries in the cache (soft limit)
         ttl: Default time-to-live for cache entries in seconds
-        cache: OrderedDict storing cache entries (LRU order maintained)
-        lock: Threading.RLock for thread safety
+        weak_values: Hold values through weak references, so an entry
+            disappears once nothing else uses its value. Values that cannot
+            be weakly referenced (str, bytes, int, tuple, ...) are held
+            strongly; wrap them in an object to make them collectable.
+        shards: List of _CacheShard stripes (a power of two in length)
     
     Design Decisions:
-        - OrderedDict provides O(1) move_to_end/popitem operations
+        - lru-dict's C LRU tracks recency and evicts at capacity itself
+        - The OrderedDict fallback is a CLOCK ring in insertion order: a hit
+          only sets a reference bit instead of reordering the dict, and
+          eviction pops from the head, giving referenced entries a second
+          chance at the tail
         - Expired entries removed lazily (on access) for performance
         - No automatic cleanup thread to avoid complexity
-        - RLock allows safe nested locking if needed
+        - RWLock lets read-heavy workloads scale with reader threads
+        - Up to CACHE_SHARDS stripes, but never smaller than
+          CACHE_MIN_SHARD_SIZE entries each, so small caches stay a single
+          exact LRU and a skewed key spread cannot evict too early
+        - LRU order is tracked per shard, not across the whole cache
     
     Usage Guidelines:
         - Call cleanup_expired() periodically if cache has high churn
@@ -169,17 +392,30 @@ class LRUCache:
         0
     """
     
-    def __init__(self, max_size: int = config.MAX_CACHE_SIZE, ttl: int = config.CACHE_TTL):
+    def __init__(self, max_size: int = config.MAX_CACHE_SIZE, ttl: int = config.CACHE_TTL,
+                 weak_values: bool = False):
         self.max_size = max_size
         self.ttl = ttl
-        self.cache: OrderedDict[str, CacheEntry] = OrderedDict()
-        self.lock = threading.RLock()
+        self.weak_values = weak_values
+        
+        shard_count = 1
+        while (shard_count * 2 <= config.CACHE_SHARDS
+               and max_size // (shard_count * 2) >= config.CACHE_MIN_SHARD_SIZE):
+            shard_count *= 2
+        self._shard_mask = shard_count - 1
+        
+        # Spread the remainder so shard capacities add up to max_size
+        base_size, extra = divmod(max_size, shard_count)
+        self.shards = [
+            _CacheShard(base_size + (1 if index < extra else 0), ttl, weak_values)
+            for index in range(shard_count)
+        ]
     
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: Hashable) -> Optional[Any]:
         """
         Get value from cache.
         
-        Updates the entry's position in the LRU order on successful retrieval.
+        Marks the entry as recently used on successful retrieval.
         Expired entries are automatically removed and return None.
         
         Args:
@@ -189,28 +425,17 @@ class LRUCache:
             Cached value if found and not expired, None otherwise
             
         Thread Safety:
-            Safe for concurrent calls
+            Safe for concurrent calls; hits only take a shard's read lock
         """
-        with self.lock:
-            if key not in self.cache:
-                return None
-            
-            entry = self.cache[key]
-            if entry.is_expired():
-                del self.cache[key]
-                return None
-            
-            # Move to end (most recently used)
-            self.cache.move_to_end(key)
-            return entry.get_value()
+        return self.shards[hash(key) & self._shard_mask].get(key)
     
-    def put(self, key: str, value: Any) -> None:
+    def put(self, key: Hashable, value: Any) -> None:
         """
         Put value into cache.
         
-        If the key already exists, the old entry is replaced and moved to
-        the end of the LRU order. Oldest entries are evicted if the cache
-        exceeds max_size.
+        If the key already exists, the old entry is replaced and marked as
+        recently used. Least recently used entries of the key's shard are
+        evicted if that shard is full.
         
         Args:
             key: Cache key to store value under
@@ -219,20 +444,7 @@ class LRUCache:
         Thread Safety:
             Safe for concurrent calls
         """
-        with self.lock:
-            # Remove existing entry if present
-            if key in self.cache:
-                del self.cache[key]
-            
-            # Add new entry
-            self.cache[key] = CacheEntry(value, self.ttl)
-            
-            # Move to end
-            self.cache.move_to_end(key)
-            
-            # Remove oldest entries if cache is full
-            while len(self.cache) > self.max_size:
-                self.cache.popitem(last=False)
+        self.shards[hash(key) & self._shard_mask].put(key, value)
     
     def clear(self) -> None:
         """
@@ -241,8 +453,8 @@ class LRUCache:
         Thread Safety:
             Safe for concurrent calls
         """
-        with self.lock:
-            self.cache.clear()
+        for shard in self.shards:
+            shard.clear()
     
     def size(self) -> int:
         """
@@ -252,10 +464,9 @@ class LRUCache:
             Number of entries currently in the cache
             
         Thread Safety:
-            Safe for concurrent calls
+            Safe for concurrent calls; takes no lock
         """
-        with self.lock:
-            return len(self.cache)
+        return sum(shard.size() for shard in self.shards)
     
     def cleanup_expired(self) -> int:
         """
@@ -268,18 +479,58 @@ class LRUCache:
             Number of entries removed
             
         Thread Safety:
-            Safe for concurrent calls
+            Safe for concurrent calls; locks one shard at a time
         """
-        with self.lock:
-            expired_keys = [
-                key for key, entry in self.cache.items()
-                if entry.is_expired()
-            ]
-            
-            for key in expired_keys:
-                del self.cache[key]
-            
-            return len(expired_keys)
+        return sum(shard.cleanup_expired() for shard in self.shards)
+
+
+class _OpStats:
+    """
+    Per-operation timing counters for PerformanceMonitor.
+    
+    Uses __slots__ so the hot end_timer() update is plain attribute access
+    rather than a series of dictionary lookups. Times are integer
+    nanoseconds; get_metrics() converts them to seconds.
+    """
+    
+    __slots__ = ('total_time_ns', 'call_count', 'min_time_ns', 'max_time_ns', 'active_timers')
+    
+    def __init__(self):
+        self.total_time_ns = 0
+        self.call_count = 0
+        self.min_time_ns = float('inf')
+        self.max_time_ns = 0
+        self.active_timers: Dict[str, int] = {}
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Report the counters with times in seconds.
+        
+        Returns:
+            Dictionary with total/average/min/max times in seconds
+        """
+        total_time = self.total_time_ns / 1e9
+        return {
+            'total_time': total_time,
+            'call_count': self.call_count,
+            'average_time': total_time / self.call_count if self.call_count else 0.0,
+            'min_time': self.min_time_ns / 1e9,
+            'max_time': self.max_time_ns / 1e9,
+            'active_timers': dict(self.active_timers)
+        }
+    
+    def record(self, elapsed_ns: int) -> None:
+        """
+        Add one finished measurement to the counters.
+        
+        Args:
+            elapsed_ns: Elapsed time in nanoseconds
+        """
+        self.total_time_ns += elapsed_ns
+        if elapsed_ns < self.min_time_ns:
+            self.min_time_ns = elapsed_ns
+        if elapsed_ns > self.max_time_ns:
+            self.max_time_ns = elapsed_ns
 
 
 class PerformanceMonitor:
@@ -302,7 +553,7 @@ class PerformanceMonitor:
         All methods are protected by RLock, safe for concurrent use.
     
     Performance Impact:
-        Minimal overhead (~0.5-1%) due to time.time() calls.
+        Minimal overhead (~0.5-1%) due to time.perf_counter_ns() calls.
         Only track operations that take > 1ms for meaningful stats.
     
     Use Cases:
@@ -314,13 +565,35 @@ class PerformanceMonitor:
     Design Notes:
         - Timer IDs include operation name, timestamp, and instance id
         - Unmatched timers remain in active_timers (leak detection)
+        - @timed uses push_timer()/pop_timer(), which keep start times on a
+          thread-local stack instead of in active_timers
+        - pop_timer() results are buffered per thread and applied under the
+          lock FLUSH_SIZE at a time; get_metrics() drains every buffer first
+        - get_metrics() for all operations returns a read-only snapshot that
+          is rebuilt only after something changed, so repeated reads by a
+          monitoring loop take no lock
+        - Times are accumulated as integer nanoseconds from
+          time.perf_counter_ns() and converted to seconds in get_metrics()
         - min_time initialized to inf, updated on first measurement
         - Metrics are not persisted across restarts
     """
     
+    # Buffered pop_timer() results per thread before taking the lock
+    FLUSH_SIZE = 64
+    
     def __init__(self):
-        self.metrics: Dict[str, Dict[str, Any]] = {}
+        self.metrics: Dict[str, _OpStats] = {}
         self.lock = threading.RLock()
+        # Per-thread start-time stacks for push_timer()/pop_timer()
+        self._thread_timers = threading.local()
+        # Per-thread (operation, elapsed_ns) buffers, registered by thread so
+        # get_metrics() can drain them and forget threads that have exited
+        self._thread_buffers = threading.local()
+        self._buffers: Dict[threading.Thread, list] = {}
+        # Published read-only view of all metrics; _stale is set by every
+        # change so readers know when to rebuild it
+        self._snapshot: Optional[types.MappingProxyType] = None
+        self._stale = True
     
     def start_timer(self, operation: str) -> str:
         """
@@ -332,21 +605,17 @@ class PerformanceMonitor:
         Returns:
             Timer ID
         """
-        timer_id = f"{operation}_{time.time()}_{id(self)}"
+        start_ns = time.perf_counter_ns()
+        timer_id = f"{operation}_{start_ns}_{id(self)}"
         
         with self.lock:
-            if operation not in self.metrics:
-                self.metrics[operation] = {
-                    'total_time': 0.0,
-                    'call_count': 0,
-                    'average_time': 0.0,
-                    'min_time': float('inf'),
-                    'max_time': 0.0,
-                    'active_timers': {}
-                }
+            stats = self.metrics.get(operation)
+            if stats is None:
+                stats = self.metrics[operation] = _OpStats()
             
-            self.metrics[operation]['active_timers'][timer_id] = time.time()
-            self.metrics[operation]['call_count'] += 1
+            stats.active_timers[timer_id] = start_ns
+            stats.call_count += 1
+            self._stale = True
         
         return timer_id
     
@@ -359,27 +628,107 @@ class PerformanceMonitor:
             timer_id: Timer ID
             
         Returns:
-            Elapsed time or None if timer not found
+            Elapsed time in seconds or None if timer not found
         """
+        end_ns = time.perf_counter_ns()
         with self.lock:
-            if operation not in self.metrics:
+            stats = self.metrics.get(operation)
+            if stats is None:
                 return None
             
-            active_timers = self.metrics[operation]['active_timers']
-            if timer_id not in active_timers:
+            start_ns = stats.active_timers.pop(timer_id, None)
+            if start_ns is None:
                 return None
             
-            start_time = active_timers.pop(timer_id)
-            elapsed_time = time.time() - start_time
-            
             # Update metrics
-            metrics = self.metrics[operation]
-            metrics['total_time'] += elapsed_time
-            metrics['average_time'] = metrics['total_time'] / metrics['call_count']
-            metrics['min_time'] = min(metrics['min_time'], elapsed_time)
-            metrics['max_time'] = max(metrics['max_time'], elapsed_time)
+            elapsed_ns = end_ns - start_ns
+            stats.record(elapsed_ns)
+            self._stale = True
             
-            return elapsed_time
+            return elapsed_ns / 1e9
+    
+    def push_timer(self, operation: str) -> None:
+        """
+        Start timing an operation on the calling thread.
+        
+        Lightweight alternative to start_timer() used by @timed: the start
+        time goes on a thread-local stack per operation, so no timer ID is
+        formatted and no lock is taken. Must be paired with pop_timer() on
+        the same thread, in nested (last-in, first-out) order.
+        
+        Args:
+            operation: Operation name
+        """
+        stacks = self._thread_timers.__dict__
+        stack = stacks.get(operation)
+        if stack is None:
+            stack = stacks[operation] = []
+        stack.append(time.perf_counter_ns())
+    
+    def pop_timer(self, operation: str) -> Optional[float]:
+        """
+        End the calling thread's most recent push_timer() for an operation.
+        
+        The call is counted here rather than at start, so in-progress calls
+        do not appear in call_count until they finish. The measurement is
+        buffered on the calling thread and only takes the lock once every
+        FLUSH_SIZE calls; get_metrics() always sees buffered results.
+        
+        Args:
+            operation: Operation name
+            
+        Returns:
+            Elapsed time in seconds or None if no timer was pushed
+        """
+        end_ns = time.perf_counter_ns()
+        stack = self._thread_timers.__dict__.get(operation)
+        if not stack:
+            return None
+        elapsed_ns = end_ns - stack.pop()
+        
+        buffer = getattr(self._thread_buffers, 'buffer', None)
+        if buffer is None:
+            buffer = self._thread_buffers.buffer = []
+            with self.lock:
+                self._buffers[threading.current_thread()] = buffer
+        buffer.append((operation, elapsed_ns))
+        self._stale = True
+        if len(buffer) >= self.FLUSH_SIZE:
+            with self.lock:
+                self._drain(buffer)
+        
+        return elapsed_ns / 1e9
+    
+    def _drain(self, buffer: list) -> None:
+        """
+        Apply and remove buffered pop_timer() results. Caller holds the lock.
+        
+        The items are copied and then deleted by count, so results the
+        owning thread appends meanwhile stay queued.
+        
+        Args:
+            buffer: A thread's list of (operation, elapsed_ns) tuples
+        """
+        count = len(buffer)
+        if not count:
+            return
+        pending = buffer[:count]
+        del buffer[:count]
+        
+        metrics = self.metrics
+        for operation, elapsed_ns in pending:
+            stats = metrics.get(operation)
+            if stats is None:
+                stats = metrics[operation] = _OpStats()
+            stats.call_count += 1
+            stats.record(elapsed_ns)
+    
+    def _flush_buffers(self) -> None:
+        """Drain every thread's buffer and forget exited threads. Caller holds the lock."""
+        for thread, buffer in list(self._buffers.items()):
+            self._drain(buffer)
+            if not thread.is_alive():
+                del self._buffers[thread]
     
     def get_metrics(self, operation: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -389,14 +738,35 @@ class PerformanceMonitor:
             operation: Specific operation or None for all
             
         Returns:
-            Performance metrics
+            Performance metrics (times in seconds). For all operations this
+            is a read-only mapping of read-only per-operation mappings.
+            
+        Thread Safety:
+            Reading all metrics takes no lock while nothing has changed
+            since the last read; the snapshot is swapped in with a single
+            attribute assignment.
         """
+        if not operation:
+            snapshot = self._snapshot
+            if snapshot is not None and not self._stale:
+                return snapshot
+        
         with self.lock:
             if operation:
-                return self.metrics.get(operation, {})
+                self._flush_buffers()
+                stats = self.metrics.get(operation)
+                return stats.as_dict() if stats else {}
             
-            # Return copy of all metrics
-            return {op: dict(metrics) for op, metrics in self.metrics.items()}
+            # Clear the flag before draining so results buffered meanwhile
+            # mark the new snapshot stale again
+            self._stale = False
+            self._flush_buffers()
+            snapshot = types.MappingProxyType({
+                op: types.MappingProxyType(stats.as_dict())
+                for op, stats in self.metrics.items()
+            })
+            self._snapshot = snapshot
+            return snapshot
     
     def reset_metrics(self, operation: Optional[str] = None) -> None:
         """
@@ -406,28 +776,39 @@ class PerformanceMonitor:
             operation: Specific operation or None for all
         """
         with self.lock:
+            self._flush_buffers()
             if operation:
                 self.metrics.pop(operation, None)
             else:
                 self.metrics.clear()
+            self._stale = True
 
 
 # Global instances
 _cache = LRUCache()
 _monitor = PerformanceMonitor()
 
+# Cache keys currently being computed, with the ident of the computing
+# thread, so concurrent misses wait for the first caller instead of running
+# the same function again
+_in_flight: Dict[Hashable, Tuple[threading.Event, int]] = {}
+_in_flight_lock = threading.Lock()
+
+# Runtime copy of config.CACHE_ENABLED, changed through set_cache_enabled()
+_cache_enabled = config.CACHE_ENABLED
+
 
 def cached(ttl: int = config.CACHE_TTL, max_size: int = config.MAX_CACHE_SIZE) -> Callable[[F], F]:
     """
     Decorator for caching function results with TTL and LRU eviction.
     
     Caches return values based on function arguments, using a global LRUCache
-    instance. Cache keys include module, function name, and serialized args.
+    instance. Cache keys are the function object plus its arguments.
     
     Function Requirements:
         - Must be deterministic (same input -> same output)
         - Should have no side effects
-        - Arguments must be hashable or serializable
+        - Arguments must be hashable for results to be cached
         - Return value should be reasonably sized
     
     Args:
@@ -440,12 +821,22 @@ def cached(ttl: int = config.CACHE_TTL, max_size: int = config.MAX_CACHE_SIZE) -
     Behavior:
         - Returns cached value if found and not expired
         - Executes function and caches result on miss
-        - No-op if CACHE_ENABLED is False (bypasses cache)
+        - Concurrent misses on the same key wait (up to CACHE_WAIT_TIMEOUT)
+          for the first caller's result instead of executing the function
+          again; recursive misses on the same thread compute directly
+        - Calls with unhashable arguments run uncached
+        - Returns func itself if CACHE_ENABLED is False at decoration time
+        - Bypasses the cache while set_cache_enabled(False) is in effect
     
     Cache Key Generation:
-        - Function module and name (namespace)
-        - Hash of args tuple
-        - Hash of sorted kwargs items
+        - (func, args) tuple for positional calls; like functools.lru_cache,
+          equal arguments such as 1 and 1.0 share an entry
+        - Keyword calls to functions with a plain signature go through a
+          key builder compiled from that signature, so f(1, b=2) and
+          f(1, 2) share the key (func, (1, 2))
+        - Other keyword calls use (func, args, sorted kwargs items)
+        - No hash or repr() digest stands in for the arguments, so distinct
+          arguments can never share an entry
         
     Example:
         @cached(ttl=300, max_size=1000)
@@ -456,25 +847,78 @@ def cached(ttl: int = config.CACHE_TTL, max_size: int = config.MAX_CACHE_SIZE) -
         - Don't cache functions with random or time-based output
         - Don't cache functions that modify external state
         - Don't cache very fast operations (overhead > benefit)
-        - Don't pass unhashable arguments (lists, dicts, etc.)
+        - Don't pass unhashable arguments (lists, dicts, etc.); such calls
+          are never cached
+        - Don't cache methods of short-lived objects; the key holds self
+          (like every argument) until the entry expires or is evicted
     """
     def decorator(func: F) -> F:
+        if not config.CACHE_ENABLED:
+            # Caching is off for this run; leave func undecorated
+            return func
+        
+        key_builder = _build_key_builder(func)
+        # Bound once here instead of looked up on every call
+        cache_get = _cache.get
+        cache_put = _cache.put
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            if not config.CACHE_ENABLED:
+            if not _cache_enabled:
                 return func(*args, **kwargs)
             
-            # Create cache key
-            key = _create_cache_key(func, args, kwargs)
+            # The arguments themselves are the key; equal arguments hit
+            if not kwargs:
+                key = (func, args)
+            elif key_builder is not None:
+                try:
+                    key = key_builder(*args, **kwargs)
+                except TypeError:
+                    # Arguments don't fit the signature; let func raise
+                    return func(*args, **kwargs)
+            else:
+                key = (func, args, tuple(sorted(kwargs.items())))
+            try:
+                hash(key)
+            except TypeError:
+                # Unhashable arguments have no exact key, and a key derived
+                # from their repr() could collide, so run the call uncached
+                return func(*args, **kwargs)
             
             # Try to get from cache
-            result = _cache.get(key)
+            result = cache_get(key)
             if result is not None:
                 return result
             
+            thread_id = threading.get_ident()
+            with _in_flight_lock:
+                pending = _in_flight.get(key)
+                if pending is None:
+                    _in_flight[key] = (threading.Event(), thread_id)
+            
+            if pending is not None:
+                event, owner = pending
+                if owner == thread_id:
+                    # A recursive call for the key this thread is computing;
+                    # waiting for ourselves would never return
+                    return func(*args, **kwargs)
+                # Another thread is computing this key; use its result unless
+                # it failed, returned None or is taking too long (e.g. it is
+                # itself waiting on a key this thread owns), then compute here
+                event.wait(config.CACHE_WAIT_TIMEOUT)
+                result = cache_get(key)
+                if result is None:
+                    result = func(*args, **kwargs)
+                    cache_put(key, result)
+                return result
+            
             # Execute function and cache result
-            result = func(*args, **kwargs)
-            _cache.put(key, result)
+            try:
+                result = func(*args, **kwargs)
+                cache_put(key, result)
+            finally:
+                with _in_flight_lock:
+                    _in_flight.pop(key)[0].set()
             
             return result
         
@@ -532,70 +976,67 @@ def timed(operation: Optional[str] = None) -> Callable[[F], F]:
         - Avoid timing very fast operations (noise dominates signal)
     """
     def decorator(func: F) -> F:
+        op_name = operation or f"{func.__module__}.{func.__name__}"
+        # Bound once here instead of looked up on every call
+        push_timer = _monitor.push_timer
+        pop_timer = _monitor.pop_timer
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            op_name = operation or f"{func.__module__}.{func.__name__}"
-            timer_id = _monitor.start_timer(op_name)
-            
+            push_timer(op_name)
             try:
-                result = func(*args, **kwargs)
-                return result
+                return func(*args, **kwargs)
             finally:
-                _monitor.end_timer(op_name, timer_id)
+                pop_timer(op_name)
         
         return wrapper  # type: ignore
     
     return decorator
 
 
-def _create_cache_key(func: Callable, args: tuple, kwargs: dict) -> str:
+def _build_key_builder(func: Callable) -> Optional[Callable[..., tuple]]:
     """
-    Create cache key from function and arguments.
-    
-    Generates a deterministic, collision-resistant key combining function
-    identity and its arguments. Used internally by the @cached decorator.
+    Compile a cache key builder that mirrors a function's signature.
     
-    Key Components:
-        1. Function module (namespace isolation)
-        2. Function name (function identification)
-        3. Hash of args tuple (positional arguments)
-        4. Hash of sorted kwargs items (keyword arguments)
+    For a function like ``def f(a, b=1)`` this generates
+    ``lambda a, b=<default>: (func, (a, b))``. Calling it with the same
+    arguments as the function binds keywords and defaults the way Python
+    does, giving keyword calls the same key as the equivalent positional
+    call without sorting kwargs. Parameter names come from the signature,
+    so no caller-supplied text is evaluated as code.
     
     Args:
-        func: Function being cached (uses __module__ and __name__)
-        args: Positional arguments tuple
-        kwargs: Keyword arguments dictionary
+        func: Function being cached
         
     Returns:
-        32-character MD5 hex string (cache key)
-        
-    Algorithm:
-        - Components joined with "|" separator
-        - Args/kwargs converted to string and hashed
-        - kwargs sorted to ensure consistent ordering
-        - Final hash using MD5 for speed (not cryptographic)
-    
-    Limitations:
-        - Unhashable args may cause collisions (rare)
-        - Very large arguments may impact performance
-        - MD5 collisions theoretically possible (extremely unlikely)
-        - Different argument representations may collide
-    
-    Security Note:
-        MD5 is used here for speed, not security. Cache keys are
-        not exposed externally and collision probability is acceptable
-        for this use case.
+        Key builder, or None when the signature has *args, **kwargs or
+        keyword-only parameters (their values can't be folded into the
+        positional key without colliding with positional calls)
     """
-    # Create key components
-    key_parts = [
-        func.__module__,
-        func.__name__,
-        str(hash(str(args))),
-        str(hash(str(sorted(kwargs.items()))))
-    ]
+    try:
+        parameters = list(inspect.signature(func).parameters.values())
+    except (TypeError, ValueError):
+        return None
     
-    key_string = "|".join(key_parts)
-    return hashlib.md5(key_string.encode()).hexdigest()
+    plain_kinds = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    if any(param.kind not in plain_kinds or param.name.startswith('_key_') for param in parameters):
+        return None
+    
+    namespace: Dict[str, Any] = {'__builtins__': {}, '_key_func': func}
+    params = []
+    for index, param in enumerate(parameters):
+        if param.default is inspect.Parameter.empty:
+            params.append(param.name)
+        else:
+            namespace[f'_key_default_{index}'] = param.default
+            params.append(f'{param.name}=_key_default_{index}')
+        if (param.kind is inspect.Parameter.POSITIONAL_ONLY
+                and (index + 1 == len(parameters)
+                     or parameters[index + 1].kind is not inspect.Parameter.POSITIONAL_ONLY)):
+            params.append('/')
+    
+    names = ''.join(f'{param.name}, ' for param in parameters)
+    return eval(f'lambda {", ".join(params)}: (_key_func, ({names}))', namespace)
 
 
 def get_cache_stats() -> Dict[str, Any]:
@@ -603,7 +1044,8 @@ def get_cache_stats() -> Dict[str, Any]:
     Get current cache statistics and configuration.
 
     Returns a snapshot of cache state for monitoring and debugging.
-    Thread-safe and returns a copy of configuration values.
+    Thread-safe without taking any cache lock, and returns a copy of
+    configuration values.
 
     Returns:
         Dictionary containing:
@@ -626,7 +1068,7 @@ def get_cache_stats() -> Dict[str, Any]:
         'size': _cache.size(),
         'max_size': _cache.max_size,
         'ttl': _cache.ttl,
-        'enabled': config.CACHE_ENABLED
+        'enabled': _cache_enabled
     }
 
 
@@ -634,8 +1076,9 @@ def get_performance_stats() -> Dict[str, Any]:
     """
     Get all collected performance statistics.
 
-    Returns a copy of all metrics tracked by the global PerformanceMonitor.
-    Thread-safe and does not affect the underlying metrics.
+    Returns a copy of all metrics tracked by the global PerformanceMonitor,
+    built from its cached read-only snapshot. Thread-safe, and changes to
+    the returned dictionaries do not affect the underlying metrics.
 
     Returns:
         Nested dictionary where each key is an operation name mapping to:
@@ -656,7 +1099,27 @@ def get_performance_stats() -> Dict[str, Any]:
         for op, metrics in stats.items():
             print(f"{op}: avg={metrics['average_time']:.4f}s")
     """
-    return _monitor.get_metrics()
+    return {op: dict(stats) for op, stats in _monitor.get_metrics().items()}
+
+
+def set_cache_enabled(enabled: bool) -> None:
+    """
+    Turn result caching on or off at runtime.
+
+    Updates config.CACHE_ENABLED and the flag checked by @cached wrappers.
+    Functions decorated while CACHE_ENABLED was already False were left
+    undecorated and stay uncached.
+
+    Args:
+        enabled: Whether @cached functions should use the cache
+
+    Use Cases:
+        - Disable caching while debugging stale results
+        - Compare cached and uncached timings
+    """
+    global _cache_enabled
+    config.CACHE_ENABLED = enabled
+    _cache_enabled = enabled
 
 
 def clear_cache() -> None:
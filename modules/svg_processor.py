@@ -49,6 +49,11 @@ import utilities
 from exceptions import SVGTemplateError
 from security import FileValidator
 
+# CSS display declaration in a style attribute: the value is group 1 for
+# lookups, and the whole declaration (with its ';') is removed on update
+_DISPLAY_STYLE_PATTERN = re.compile(r'display\s*:\s*([^;]+)')
+_DISPLAY_DECLARATION_PATTERN = re.compile(r'display\s*:\s*[^;]*;?')
+
 class SVGElementProcessor:
     """
     Handles processing of individual SVG elements.
@@ -82,7 +87,7 @@ class SVGElementProcessor:
         style = element.get('style', '')
         if style:
             # Look for display: value in style string
-            display_match = re.search(r'display\s*:\s*([^;]+)', style)
+            display_match = _DISPLAY_STYLE_PATTERN.search(style)
             if display_match:
                 return display_match.group(1).strip()
         
@@ -101,7 +106,7 @@ class SVGElementProcessor:
         style = element.get('style', '')
         
         # Remove existing display declaration
-        style = re.sub(r'display\s*:\s*[^;]*;?', '', style).strip(';')
+        style = _DISPLAY_DECLARATION_PATTERN.sub('', style).strip(';')
         
         # Add new display value
         if style:
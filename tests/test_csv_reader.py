@@ -0,0 +1,279 @@
+"""
+Test cases for CSV reading and row filtering.
+
+Tests CSVReader functionality including:
+- Header parsing and BOM removal
+- Row construction for regular and ragged rows
+- Row range filtering
+"""
+
+import unittest
+import gc
+import sys
+import weakref
+import os
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules import csv_reader
+from modules.csv_reader import CSVReader
+
+
+class TestCSVReader(unittest.TestCase):
+    """Test CSV reading functionality."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.reader = CSVReader()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write_csv(self, content: str, name: str = "data.csv", encoding: str = "utf-8") -> str:
+        """Write CSV content to a temporary file and return its path."""
+        csv_path = os.path.join(self.temp_dir, name)
+        with open(csv_path, 'w', encoding=encoding, newline='') as f:
+            f.write(content)
+        return csv_path
+
+    def test_read_rows_as_dicts(self):
+        """Test rows are returned as header-keyed dictionaries."""
+        csv_path = self._write_csv("name,title\nAlice,Engineer\nBob,Designer\n")
+
+        data = self.reader.read_csv_data(csv_path, 'utf-8')
+
+        self.assertEqual(data, [
+            {'name': 'Alice', 'title': 'Engineer'},
+            {'name': 'Bob', 'title': 'Designer'}
+        ])
+
+    def test_detection_does_not_retain_reader(self):
+        """Test encoding detection keeps no reference to the reader."""
+        csv_path = self._write_csv("name,title\nAlice,Engineer\n")
+        reader = CSVReader()
+
+        self.assertEqual(reader.detect_encoding(csv_path), reader.detect_encoding(csv_path))
+        reader_ref = weakref.ref(reader)
+        del reader
+        gc.collect()
+
+        self.assertIsNone(reader_ref())
+
+    def test_headers_are_interned(self):
+        """Test every row shares the same interned header objects."""
+        csv_path = self._write_csv("name,title\nAlice,Engineer\nBob,Designer\n")
+
+        data = self.reader.read_csv_data(csv_path, 'utf-8')
+
+        first_keys = list(data[0])
+        second_keys = list(data[1])
+        for first, second in zip(first_keys, second_keys):
+            self.assertIs(first, second)
+            self.assertIs(first, sys.intern(first))
+
+    def test_bom_removed_from_headers(self):
+        """Test BOM is stripped from the first header."""
+        csv_path = self._write_csv("\ufeffname,title\nAlice,Engineer\n")
+
+        data = self.reader.read_csv_data(csv_path, 'utf-8')
+
+        self.assertIn('name', data[0])
+
+    def test_bom_removed_for_explicit_utf16(self):
+        """Test BOM kept by an explicit utf-16-le decoder is stripped too."""
+        csv_path = self._write_csv("\ufeffname,title\nAlice,Engineer\n", encoding='utf-16-le')
+
+        data = self.reader.read_csv_data(csv_path, 'utf-16-le')
+
+        self.assertEqual(data, [{'name': 'Alice', 'title': 'Engineer'}])
+
+    def test_ragged_rows_and_blank_lines(self):
+        """Test short/long rows and blank lines match csv.DictReader."""
+        csv_path = self._write_csv("a,b,c\n1,2\n\n4,5,6,7\n")
+
+        data = self.reader.read_csv_data(csv_path, 'utf-8')
+
+        self.assertEqual(len(data), 2)
+        self.assertEqual(data[0], {'a': '1', 'b': '2', 'c': None})
+        self.assertEqual(data[1], {'a': '4', 'b': '5', 'c': '6', None: ['7']})
+
+
+    def test_gc_suspended_while_parsing(self):
+        """Test rows are parsed and built with the cyclic GC off, then restored."""
+        csv_path = self._write_csv('name,title\n"Alice","Engineer"\n')
+        states = []
+        real_reader = csv_reader.csv.reader
+
+        def tracking_reader(*args, **kwargs):
+            for row in real_reader(*args, **kwargs):
+                states.append(csv_reader.gc.isenabled())
+                yield row
+
+        with patch.object(csv_reader.csv, 'reader', tracking_reader):
+            self.reader.read_csv_data(csv_path, 'utf-8')
+
+        self.assertEqual(states, [True, False])
+        self.assertTrue(csv_reader.gc.isenabled())
+
+    def test_quoted_fields_use_csv_parser(self):
+        """Test quoted commas and embedded newlines are preserved."""
+        csv_path = self._write_csv('name,address\n"Doe, John","1 Main St\nApt 2"\n')
+
+        data = self.reader.read_csv_data(csv_path, 'utf-8')
+
+        self.assertEqual(data, [{'name': 'Doe, John', 'address': '1 Main St\nApt 2'}])
+
+    def test_crlf_line_endings(self):
+        """Test Windows line endings are handled by the fast path."""
+        csv_path = self._write_csv("name,title\r\nAlice,Engineer\r\n")
+
+        data = self.reader.read_csv_data(csv_path, 'utf-8')
+
+        self.assertEqual(data, [{'name': 'Alice', 'title': 'Engineer'}])
+
+    def test_row_limit(self):
+        """Test rows up to MAX_CSV_ROWS are accepted and one more is rejected."""
+        csv_path = self._write_csv("id\n1\n2\n\n3\n")
+
+        with patch.object(csv_reader.config, 'MAX_CSV_ROWS', 3):
+            self.assertEqual(len(self.reader.read_csv_data(csv_path, 'utf-8')), 3)
+
+        with patch.object(csv_reader.config, 'MAX_CSV_ROWS', 2):
+            with self.assertRaises(csv_reader.CSVProcessingError) as ctx:
+                self.reader.read_csv_data(csv_path, 'utf-8')
+        self.assertIn('too many rows', str(ctx.exception))
+
+    def test_parallel_chunked_read(self):
+        """Test parallel chunk parsing returns the same rows as a serial read."""
+        lines = ["id,name"] + [f"{i},name{i}" for i in range(1, 200)]
+        csv_path = self._write_csv("\n".join(lines) + "\n")
+        expected = self.reader.read_csv_data(csv_path, 'utf-8')
+
+        with patch.object(csv_reader.config, 'CSV_PARALLEL_THRESHOLD', 0), \
+                patch.object(csv_reader.os, 'cpu_count', return_value=4):
+            data = self.reader.read_csv_data(csv_path, 'utf-8')
+
+        self.assertEqual(data, expected)
+
+    def test_parallel_read_stops_at_row_limit(self):
+        """Test parallel parsing rejects an oversized file from capped chunks."""
+        lines = ["id,name"] + [f"{i},name{i}" for i in range(1, 200)]
+        csv_path = self._write_csv("\n".join(lines) + "\n")
+
+        with patch.object(csv_reader.config, 'CSV_PARALLEL_THRESHOLD', 0), \
+                patch.object(csv_reader.config, 'MAX_CSV_ROWS', 10), \
+                patch.object(csv_reader.os, 'cpu_count', return_value=4):
+            rows = list(self.reader._read_rows_parallel(csv_path, 'utf-8'))
+            with self.assertRaises(csv_reader.CSVProcessingError) as ctx:
+                self.reader.read_csv_data(csv_path, 'utf-8')
+
+        self.assertLess(len(rows), len(lines))
+        self.assertIn('too many rows', str(ctx.exception))
+
+    def test_parallel_read_falls_back_on_error(self):
+        """Test any worker pool failure falls back to the sequential reader."""
+        csv_path = self._write_csv("id,name\n1,a\n2,b\n")
+
+        with patch.object(csv_reader.config, 'CSV_PARALLEL_THRESHOLD', 0), \
+                patch.object(csv_reader.os, 'cpu_count', return_value=4), \
+                patch.object(csv_reader, 'ProcessPoolExecutor', side_effect=RuntimeError("no pool")):
+            data = self.reader.read_csv_data(csv_path, 'utf-8')
+
+        self.assertEqual(data, [{'id': '1', 'name': 'a'}, {'id': '2', 'name': 'b'}])
+
+    def test_chunk_boundaries_end_on_newlines(self):
+        """Test chunk boundaries never split a line."""
+        csv_path = self._write_csv("a,b\n1,2\n333,444\n5,6\n")
+
+        with open(csv_path, 'rb') as f, csv_reader.mmap.mmap(
+                f.fileno(), 0, access=csv_reader.mmap.ACCESS_READ) as mm:
+            boundaries = csv_reader._find_chunk_boundaries(mm, 3)
+            content = mm[:]
+
+        self.assertEqual(boundaries[0], 0)
+        self.assertEqual(boundaries[-1], len(content))
+        for boundary in boundaries[1:-1]:
+            self.assertEqual(content[boundary - 1:boundary], b'\n')
+
+
+class TestMissingElementFiltering(unittest.TestCase):
+    """Test removal of columns that reference missing SVG elements."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.reader = CSVReader()
+
+    def test_split_rows(self):
+        """Test kept and removed columns for uniform and non-uniform rows."""
+        test_cases = [
+            ("uniform", [{'name': 'A', "it's": 'x', 'photo': 'a.png'},
+                         {'name': 'B', "it's": 'y', 'photo': 'b.png'}]),
+            ("surplus values", [{'name': 'A', "it's": 'x', 'photo': 'a.png'},
+                                {'name': 'B', "it's": 'y', 'photo': 'b.png', None: ['z']}]),
+            ("different keys", [{'name': 'A', "it's": 'x', 'photo': 'a.png'},
+                                {'name': 'B', 'other': 'y', 'photo': 'b.png'}]),
+            ("single kept column", [{'name': 'A', 'photo': 'a.png'},
+                                    {'name': 'B', 'photo': 'b.png'}]),
+            ("no kept column", [{'photo': 'a.png'}, {'photo': 'b.png'}]),
+        ]
+
+        for label, data in test_cases:
+            with self.subTest(label):
+                filtered, removed = self.reader.filter_csv_data_by_missing_elements(data, ['photo'])
+                self.assertEqual(filtered, [{k: v for k, v in row.items() if k != 'photo'} for row in data])
+                self.assertEqual(removed, [{'photo': row['photo']} for row in data])
+
+
+class TestRowRangeFiltering(unittest.TestCase):
+    """Test row range selection."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.reader = CSVReader()
+        self.data = [{'id': str(i)} for i in range(1, 11)]  # 10 rows
+
+    def _selected_ids(self, row_range: str):
+        """Return the 1-based ids selected by a range spec."""
+        return [int(row['id']) for row in self.reader.filter_rows_by_range(self.data, row_range)]
+
+    def test_range_patterns(self):
+        """Test ranges, singles, parity and combinations."""
+        test_cases = [
+            ('all', list(range(1, 11))),
+            ('1-5', [1, 2, 3, 4, 5]),
+            ('3,7,9', [3, 7, 9]),
+            ('2,5,8,11', [2, 5, 8]),
+            ('even', [2, 4, 6, 8, 10]),
+            ('ODD', [1, 3, 5, 7, 9]),
+            ('1-3, 9 ,8-20', [1, 2, 3, 8, 9, 10]),
+            ('odd,2', [1, 2, 3, 5, 7, 9]),
+            ('1 - 3', [1, 2, 3]),
+            ('2-4, 7', [2, 3, 4, 7]),
+        ]
+
+        for row_range, expected in test_cases:
+            with self.subTest(row_range=row_range):
+                self.assertEqual(self._selected_ids(row_range), expected)
+
+    def test_invalid_parts_are_ignored(self):
+        """Test malformed parts are skipped without raising."""
+        self.assertEqual(self._selected_ids('1-x,abc,-4,2'), [2])
+
+    def test_repeated_spec_reuses_parsed_result(self):
+        """Test the same spec applies correctly to differently sized data."""
+        self.assertEqual(self._selected_ids('even'), [2, 4, 6, 8, 10])
+        short_data = self.data[:3]
+        filtered = self.reader.filter_rows_by_range(short_data, 'even')
+        self.assertEqual([row['id'] for row in filtered], ['2'])
+
+
+if __name__ == '__main__':
+    unittest.main()
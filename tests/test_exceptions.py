@@ -0,0 +1,61 @@
+"""
+Test cases for InkAutoGen exception classes.
+
+Tests exception functionality including:
+- Context details collected from keyword arguments
+- The shared empty context for errors without details
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules import exceptions
+
+
+class TestErrorContext(unittest.TestCase):
+    """Test context handling on exception construction."""
+
+    def test_errors_without_details_share_empty_context(self):
+        """Test no dict is allocated when no detail is given."""
+        errors = [
+            exceptions.InkAutoGenError("plain"),
+            exceptions.CSVProcessingError("csv"),
+            exceptions.SVGTemplateError("svg"),
+            exceptions.FileSecurityError("security"),
+            exceptions.ExportError("export"),
+            exceptions.ValidationError("validation"),
+            exceptions.PerformanceError("performance"),
+            exceptions.ConfigurationError("config"),
+        ]
+
+        for error in errors:
+            with self.subTest(error=type(error).__name__):
+                self.assertIs(error.context, exceptions._EMPTY_CONTEXT)
+                with self.assertRaises(TypeError):
+                    error.context['key'] = 'value'
+
+    def test_details_added_to_copy_of_given_context(self):
+        """Test details extend a copy of the caller's context dict."""
+        given = {'row': 3}
+
+        error = exceptions.CSVProcessingError("bad row", file_path="data.csv", context=given)
+
+        self.assertEqual(error.context, {'row': 3, 'file_path': 'data.csv'})
+        self.assertEqual(given, {'row': 3})
+        error.context['extra'] = True
+        self.assertEqual(str(error), "[CSV_ERROR] bad row")
+
+    def test_none_checked_details(self):
+        """Test falsy values are kept for details compared against None."""
+        error = exceptions.PerformanceError("limit", current_value=0, limit=0)
+
+        self.assertEqual(error.context, {'current_value': '0', 'limit': '0'})
+
+
+if __name__ == '__main__':
+    unittest.main()
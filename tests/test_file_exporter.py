@@ -0,0 +1,905 @@
+"""
+Test cases for file export operations.
+
+Tests FileExporter functionality including:
+- Export preparation and overwrite handling
+- Batch export through the Inkscape shell
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import shutil
+import logging
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules import file_exporter
+from modules.file_exporter import FileExporter, PDFMerger, TempFileManager
+
+try:
+    from pypdf import PdfReader, PdfWriter
+    PYPDF_AVAILABLE = True
+except ImportError:
+    PYPDF_AVAILABLE = False
+
+try:
+    import pikepdf
+    PIKEPDF_AVAILABLE = True
+except ImportError:
+    PIKEPDF_AVAILABLE = False
+
+
+SVG_CONTENT = '<?xml version="1.0" encoding="UTF-8"?>\n<svg xmlns="http://www.w3.org/2000/svg"/>\n'
+
+# Stand-in for `inkscape --shell`: writes its pid to each export-filename
+FAKE_INKSCAPE_SHELL = f"""#!{sys.executable}
+import os, sys
+sys.stdout.write("Inkscape interactive shell mode\\n> ")
+sys.stdout.flush()
+for line in sys.stdin:
+    if line.strip() == "quit":
+        break
+    for action in line.split(";"):
+        name, _, value = action.strip().partition(":")
+        if name == "export-filename":
+            with open(value, "w") as f:
+                f.write(str(os.getpid()))
+    sys.stdout.write("> ")
+    sys.stdout.flush()
+"""
+
+
+class TestExportValidation(unittest.TestCase):
+    """Test export parameter validation."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.svg_path = os.path.join(self.temp_dir, 'input.svg')
+        Path(self.svg_path).write_bytes(SVG_CONTENT.encode('utf-8'))
+        self.exporter = FileExporter(allow_mock=True)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_invalid_parameters_raise_validation_error(self):
+        """Test each invalid parameter is reported with its field name."""
+        output_path = os.path.join(self.temp_dir, 'out.png')
+        test_cases = [
+            ((os.path.join(self.temp_dir, 'missing.svg'), output_path, 'png', 300), 'input_svg_path'),
+            ((self.svg_path, '', 'png', 300), 'output_path'),
+            ((self.svg_path, output_path, 'gif', 300), 'export_format'),
+            ((self.svg_path, output_path, 'png', 50), 'dpi'),
+            ((self.svg_path, output_path, 'png', '300'), 'dpi'),
+        ]
+
+        for args, field_name in test_cases:
+            with self.subTest(field_name=field_name, args=args):
+                with self.assertRaises(file_exporter.ValidationError) as ctx:
+                    self.exporter._validate_export_parameters(*args)
+                self.assertEqual(ctx.exception.context['field_name'], field_name)
+
+    def test_output_directory_validated_once(self):
+        """Test only the file name is revalidated for a known output directory."""
+        validator = file_exporter.FileValidator
+        first = os.path.join(self.temp_dir, 'out1.png')
+        second = os.path.join(self.temp_dir, 'out2.png')
+
+        with patch.object(validator, 'validate_file_path', wraps=validator.validate_file_path) as full_check:
+            self.exporter._validate_export_parameters(self.svg_path, first, 'png', 300)
+            self.exporter._validate_export_parameters(self.svg_path, second, 'png', 300)
+        self.assertEqual(full_check.call_count, 1)
+
+        security = sys.modules[validator.__module__]
+        with self.assertRaises(security.FileSecurityError):
+            self.exporter._validate_export_parameters(self.svg_path, os.path.join(self.temp_dir, 'bad name.png'),
+                                                      'png', 300)
+
+    def test_disabled_log_levels_are_not_called(self):
+        """Test info/debug messages are skipped when the logger level is higher."""
+        logger = logging.getLogger('test_file_exporter.quiet')
+        logger.setLevel(logging.WARNING)
+        exporter = FileExporter(logger, allow_mock=True)
+
+        with patch.object(logger, 'info') as info, patch.object(logger, 'debug') as debug:
+            exporter.export_file(self.svg_path, os.path.join(self.temp_dir, 'out.svg'), 'svg')
+
+        info.assert_not_called()
+        debug.assert_not_called()
+
+    def test_prepare_export_creates_directory_and_respects_overwrite(self):
+        """Test output directories are created and existing files skipped."""
+        output_path = os.path.join(self.temp_dir, 'nested', 'out.svg')
+
+        self.assertTrue(self.exporter._prepare_export(self.svg_path, output_path, 'svg', 300, False))
+        self.assertTrue(os.path.isdir(os.path.dirname(output_path)))
+
+        Path(output_path).write_bytes(b'')
+        self.assertFalse(self.exporter._prepare_export(self.svg_path, output_path, 'svg', 300, False))
+        self.assertTrue(self.exporter._prepare_export(self.svg_path, output_path, 'svg', 300, True))
+
+
+# Stand-in shells that answer prompts but never write output, or exit on
+# the first command
+IDLE_INKSCAPE_SHELL = FAKE_INKSCAPE_SHELL.replace('name == "export-filename"', 'False')
+EXITING_INKSCAPE_SHELL = FAKE_INKSCAPE_SHELL.replace('for line in sys.stdin:', 'for line in sys.stdin:\n    break')
+
+
+class TestInkscapeCommand(unittest.TestCase):
+    """Test direct Inkscape invocation."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.svg_path = os.path.join(self.temp_dir, 'input.svg')
+        self.output_path = os.path.join(self.temp_dir, 'out.png')
+        Path(self.svg_path).write_bytes(SVG_CONTENT.encode('utf-8'))
+        self.exporter = FileExporter(allow_mock=True)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_command_line_and_process_options(self):
+        """Test the export runs the executable with inkex-equivalent options."""
+        with patch.object(file_exporter.shutil, 'which', return_value='/usr/bin/inkscape'), \
+                patch.object(file_exporter.subprocess, 'run') as run:
+            self.exporter._export_via_inkscape(self.svg_path, self.output_path, 'png', 150)
+
+        self.assertEqual(run.call_args.args[0], [
+            '/usr/bin/inkscape', self.svg_path,
+            '--export-type=png', f'--export-filename={self.output_path}', '--export-dpi=150'
+        ])
+        self.assertEqual(run.call_args.kwargs['stdout'], file_exporter.subprocess.DEVNULL)
+        self.assertTrue(run.call_args.kwargs['start_new_session'])
+
+    def test_executable_looked_up_once(self):
+        """Test PATH is searched for Inkscape only on the first export."""
+        with patch.object(file_exporter.shutil, 'which', return_value='/usr/bin/inkscape') as which, \
+                patch.object(file_exporter.subprocess, 'run'):
+            self.exporter._export_via_inkscape(self.svg_path, self.output_path, 'pdf', 300)
+            self.exporter._export_via_inkscape(self.svg_path, self.output_path, 'pdf', 300)
+
+        which.assert_called_once_with(file_exporter.config.INKSCAPE_EXECUTABLE)
+
+    def test_failure_reports_stderr(self):
+        """Test a failing export raises ExportError with Inkscape's stderr."""
+        error = file_exporter.subprocess.CalledProcessError(1, 'inkscape', stderr=b'x' * 5000 + b'bad file')
+
+        with patch.object(file_exporter.shutil, 'which', return_value='/usr/bin/inkscape'), \
+                patch.object(file_exporter.subprocess, 'run', side_effect=error):
+            with self.assertRaises(file_exporter.ExportError) as ctx:
+                self.exporter._export_via_inkscape(self.svg_path, self.output_path, 'pdf', 300)
+
+        self.assertTrue(str(ctx.exception).endswith('bad file'))
+        self.assertLess(len(str(ctx.exception)), 4200)
+
+
+    @unittest.skipUnless(file_exporter._PERSISTENT_SHELL_SUPPORTED, "persistent shell needs POSIX pipes")
+    def test_persistent_shell_reused_across_exports(self):
+        """Test single exports share one Inkscape shell until close()."""
+        fake_inkscape = os.path.join(self.temp_dir, 'inkscape')
+        Path(fake_inkscape).write_text(FAKE_INKSCAPE_SHELL)
+        os.chmod(fake_inkscape, 0o755)
+        second_output = os.path.join(self.temp_dir, 'out2.png')
+
+        with patch.object(file_exporter.shutil, 'which', return_value=fake_inkscape), \
+                patch.object(file_exporter.subprocess, 'run') as run:
+            with FileExporter(allow_mock=True) as exporter:
+                exporter._export_via_inkscape(self.svg_path, self.output_path, 'png', 150)
+                exporter._export_via_inkscape(self.svg_path, second_output, 'png', 150)
+                shell = exporter._shell
+
+        run.assert_not_called()
+        self.assertEqual(Path(self.output_path).read_text(), str(shell.pid))
+        self.assertEqual(Path(second_output).read_text(), str(shell.pid))
+        self.assertIsNone(exporter._shell)
+        self.assertEqual(shell.returncode, 0)
+
+    def _install_shell(self, script):
+        """Write a fake Inkscape shell script and return its path."""
+        fake_inkscape = os.path.join(self.temp_dir, 'inkscape')
+        Path(fake_inkscape).write_text(script)
+        os.chmod(fake_inkscape, 0o755)
+        return fake_inkscape
+
+    @unittest.skipUnless(file_exporter._PERSISTENT_SHELL_SUPPORTED, "persistent shell needs POSIX pipes")
+    def test_broken_shell_not_restarted(self):
+        """Test a shell that dies mid-export is not started again for later files."""
+        fake_inkscape = self._install_shell(EXITING_INKSCAPE_SHELL)
+
+        with patch.object(file_exporter.shutil, 'which', return_value=fake_inkscape), \
+                patch.object(file_exporter.subprocess, 'run') as run, \
+                patch.object(file_exporter.subprocess, 'Popen', wraps=file_exporter.subprocess.Popen) as popen:
+            with FileExporter(allow_mock=True) as exporter:
+                for _ in range(3):
+                    exporter._export_via_inkscape(self.svg_path, self.output_path, 'png', 150)
+
+        self.assertEqual(popen.call_count, 1)
+        self.assertEqual(run.call_count, 3)
+
+    @unittest.skipUnless(file_exporter._PERSISTENT_SHELL_SUPPORTED, "persistent shell needs POSIX pipes")
+    def test_shell_without_output_given_up_after_limit(self):
+        """Test repeated missing outputs stop shell use after INKSCAPE_SHELL_MAX_FAILURES."""
+        fake_inkscape = self._install_shell(IDLE_INKSCAPE_SHELL)
+
+        with patch.object(file_exporter.shutil, 'which', return_value=fake_inkscape), \
+                patch.object(file_exporter.config, 'INKSCAPE_SHELL_MAX_FAILURES', 2), \
+                patch.object(file_exporter.subprocess, 'run') as run, \
+                patch.object(file_exporter.subprocess, 'Popen', wraps=file_exporter.subprocess.Popen) as popen:
+            with FileExporter(allow_mock=True) as exporter:
+                for _ in range(4):
+                    exporter._export_via_inkscape(self.svg_path, self.output_path, 'png', 150)
+
+        self.assertEqual(popen.call_count, 2)
+        self.assertEqual(run.call_count, 4)
+
+    def test_output_signature_sees_same_tick_rewrite(self):
+        """Test a rewrite that keeps the mtime still changes the output signature."""
+        Path(self.output_path).write_bytes(b'old')
+        os.utime(self.output_path, ns=(1_000_000_000_000_000_000, 1_000_000_000_000_000_000))
+        before = file_exporter._output_signature(self.output_path)
+
+        Path(self.output_path).write_bytes(b'new output')
+        os.utime(self.output_path, ns=(1_000_000_000_000_000_000, 1_000_000_000_000_000_000))
+
+        self.assertNotEqual(file_exporter._output_signature(self.output_path), before)
+        self.assertIsNone(file_exporter._output_signature(self.svg_path + '.missing'))
+
+
+class TestSVGDataExport(unittest.TestCase):
+    """Test export of in-memory SVG data."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.exporter = FileExporter(allow_mock=True)
+        self.svg_data = b'<svg xmlns="http://www.w3.org/2000/svg"/>'
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_svg_format_written_directly(self):
+        """Test SVG output is written without Inkscape or temporary files."""
+        output_path = os.path.join(self.temp_dir, 'out.svg')
+
+        with patch.object(file_exporter.subprocess, 'run') as run:
+            self.assertTrue(self.exporter.export_svg_data(self.svg_data, output_path, 'svg'))
+
+        run.assert_not_called()
+        self.assertEqual(Path(output_path).read_bytes(), self.svg_data)
+
+    def test_raster_export_uses_pipe_without_shell(self):
+        """Test raster data goes through inkscape --pipe with an encoding declaration."""
+        output_path = os.path.join(self.temp_dir, 'out.png')
+        result = file_exporter.subprocess.CompletedProcess([], 0, stdout=b'PNGDATA')
+
+        with patch.object(file_exporter.config, 'INKSCAPE_PERSISTENT_SHELL', False), \
+                patch.object(file_exporter.shutil, 'which', return_value='/usr/bin/inkscape'), \
+                patch.object(file_exporter.subprocess, 'run', return_value=result) as run, \
+                patch.object(file_exporter.tempfile, 'mkstemp') as mkstemp:
+            self.assertTrue(self.exporter.export_svg_data(self.svg_data, output_path, 'png', 150))
+
+        mkstemp.assert_not_called()
+        self.assertEqual(run.call_args.args[0], [
+            '/usr/bin/inkscape', '--pipe', '--export-type=png', '--export-filename=-', '--export-dpi=150'
+        ])
+        self.assertTrue(run.call_args.kwargs['input'].startswith(file_exporter._UTF8_XML_DECLARATION))
+        self.assertEqual(Path(output_path).read_bytes(), b'PNGDATA')
+
+    def test_empty_pipe_output_raises(self):
+        """Test an export that produces no data is reported as an error."""
+        output_path = os.path.join(self.temp_dir, 'out.pdf')
+        result = file_exporter.subprocess.CompletedProcess([], 0, stdout=b'')
+
+        with patch.object(file_exporter.config, 'INKSCAPE_PERSISTENT_SHELL', False), \
+                patch.object(file_exporter.shutil, 'which', return_value='/usr/bin/inkscape'), \
+                patch.object(file_exporter.subprocess, 'run', return_value=result):
+            with self.assertRaises(file_exporter.ExportError):
+                self.exporter.export_svg_data(self.svg_data, output_path, 'pdf')
+
+        self.assertFalse(os.path.exists(output_path))
+
+
+class TestSVGEncoding(unittest.TestCase):
+    """Test XML declaration handling before raster export."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.svg_path = os.path.join(self.temp_dir, 'input.svg')
+        self.exporter = FileExporter(allow_mock=True)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_declaration_handling(self):
+        """Test declarations are kept, replaced or inserted as needed."""
+        declaration = b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        test_cases = [
+            (SVG_CONTENT.encode('utf-8'), SVG_CONTENT.encode('utf-8')),
+            (b"<?xml version='1.0' encoding = 'utf-8'?><svg/>", b"<?xml version='1.0' encoding = 'utf-8'?><svg/>"),
+            (b'<?xml version="1.0"?>\n<svg encoding="x"/>', declaration + b'\n<svg encoding="x"/>'),
+            (b'<?xml version="1.0"?>\n<svg/>', declaration + b'\n<svg/>'),
+            (b'<svg/>', declaration + b'\n<svg/>'),
+            (b'\xef\xbb\xbf<svg/>', b'\xef\xbb\xbf' + declaration + b'\n<svg/>'),
+        ]
+
+        for original, expected in test_cases:
+            with self.subTest(original=original):
+                Path(self.svg_path).write_bytes(original)
+                self.exporter._ensure_svg_encoding(self.svg_path, 'png')
+                self.assertEqual(Path(self.svg_path).read_bytes(), expected)
+
+    def test_verified_file_is_not_reread(self):
+        """Test an unchanged file is only read once per exporter."""
+        Path(self.svg_path).write_bytes(SVG_CONTENT.encode('utf-8'))
+        self.exporter._ensure_svg_encoding(self.svg_path, 'png')
+
+        with patch('builtins.open', wraps=open) as mocked_open:
+            self.exporter._ensure_svg_encoding(self.svg_path, 'png')
+        mocked_open.assert_not_called()
+
+        Path(self.svg_path).write_bytes(b'<svg/>')
+        self.exporter._ensure_svg_encoding(self.svg_path, 'png')
+        self.assertTrue(Path(self.svg_path).read_bytes().startswith(b'<?xml'))
+
+    def test_prefetch_marks_declared_files_verified(self):
+        """Test prefetching records only files that already declare an encoding."""
+        declared = os.path.join(self.temp_dir, 'declared.svg')
+        Path(declared).write_bytes(SVG_CONTENT.encode('utf-8'))
+        Path(self.svg_path).write_bytes(b'<svg/>')
+
+        self.exporter._prefetch_svg_encodings([declared, self.svg_path, declared])
+
+        self.assertEqual(self.exporter._encoding_ok, {self.exporter._svg_file_key(declared)})
+
+
+class TestFastCopy(unittest.TestCase):
+    """Test the file copy helper."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.src = os.path.join(self.temp_dir, 'src.svg')
+        self.dst = os.path.join(self.temp_dir, 'dst.svg')
+        Path(self.src).write_bytes(SVG_CONTENT.encode('utf-8'))
+        os.utime(self.src, (1_000_000_000, 1_000_000_000))
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_copy_preserves_content_and_mtime(self):
+        """Test copies match shutil.copy2 results."""
+        Path(self.dst).write_bytes(b'old content that is longer than the source file' * 10)
+
+        file_exporter._fast_copy(self.src, self.dst)
+
+        self.assertEqual(Path(self.dst).read_bytes(), Path(self.src).read_bytes())
+        self.assertEqual(os.stat(self.dst).st_mtime, 1_000_000_000)
+        self.assertFalse(os.path.samefile(self.src, self.dst))
+
+    @unittest.skipUnless(file_exporter._SENDFILE_COPY, "os.sendfile cannot write to files here")
+    def test_sendfile_copy_without_reflink(self):
+        """Test the sendfile loop copies the whole file when cloning is unavailable."""
+        with patch.object(file_exporter, 'fcntl', None), \
+                patch.object(file_exporter.os, 'sendfile', wraps=os.sendfile) as sendfile:
+            file_exporter._fast_copy(self.src, self.dst)
+
+        sendfile.assert_called()
+        self.assertEqual(Path(self.dst).read_bytes(), Path(self.src).read_bytes())
+
+    def test_same_file_refused(self):
+        """Test copying a file onto itself raises and leaves it intact."""
+        original = Path(self.src).read_bytes()
+        link = os.path.join(self.temp_dir, 'link.svg')
+        os.link(self.src, link)
+
+        for dst in (self.src, link):
+            with self.subTest(dst=dst):
+                with self.assertRaises(shutil.SameFileError):
+                    file_exporter._fast_copy(self.src, dst)
+                self.assertEqual(Path(self.src).read_bytes(), original)
+
+    def test_svg_export_onto_itself_keeps_source(self):
+        """Test exporting an SVG to its own path fails without emptying it."""
+        original = Path(self.src).read_bytes()
+
+        with self.assertRaises(file_exporter.ExportError):
+            FileExporter(allow_mock=True).export_file(self.src, self.src, 'svg')
+
+        self.assertEqual(Path(self.src).read_bytes(), original)
+
+
+class TestBatchExport(unittest.TestCase):
+    """Test batch export functionality."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_dir = os.path.join(self.temp_dir, 'output')
+        self.exporter = FileExporter(allow_mock=True)
+        self.inputs = []
+        for idx in range(3):
+            svg_path = os.path.join(self.temp_dir, f'input{idx}.svg')
+            with open(svg_path, 'w', encoding='utf-8') as f:
+                f.write(SVG_CONTENT)
+            self.inputs.append(svg_path)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_svg_batch_copies_files(self):
+        """Test SVG batches use the direct copy path."""
+        exported = self.exporter.batch_export(self.inputs, self.output_dir, 'svg')
+
+        self.assertEqual(exported, [os.path.join(self.output_dir, f'output_{i}.svg') for i in (1, 2, 3)])
+        for path in exported:
+            self.assertTrue(os.path.exists(path))
+
+    def test_filename_patterns(self):
+        """Test plain and format-spec filename patterns name outputs the same way as str.format."""
+        test_cases = [
+            ('output_{}', ['output_1', 'output_2', 'output_3']),
+            ('card-{}-front', ['card-1-front', 'card-2-front', 'card-3-front']),
+            ('page_{:03d}', ['page_001', 'page_002', 'page_003']),
+        ]
+
+        for pattern, expected in test_cases:
+            with self.subTest(pattern=pattern):
+                exported = self.exporter.batch_export(self.inputs, self.output_dir, 'svg', filename_pattern=pattern)
+                self.assertEqual(exported, [os.path.join(self.output_dir, f'{name}.svg') for name in expected])
+
+    def test_existing_outputs_skipped_without_export(self):
+        """Test outputs listed in the directory are skipped when overwrite is off."""
+        os.makedirs(self.output_dir)
+        existing = os.path.join(self.output_dir, 'output_2.svg')
+        Path(existing).write_bytes(b'keep')
+
+        with patch.object(FileExporter, 'export_file', wraps=self.exporter.export_file) as export_file:
+            exported = self.exporter.batch_export(self.inputs, self.output_dir, 'svg', overwrite=False)
+
+        self.assertEqual(export_file.call_count, 2)
+        self.assertEqual(exported, [os.path.join(self.output_dir, f'output_{i}.svg') for i in (1, 3)])
+        self.assertEqual(Path(existing).read_bytes(), b'keep')
+
+    def test_shell_batch_runs_inkscape_once(self):
+        """Test raster batches share one shell process and keep input order."""
+        def fake_run(cmd, input, **kwargs):
+            # Produce every output except the second one
+            for line in input.decode('utf-8').splitlines():
+                for action in line.split('; '):
+                    if action.startswith('export-filename:') and 'output_2' not in action:
+                        Path(action.split(':', 1)[1]).write_bytes(b'png')
+
+        with patch.object(file_exporter.shutil, 'which', return_value='/usr/bin/inkscape'), \
+                patch.object(file_exporter.subprocess, 'run', side_effect=fake_run) as run, \
+                patch.object(FileExporter, '_export_via_inkscape', return_value=True) as retry:
+            exported = self.exporter.batch_export(self.inputs, self.output_dir, 'png', dpi=150,
+                                                  max_workers=1)
+
+        self.assertEqual(run.call_count, 1)
+        self.assertEqual(run.call_args.args[0], ['/usr/bin/inkscape', '--shell'])
+        self.assertEqual(run.call_args.kwargs['stdout'], file_exporter.subprocess.DEVNULL)
+        script = run.call_args.kwargs['input'].decode('utf-8')
+        self.assertIn('export-dpi:150', script)
+        self.assertEqual(script.count('export-do'), 3)
+        retry.assert_called_once()
+        self.assertEqual(exported, [os.path.join(self.output_dir, f'output_{i}.png') for i in (1, 2, 3)])
+
+    def test_shell_batch_splits_across_workers(self):
+        """Test jobs are split across concurrent shell processes."""
+        def fake_run(cmd, input, **kwargs):
+            for line in input.decode('utf-8').splitlines():
+                for action in line.split('; '):
+                    if action.startswith('export-filename:'):
+                        Path(action.split(':', 1)[1]).write_bytes(b'pdf')
+
+        with patch.object(file_exporter.shutil, 'which', return_value='/usr/bin/inkscape'), \
+                patch.object(file_exporter.subprocess, 'run', side_effect=fake_run) as run:
+            exported = self.exporter.batch_export(self.inputs, self.output_dir, 'pdf', max_workers=2)
+
+        self.assertEqual(run.call_count, 2)
+        scripts = [call.kwargs['input'].decode('utf-8') for call in run.call_args_list]
+        self.assertEqual(sum(script.count('export-do') for script in scripts), 3)
+        self.assertEqual(exported, [os.path.join(self.output_dir, f'output_{i}.pdf') for i in (1, 2, 3)])
+
+
+@unittest.skipUnless(PYPDF_AVAILABLE, "pypdf not installed")
+class TestPDFMerger(unittest.TestCase):
+    """Test PDF merging."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.merger = PDFMerger()
+        self.pdf_files = []
+        for idx, page_count in enumerate((1, 2, 3)):
+            writer = PdfWriter()
+            for _ in range(page_count):
+                writer.add_blank_page(width=200, height=200)
+            pdf_path = os.path.join(self.temp_dir, f'doc{idx}.pdf')
+            with open(pdf_path, 'wb') as f:
+                writer.write(f)
+            self.pdf_files.append(pdf_path)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_pypdf_merge_keeps_all_pages(self):
+        """Test pages from every input are merged in order."""
+        output_path = os.path.join(self.temp_dir, 'merged.pdf')
+
+        self.assertTrue(self.merger._try_pypdf2_merge(self.pdf_files, output_path))
+
+        self.assertEqual(len(PdfReader(output_path).pages), 6)
+
+    def test_single_pdf_copied_not_linked(self):
+        """Test a single input is copied to an independent output file."""
+        copied_path = os.path.join(self.temp_dir, 'copied.pdf')
+
+        self.assertTrue(self.merger.merge_pdfs(self.pdf_files[:1], copied_path))
+
+        self.assertFalse(os.path.samefile(self.pdf_files[0], copied_path))
+
+    def test_single_pdf_onto_itself_keeps_source(self):
+        """Test merging one PDF into its own path fails without deleting it."""
+        pdf_path = self.pdf_files[0]
+        original = Path(pdf_path).read_bytes()
+
+        with self.assertRaises(file_exporter.ExportError):
+            self.merger.merge_pdfs([pdf_path], pdf_path)
+        self.assertEqual(Path(pdf_path).read_bytes(), original)
+
+    def test_single_pdf_strategies_copy_without_merging(self):
+        """Test every merge strategy copies a one-file list instead of merging it."""
+        strategies = ['_try_pikepdf_merge', '_try_pypdf2_merge', '_try_pdfunite_merge', '_try_qpdf_merge']
+
+        with patch.object(file_exporter, '_PDFUNITE', '/usr/bin/pdfunite'), \
+                patch.object(file_exporter, '_QPDF', '/usr/bin/qpdf'), \
+                patch.object(file_exporter.subprocess, 'run') as run:
+            for strategy in strategies:
+                with self.subTest(strategy):
+                    output_path = os.path.join(self.temp_dir, f'{strategy}.pdf')
+                    self.assertTrue(getattr(self.merger, strategy)(self.pdf_files[:1], output_path))
+                    self.assertEqual(Path(output_path).read_bytes(), Path(self.pdf_files[0]).read_bytes())
+
+        run.assert_not_called()
+
+    def test_bookmarks_only_imported_on_request(self):
+        """Test input outlines are copied only with preserve_bookmarks."""
+        writer = PdfWriter()
+        writer.add_blank_page(width=200, height=200)
+        writer.add_outline_item('Chapter', 0)
+        with open(self.pdf_files[0], 'wb') as f:
+            writer.write(f)
+        output_path = os.path.join(self.temp_dir, 'merged.pdf')
+
+        for preserve_bookmarks, expected_count in ((False, 0), (True, 1)):
+            with self.subTest(preserve_bookmarks=preserve_bookmarks):
+                self.assertTrue(self.merger._try_pypdf2_merge(self.pdf_files, output_path, preserve_bookmarks))
+                self.assertEqual(len(PdfReader(output_path).outline), expected_count)
+
+    def test_native_tool_preferred_for_larger_merges(self):
+        """Test qpdf is tried first and PyPDF2 is not needed when it succeeds."""
+        output_path = os.path.join(self.temp_dir, 'merged.pdf')
+
+        def fake_run(cmd, **kwargs):
+            Path(cmd[-1]).write_bytes(b'%PDF')
+
+        with patch.object(file_exporter, '_QPDF', '/usr/bin/qpdf'), \
+                patch.object(file_exporter.subprocess, 'run', side_effect=fake_run) as run, \
+                patch.object(PDFMerger, '_try_pypdf2_merge') as pypdf_merge:
+            self.assertTrue(self.merger.merge_pdfs(self.pdf_files, output_path))
+
+        self.assertEqual(run.call_args.args[0][:-1], ['/usr/bin/qpdf', '--empty', '--pages'] + self.pdf_files + ['--'])
+        self.assertNotEqual(run.call_args.args[0][-1], output_path)
+        pypdf_merge.assert_not_called()
+        self.assertEqual(Path(output_path).read_bytes(), b'%PDF')
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ['doc0.pdf', 'doc1.pdf', 'doc2.pdf', 'merged.pdf'])
+
+    @unittest.skipUnless(PIKEPDF_AVAILABLE, "pikepdf not installed")
+    def test_pikepdf_merge_preferred_over_pypdf(self):
+        """Test pikepdf merges all pages and PyPDF2 is only used for bookmarks."""
+        output_path = os.path.join(self.temp_dir, 'merged.pdf')
+
+        with patch.object(file_exporter, '_QPDF', None), patch.object(file_exporter, '_PDFTK', None), \
+                patch.object(PDFMerger, '_try_pypdf2_merge', return_value=True) as pypdf_merge:
+            self.assertTrue(self.merger.merge_pdfs(self.pdf_files, output_path))
+            pypdf_merge.assert_not_called()
+            self.assertEqual(len(PdfReader(output_path).pages), 6)
+
+            self.assertTrue(self.merger.merge_pdfs(self.pdf_files, output_path, preserve_bookmarks=True))
+            pypdf_merge.assert_called_once()
+
+    def test_qpdf_tried_before_pdfunite(self):
+        """Test small merges fall back to qpdf before pdfunite when PyPDF2 fails."""
+        output_path = os.path.join(self.temp_dir, 'merged.pdf')
+
+        def fake_run(cmd, **kwargs):
+            Path(cmd[-1]).write_bytes(b'%PDF')
+
+        with patch.object(file_exporter, '_QPDF', '/usr/bin/qpdf'), \
+                patch.object(file_exporter, 'pikepdf', None), \
+                patch.object(file_exporter, 'PdfWriter', None), \
+                patch.object(file_exporter.subprocess, 'run', side_effect=fake_run) as run, \
+                patch.object(PDFMerger, '_try_pdfunite_merge') as pdfunite_merge:
+            self.assertTrue(self.merger.merge_pdfs(self.pdf_files[:2], output_path))
+
+        self.assertEqual(run.call_count, 1)
+        self.assertEqual(run.call_args.args[0][0], '/usr/bin/qpdf')
+        pdfunite_merge.assert_not_called()
+
+    def test_merge_command_stderr_logged_on_failure(self):
+        """Test tool output is discarded on success and stderr is logged on failure."""
+        logger = MagicMock()
+        merger = PDFMerger(logger)
+        output_path = os.path.join(self.temp_dir, 'merged.pdf')
+        error = file_exporter.subprocess.CalledProcessError(2, 'qpdf', stderr=b'qpdf: damaged file')
+
+        with patch.object(file_exporter, '_QPDF', '/usr/bin/qpdf'), \
+                patch.object(file_exporter.subprocess, 'run', side_effect=error) as run:
+            self.assertFalse(merger._try_qpdf_merge(self.pdf_files, output_path))
+
+        self.assertEqual(run.call_args.kwargs['stdout'], file_exporter.subprocess.DEVNULL)
+        self.assertNotIn('text', run.call_args.kwargs)
+        self.assertTrue(os.path.isabs(run.call_args.args[0][0]))
+        self.assertFalse(run.call_args.kwargs['close_fds'])
+        logged = [c.args[0] for c in logger.error.call_args_list]
+        self.assertIn('qpdf output: qpdf: damaged file', logged)
+
+    def test_long_qpdf_file_list_passed_in_argument_file(self):
+        """Test very long file lists reach qpdf through an @file."""
+        output_path = os.path.join(self.temp_dir, 'merged.pdf')
+        seen_args = []
+
+        def fake_run(cmd, **kwargs):
+            with open(cmd[1][1:], encoding='utf-8') as f:
+                seen_args.extend(f.read().splitlines())
+            Path(seen_args[-1]).write_bytes(b'%PDF')
+
+        with patch.object(file_exporter, '_QPDF', '/usr/bin/qpdf'), \
+                patch.object(file_exporter.config, 'PDF_MERGE_ARGFILE_THRESHOLD', 10), \
+                patch.object(file_exporter.subprocess, 'run', side_effect=fake_run) as run:
+            self.assertTrue(self.merger._try_qpdf_merge(self.pdf_files, output_path))
+
+        self.assertEqual(len(run.call_args.args[0]), 2)
+        self.assertTrue(run.call_args.args[0][1].startswith('@'))
+        self.assertEqual(seen_args[:-1], ['--empty', '--pages'] + self.pdf_files + ['--'])
+        self.assertFalse(os.path.exists(run.call_args.args[0][1][1:]))
+        self.assertEqual(Path(output_path).read_bytes(), b'%PDF')
+
+    def test_merge_command_without_output_fails(self):
+        """Test a tool that exits cleanly without writing output is a failed merge."""
+        output_path = os.path.join(self.temp_dir, 'merged.pdf')
+
+        with patch.object(file_exporter, '_PDFUNITE', '/usr/bin/pdfunite'), \
+                patch.object(file_exporter.subprocess, 'run'):
+            self.assertFalse(self.merger._try_pdfunite_merge(self.pdf_files, output_path))
+
+        self.assertFalse(os.path.exists(output_path))
+
+    def test_successful_merge_command_skips_stat(self):
+        """Test a successful tool run is trusted without stat calls when info logging is off."""
+        output_path = os.path.join(self.temp_dir, 'merged.pdf')
+
+        def fake_run(cmd, **kwargs):
+            Path(cmd[-1]).write_bytes(b'%PDF')
+
+        with patch.object(file_exporter, '_PDFUNITE', '/usr/bin/pdfunite'), \
+                patch.object(file_exporter.subprocess, 'run', side_effect=fake_run), \
+                patch.object(file_exporter.os, 'stat', wraps=os.stat) as stat:
+            self.assertTrue(self.merger._try_pdfunite_merge(self.pdf_files, output_path))
+
+        stat.assert_not_called()
+        self.assertEqual(Path(output_path).read_bytes(), b'%PDF')
+
+    def test_chunked_merge_keeps_page_order(self):
+        """Test large merges split into chunks still produce every page in order."""
+        output_path = os.path.join(self.temp_dir, 'merged.pdf')
+        pdf_files = self.pdf_files * 2
+
+        with patch.object(file_exporter, '_QPDF', None), patch.object(file_exporter, '_PDFTK', None), \
+                patch.object(file_exporter, 'pikepdf', None), \
+                patch.object(file_exporter.config, 'PDF_MERGE_CHUNK_THRESHOLD', 2), \
+                patch.object(file_exporter.config, 'PDF_MERGE_CHUNK_SIZE', 2):
+            self.assertTrue(self.merger.merge_pdfs(pdf_files, output_path))
+
+        self.assertEqual(len(PdfReader(output_path).pages), 12)
+
+    def test_chunked_merge_failure_falls_through(self):
+        """Test an error in the chunked merge lets later strategies run."""
+        output_path = os.path.join(self.temp_dir, 'merged.pdf')
+
+        with patch.object(file_exporter, '_QPDF', None), patch.object(file_exporter, '_PDFTK', None), \
+                patch.object(file_exporter, 'pikepdf', None), \
+                patch.object(file_exporter.config, 'PDF_MERGE_CHUNK_THRESHOLD', 2), \
+                patch.object(file_exporter, 'ProcessPoolExecutor', side_effect=RuntimeError('no pool')), \
+                patch.object(self.merger, '_try_pdfunite_merge', return_value=True) as pdfunite:
+            self.assertTrue(self.merger.merge_pdfs(self.pdf_files, output_path))
+
+        pdfunite.assert_called_once_with(self.pdf_files, output_path)
+
+    def test_missing_pdf_library_skips_pypdf_merge(self):
+        """Test the PyPDF2 strategy reports failure when no PDF library is installed."""
+        output_path = os.path.join(self.temp_dir, 'merged.pdf')
+
+        with patch.object(file_exporter, 'PdfWriter', None):
+            self.assertFalse(self.merger._try_pypdf2_merge(self.pdf_files, output_path))
+
+        self.assertFalse(os.path.exists(output_path))
+
+    def test_failed_merge_leaves_existing_output_untouched(self):
+        """Test a failed write neither replaces the output nor leaves temp files."""
+        output_path = os.path.join(self.temp_dir, 'merged.pdf')
+        Path(output_path).write_bytes(b'previous')
+
+        with patch.object(PdfWriter, 'write', side_effect=RuntimeError('disk full')):
+            self.assertFalse(self.merger._try_pypdf2_merge(self.pdf_files, output_path))
+
+        self.assertEqual(Path(output_path).read_bytes(), b'previous')
+        self.assertEqual(len(os.listdir(self.temp_dir)), 4)
+
+
+class TestTempFileManager(unittest.TestCase):
+    """Test temporary file tracking and cleanup."""
+
+    def test_named_files_and_dirs_removed(self):
+        """Test cleanup removes tracked files and directories."""
+        with TempFileManager() as temp_mgr:
+            temp_file = temp_mgr.create_temp_file('.svg')
+            temp_dir = temp_mgr.create_temp_dir()
+            Path(temp_dir, 'inner.txt').write_text('x')
+            self.assertTrue(temp_file.endswith('.svg'))
+
+        self.assertFalse(os.path.exists(temp_file))
+        self.assertFalse(os.path.exists(temp_dir))
+
+    def test_files_removed_relative_to_directory(self):
+        """Test files are unlinked by name and missing files are ignored."""
+        logger = MagicMock()
+        temp_mgr = TempFileManager(logger)
+        temp_files = [temp_mgr.create_temp_file('.svg') for _ in range(3)]
+        os.remove(temp_files[1])
+
+        with patch.object(file_exporter.os, 'unlink', wraps=os.unlink) as unlink:
+            temp_mgr.cleanup()
+
+        logger.warning.assert_not_called()
+        for temp_file in temp_files:
+            self.assertFalse(os.path.exists(temp_file))
+        if file_exporter._UNLINK_DIR_FD:
+            self.assertEqual([c.args[0] for c in unlink.call_args_list],
+                             [os.path.basename(f) for f in temp_files])
+
+    def test_named_files_share_private_directory(self):
+        """Test named files are numbered in one private directory removed by cleanup."""
+        temp_mgr = TempFileManager()
+        temp_files = [temp_mgr.create_temp_file('.svg', prefix='page_') for _ in range(3)]
+        pool_dir = os.path.dirname(temp_files[0])
+
+        self.assertEqual([os.path.basename(f) for f in temp_files], ['page_0.svg', 'page_1.svg', 'page_2.svg'])
+        self.assertEqual(temp_mgr.temp_dirs, [pool_dir])
+        self.assertEqual(os.stat(temp_files[0]).st_mode & 0o777, 0o600)
+        self.assertEqual(file_exporter._TEMP_FILE_FLAGS & getattr(os, 'O_CLOEXEC', 0), getattr(os, 'O_CLOEXEC', 0))
+
+        temp_mgr.cleanup()
+
+        self.assertFalse(os.path.exists(pool_dir))
+        new_file = temp_mgr.create_temp_file('.svg')
+        self.assertNotEqual(os.path.dirname(new_file), pool_dir)
+        temp_mgr.cleanup()
+
+    def test_paths_split_once_at_creation(self):
+        """Test files share one directory entry and cleanup does no path parsing."""
+        temp_mgr = TempFileManager()
+        temp_files = [temp_mgr.create_temp_file('.svg') for _ in range(5)]
+
+        self.assertEqual(temp_mgr._temp_file_dirs, [os.path.dirname(temp_files[0])])
+
+        with patch.object(file_exporter.os.path, 'dirname') as dirname, \
+                patch.object(file_exporter.os.path, 'basename') as basename:
+            temp_mgr.cleanup()
+
+        dirname.assert_not_called()
+        basename.assert_not_called()
+        for temp_file in temp_files:
+            self.assertFalse(os.path.exists(temp_file))
+
+    def test_missing_entries_skipped_without_probe(self):
+        """Test already removed files and directories are skipped without stat probes."""
+        logger = MagicMock()
+        temp_mgr = TempFileManager(logger)
+        temp_file = temp_mgr.create_temp_file('.svg')
+        temp_dir = temp_mgr.create_temp_dir()
+        os.remove(temp_file)
+        os.rmdir(temp_dir)
+
+        with patch.object(file_exporter.os.path, 'exists') as exists:
+            temp_mgr.cleanup()
+
+        exists.assert_not_called()
+        logger.warning.assert_not_called()
+
+    def test_many_entries_removed_in_parallel(self):
+        """Test large cleanups use a thread pool and still remove everything."""
+        temp_mgr = TempFileManager()
+        temp_files = [temp_mgr.create_temp_file('.svg') for _ in range(6)]
+        temp_dirs = [temp_mgr.create_temp_dir() for _ in range(6)]
+
+        with patch.object(file_exporter, 'ThreadPoolExecutor', wraps=file_exporter.ThreadPoolExecutor) as pool:
+            temp_mgr.cleanup()
+
+        self.assertEqual(pool.call_count, 2)
+        for path in temp_files + temp_dirs:
+            self.assertFalse(os.path.exists(path))
+
+    def test_directory_removal_continues_after_error(self):
+        """Test a failing entry does not stop removal of the rest of a tree."""
+        logger = MagicMock()
+        temp_mgr = TempFileManager(logger)
+        temp_dir = temp_mgr.create_temp_dir()
+        for name in ('a.svg', 'b.svg', 'c.svg'):
+            Path(temp_dir, name).write_text('x')
+        real_unlink = os.unlink
+
+        def failing_unlink(path, *args, **kwargs):
+            if os.path.basename(path) == 'a.svg':
+                raise PermissionError(path)
+            return real_unlink(path, *args, **kwargs)
+
+        with patch.object(file_exporter.os, 'unlink', side_effect=failing_unlink):
+            temp_mgr.cleanup()
+
+        self.assertTrue(os.path.exists(temp_dir))
+        self.assertEqual(os.listdir(temp_dir), ['a.svg'])
+        logger.warning.assert_called_once()
+        shutil.rmtree(temp_dir)
+
+    def test_async_cleanup_runs_detached(self):
+        """Test async cleanup hands tracked files to the background pool."""
+        with patch.object(TempFileManager, '_cleanup_pool') as pool:
+            with TempFileManager(async_cleanup=True) as temp_mgr:
+                temp_file = temp_mgr.create_temp_file('.svg')
+
+            self.assertTrue(os.path.exists(temp_file))
+            self.assertEqual(temp_mgr.temp_files, [])
+            self.assertEqual(temp_mgr.temp_dirs, [])
+
+            scheduled_cleanup = pool.submit.call_args.args[0]
+            scheduled_cleanup()
+
+        self.assertFalse(os.path.exists(temp_file))
+        self.assertFalse(os.path.exists(os.path.dirname(temp_file)))
+
+    def test_cleanup_pool_created_on_first_async_cleanup(self):
+        """Test the background pool only exists once async cleanup is used."""
+        with patch.object(TempFileManager, '_cleanup_pool', None), \
+                patch.object(file_exporter.atexit, 'register') as register:
+            with TempFileManager() as temp_mgr:
+                temp_mgr.create_temp_file('.svg')
+            self.assertIsNone(TempFileManager._cleanup_pool)
+
+            with TempFileManager(async_cleanup=True) as temp_mgr:
+                temp_file = temp_mgr.create_temp_file('.svg')
+            pool = TempFileManager._cleanup_pool
+            self.assertIsNotNone(pool)
+            register.assert_called_once_with(pool.shutdown, wait=True)
+            pool.shutdown(wait=True)
+
+        self.assertFalse(os.path.exists(temp_file))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,565 @@
+"""
+Test cases for caching and performance monitoring.
+
+Tests performance module functionality including:
+- LRU eviction and TTL expiry
+- The @cached decorator and its cache keys
+"""
+
+import unittest
+import gc
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules import performance
+from modules.performance import LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+    """Test LRU cache eviction and expiry."""
+
+    def _backends(self):
+        """Yield a label for each available cache store with it active."""
+        if performance.lru is not None:
+            yield 'lru-dict'
+        with patch.object(performance, 'lru', None):
+            yield 'OrderedDict'
+
+    def test_evicts_least_recently_used(self):
+        """Test the oldest untouched entry is evicted first."""
+        for backend in self._backends():
+            with self.subTest(backend=backend):
+                cache = LRUCache(max_size=2, ttl=60)
+                cache.put(b'a', 1)
+                cache.put(b'b', 2)
+                cache.get(b'a')
+                cache.put(b'c', 3)
+
+                self.assertEqual(cache.get(b'a'), 1)
+                self.assertIsNone(cache.get(b'b'))
+                self.assertEqual(cache.get(b'c'), 3)
+                self.assertEqual(cache.size(), 2)
+
+    def test_referenced_entries_get_second_chance(self):
+        """Test the fallback sweep skips hit entries and evicts cold ones."""
+        with patch.object(performance, 'lru', None):
+            cache = LRUCache(max_size=3, ttl=60)
+            for key in (b'a', b'b', b'c'):
+                cache.put(key, key)
+            cache.get(b'a')
+            cache.get(b'b')
+            cache.put(b'd', b'd')
+            self.assertEqual(set(cache.shards[0].cache), {b'a', b'b', b'd'})
+
+            # a and b were re-queued behind d with their bits cleared
+            cache.put(b'e', b'e')
+            self.assertEqual(set(cache.shards[0].cache), {b'a', b'b', b'e'})
+
+    def test_sharding(self):
+        """Test stripe count and capacities for small and large caches."""
+        test_cases = [(3, 1), (31, 1), (32, 2), (100, 4), (1000, 16)]
+
+        for max_size, shard_count in test_cases:
+            with self.subTest(max_size=max_size):
+                cache = LRUCache(max_size=max_size, ttl=60)
+                self.assertEqual(len(cache.shards), shard_count)
+                self.assertEqual(sum(shard.max_size for shard in cache.shards), max_size)
+
+    def test_sharded_cache_operations(self):
+        """Test entries spread over shards are found, counted and cleared."""
+        cache = LRUCache(max_size=1000, ttl=60)
+        keys = [('key', i) for i in range(200)]
+        for key in keys:
+            cache.put(key, key[1])
+
+        self.assertEqual([cache.get(key) for key in keys], list(range(200)))
+        self.assertEqual(cache.size(), 200)
+        self.assertGreater(sum(1 for shard in cache.shards if shard.size()), 1)
+        cache.clear()
+        self.assertEqual(cache.size(), 0)
+
+    def test_weak_values(self):
+        """Test weakly held values vanish once unused and others stay strong."""
+        class Result:
+            pass
+
+        for backend in self._backends():
+            with self.subTest(backend=backend):
+                cache = LRUCache(max_size=10, ttl=60, weak_values=True)
+                result = Result()
+                cache.put(b'obj', result)
+                cache.put(b'text', 'immutable')
+
+                self.assertIs(cache.get(b'obj'), result)
+                del result
+                gc.collect()
+
+                self.assertIsNone(cache.get(b'obj'))
+                self.assertEqual(cache.get(b'text'), 'immutable')
+                self.assertEqual(cache.size(), 1)
+
+    def test_put_replaces_existing_entry(self):
+        """Test re-putting a key updates its value without growing the cache."""
+        for backend in self._backends():
+            with self.subTest(backend=backend):
+                cache = LRUCache(max_size=2, ttl=60)
+                cache.put(b'a', 1)
+                cache.put(b'a', 2)
+
+                self.assertEqual(cache.get(b'a'), 2)
+                self.assertEqual(cache.size(), 1)
+
+    def test_expired_entries(self):
+        """Test expired entries miss on get and are removed by cleanup."""
+        cache = LRUCache(max_size=10, ttl=-1)
+        cache.put(b'a', 1)
+        cache.put(b'b', 2)
+
+        self.assertIsNone(cache.get(b'a'))
+        self.assertEqual(cache.cleanup_expired(), 1)
+        self.assertEqual(cache.size(), 0)
+
+    def test_cleanup_keeps_live_entries_in_order(self):
+        """Test cleanup drops only expired entries and keeps ring order."""
+        for backend in self._backends():
+            with self.subTest(backend=backend):
+                cache = LRUCache(max_size=10, ttl=60)
+                for key in (b'a', b'b', b'c', b'd'):
+                    cache.put(key, key)
+                shard = cache.shards[0]
+                for key in (b'b', b'd'):
+                    shard.cache[key] = (0, shard.cache[key][1])
+
+                self.assertEqual(cache.cleanup_expired(), 2)
+                self.assertEqual(cache.cleanup_expired(), 0)
+                self.assertEqual(sorted(shard.cache.keys()), [b'a', b'c'])
+                if backend == 'OrderedDict':
+                    self.assertEqual(list(shard.cache), [b'a', b'c'])
+
+
+class TestPerformanceMonitor(unittest.TestCase):
+    """Test operation timing and metrics reporting."""
+
+    def test_metrics_reported_in_seconds(self):
+        """Test nanosecond counters are reported as second-based metrics."""
+        monitor = performance.PerformanceMonitor()
+
+        with patch.object(performance.time, 'perf_counter_ns', side_effect=[1_000, 2_501_000]):
+            timer_id = monitor.start_timer('op')
+            elapsed = monitor.end_timer('op', timer_id)
+
+        self.assertAlmostEqual(elapsed, 0.0025)
+        metrics = monitor.get_metrics('op')
+        self.assertEqual(metrics['call_count'], 1)
+        self.assertAlmostEqual(metrics['total_time'], 0.0025)
+        self.assertAlmostEqual(metrics['average_time'], 0.0025)
+        self.assertAlmostEqual(metrics['min_time'], 0.0025)
+        self.assertAlmostEqual(metrics['max_time'], 0.0025)
+        self.assertEqual(monitor.get_metrics(), {'op': metrics})
+        self.assertEqual(monitor.get_metrics('missing'), {})
+
+    def test_all_metrics_snapshot(self):
+        """Test the all-operations view is read-only and reused until a change."""
+        monitor = performance.PerformanceMonitor()
+        monitor.push_timer('op')
+        monitor.pop_timer('op')
+
+        snapshot = monitor.get_metrics()
+        self.assertEqual(snapshot['op']['call_count'], 1)
+        with self.assertRaises(TypeError):
+            snapshot['op']['call_count'] = 5
+        with patch.object(monitor, 'lock') as lock:
+            self.assertIs(monitor.get_metrics(), snapshot)
+        lock.__enter__.assert_not_called()
+
+        monitor.push_timer('op')
+        monitor.pop_timer('op')
+        self.assertEqual(monitor.get_metrics()['op']['call_count'], 2)
+        self.assertEqual(snapshot['op']['call_count'], 1)
+
+        monitor.reset_metrics()
+        self.assertEqual(dict(monitor.get_metrics()), {})
+
+    def test_unknown_timer(self):
+        """Test ending an unknown timer returns None."""
+        monitor = performance.PerformanceMonitor()
+        monitor.start_timer('op')
+
+        self.assertIsNone(monitor.end_timer('op', 'bogus'))
+        self.assertIsNone(monitor.end_timer('other', 'bogus'))
+
+
+    def test_thread_local_timers_nest(self):
+        """Test pushed timers pair up per thread in last-in, first-out order."""
+        monitor = performance.PerformanceMonitor()
+
+        with patch.object(performance.time, 'perf_counter_ns', side_effect=[0, 10, 30, 100]):
+            monitor.push_timer('op')
+            monitor.push_timer('op')
+            inner = monitor.pop_timer('op')
+            outer = monitor.pop_timer('op')
+
+        self.assertAlmostEqual(inner, 20e-9)
+        self.assertAlmostEqual(outer, 100e-9)
+        self.assertIsNone(monitor.pop_timer('op'))
+        metrics = monitor.get_metrics('op')
+        self.assertEqual(metrics['call_count'], 2)
+        self.assertEqual(metrics['active_timers'], {})
+
+    def test_pop_timer_results_are_buffered(self):
+        """Test pop_timer() batches updates and get_metrics() drains them."""
+        monitor = performance.PerformanceMonitor()
+
+        for _ in range(3):
+            monitor.push_timer('op')
+            monitor.pop_timer('op')
+        self.assertNotIn('op', monitor.metrics)
+        self.assertEqual(monitor.get_metrics('op')['call_count'], 3)
+
+        with patch.object(monitor, 'FLUSH_SIZE', 2):
+            for _ in range(2):
+                monitor.push_timer('op')
+                monitor.pop_timer('op')
+        self.assertEqual(monitor.metrics['op'].call_count, 5)
+
+    def test_buffers_of_exited_threads(self):
+        """Test results from finished threads are counted and then dropped."""
+        monitor = performance.PerformanceMonitor()
+
+        def work():
+            monitor.push_timer('op')
+            monitor.pop_timer('op')
+
+        threads = [threading.Thread(target=work) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+            thread.join(5)
+
+        self.assertEqual(monitor.get_metrics('op')['call_count'], 3)
+        self.assertEqual(monitor._buffers, {})
+
+    def test_timed_decorator_records_calls(self):
+        """Test @timed records finished calls, including ones that raise."""
+        @performance.timed(operation='test_performance.timed_op')
+        def work(fail=False):
+            if fail:
+                raise ValueError("boom")
+            return 1
+
+        performance.reset_performance_stats()
+        try:
+            self.assertEqual(work(), 1)
+            with self.assertRaises(ValueError):
+                work(fail=True)
+            stats = performance.get_performance_stats()['test_performance.timed_op']
+        finally:
+            performance.reset_performance_stats()
+
+        self.assertEqual(stats['call_count'], 2)
+        self.assertGreaterEqual(stats['max_time'], stats['min_time'])
+
+    def test_performance_stats_are_plain_dicts(self):
+        """Test the public stats can be serialized and modified by callers."""
+        @performance.timed(operation='test_performance.plain_op')
+        def work():
+            return 1
+
+        performance.reset_performance_stats()
+        try:
+            work()
+            stats = performance.get_performance_stats()
+            json.dumps(stats)
+            stats['test_performance.plain_op']['call_count'] = 99
+            stats.clear()
+            again = performance.get_performance_stats()
+        finally:
+            performance.reset_performance_stats()
+
+        self.assertIs(type(again), dict)
+        self.assertEqual(again['test_performance.plain_op']['call_count'], 1)
+
+
+class TestDecoratorMetadata(unittest.TestCase):
+    """Test decorated functions keep their identity for introspection."""
+
+    def test_wrappers_keep_metadata(self):
+        """Test name, docstring and __wrapped__ survive both decorators."""
+        def sample(x):
+            """Sample docstring."""
+            return x
+
+        for decorator in (performance.cached(ttl=60), performance.timed()):
+            with self.subTest(decorator=decorator):
+                wrapped = decorator(sample)
+                self.assertEqual(wrapped.__name__, 'sample')
+                self.assertEqual(wrapped.__doc__, 'Sample docstring.')
+                self.assertIs(wrapped.__wrapped__, sample)
+
+
+class TestRWLock(unittest.TestCase):
+    """Test the readers-writer lock."""
+
+    def test_readers_share_and_block_writers(self):
+        """Test readers overlap while a writer waits for the last reader."""
+        rwlock = performance.RWLock()
+        rwlock.acquire_read()
+        rwlock.acquire_read()
+
+        self.assertFalse(rwlock.write_lock.acquire(blocking=False))
+        rwlock.release_read()
+        self.assertFalse(rwlock.write_lock.acquire(blocking=False))
+        rwlock.release_read()
+        self.assertTrue(rwlock.write_lock.acquire(blocking=False))
+        rwlock.write_lock.release()
+
+    def test_reader_released_from_other_thread(self):
+        """Test the last reader out may be a different thread than the first."""
+        rwlock = performance.RWLock()
+        rwlock.acquire_read()
+        thread = threading.Thread(target=rwlock.acquire_read)
+        thread.start()
+        thread.join(5)
+        rwlock.release_read()
+
+        released = threading.Thread(target=rwlock.release_read)
+        released.start()
+        released.join(5)
+
+        self.assertTrue(rwlock.write_lock.acquire(blocking=False))
+        rwlock.write_lock.release()
+
+
+class TestCachedDecorator(unittest.TestCase):
+    """Test the @cached decorator."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        performance.clear_cache()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        performance.clear_cache()
+
+    def test_results_are_reused(self):
+        """Test repeated calls with the same arguments run the function once."""
+        calls = []
+
+        @performance.cached(ttl=60)
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        with patch.object(performance, '_cache_enabled', True):
+            self.assertEqual(square(3), 9)
+            self.assertEqual(square(3), 9)
+            self.assertEqual(square(4), 16)
+
+        self.assertEqual(calls, [3, 4])
+
+    def test_unhashable_arguments_bypass_cache(self):
+        """Test calls with unhashable arguments always run and are not stored."""
+        calls = []
+
+        @performance.cached(ttl=60)
+        def total(values, scale=1):
+            calls.append(values)
+            return sum(values) * scale
+
+        with patch.object(performance, '_cache_enabled', True):
+            self.assertEqual(total((1, 2), scale=2), 6)
+            self.assertEqual(total((1, 2), scale=2), 6)
+            self.assertEqual(total([1, 2]), 3)
+            self.assertEqual(total([1, 2]), 3)
+            self.assertEqual(total(values=(1, 2)), 3)
+
+        self.assertEqual(calls, [(1, 2), [1, 2], [1, 2], (1, 2)])
+        self.assertEqual(performance.get_cache_stats()['size'], 2)
+
+    def test_keys_separate_functions_and_kwargs(self):
+        """Test kwargs order is ignored and functions never share entries."""
+        @performance.cached(ttl=60)
+        def first(a, b=0, c=0):
+            return ('first', a, b, c)
+
+        @performance.cached(ttl=60)
+        def second(a, b=0, c=0):
+            return ('second', a, b, c)
+
+        with patch.object(performance, '_cache_enabled', True):
+            self.assertEqual(first(1, b=2, c=3), ('first', 1, 2, 3))
+            self.assertEqual(first(1, c=3, b=2), ('first', 1, 2, 3))
+            self.assertEqual(second(1, b=2, c=3), ('second', 1, 2, 3))
+
+        self.assertEqual(performance.get_cache_stats()['size'], 2)
+
+    def test_keyword_calls_share_positional_key(self):
+        """Test keyword, positional and defaulted calls bind to one entry."""
+        calls = []
+
+        @performance.cached(ttl=60)
+        def scaled(value, /, scale=2, offset=0):
+            calls.append((value, scale, offset))
+            return value * scale + offset
+
+        with patch.object(performance, '_cache_enabled', True):
+            self.assertEqual(scaled(3, 2, 0), 6)
+            self.assertEqual(scaled(3, offset=0, scale=2), 6)
+            self.assertEqual(scaled(3, scale=4), 12)
+            self.assertEqual(scaled(3, 4, 0), 12)
+            with self.assertRaises(TypeError):
+                scaled(value=3, scale=2)
+
+        self.assertEqual(calls, [(3, 2, 0), (3, 4, 0)])
+
+    def test_key_builder_signatures(self):
+        """Test which signatures get a compiled key builder."""
+        def plain(a, b=1):
+            pass
+
+        def keyword_only(a, *, b=1):
+            pass
+
+        def variadic(*args, **kwargs):
+            pass
+
+        builder = performance._build_key_builder(plain)
+        self.assertEqual(builder(1, b=2), (plain, (1, 2)))
+        self.assertEqual(builder(b=2, a=1), builder(1, 2))
+        self.assertEqual(builder(1), (plain, (1, 1)))
+        self.assertIsNone(performance._build_key_builder(keyword_only))
+        self.assertIsNone(performance._build_key_builder(variadic))
+
+    def test_cache_enabled_switches(self):
+        """Test runtime and decoration-time switches for caching."""
+        calls = []
+
+        def double(x):
+            calls.append(x)
+            return x * 2
+
+        cached_double = performance.cached(ttl=60)(double)
+        try:
+            performance.set_cache_enabled(False)
+            self.assertFalse(performance.get_cache_stats()['enabled'])
+            self.assertIs(performance.cached(ttl=60)(double), double)
+            cached_double(1)
+            cached_double(1)
+            self.assertEqual(calls, [1, 1])
+
+            performance.set_cache_enabled(True)
+            cached_double(1)
+            cached_double(1)
+            self.assertEqual(calls, [1, 1, 1])
+        finally:
+            performance.set_cache_enabled(True)
+
+    def test_concurrent_misses_compute_once(self):
+        """Test threads missing on the same key share the first result."""
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        @performance.cached(ttl=60)
+        def slow(x):
+            calls.append(x)
+            started.set()
+            release.wait(5)
+            return x * 2
+
+        results = []
+        with patch.object(performance, '_cache_enabled', True):
+            threads = [threading.Thread(target=lambda: results.append(slow(5))) for _ in range(4)]
+            threads[0].start()
+            started.wait(5)
+            for thread in threads[1:]:
+                thread.start()
+            time.sleep(0.1)
+            release.set()
+            for thread in threads:
+                thread.join(5)
+
+        self.assertEqual(calls, [5])
+        self.assertEqual(results, [10] * 4)
+        self.assertEqual(performance._in_flight, {})
+
+    def test_failed_computation_is_not_shared(self):
+        """Test an exception releases waiters and is not cached."""
+        calls = []
+
+        @performance.cached(ttl=60)
+        def flaky(x):
+            calls.append(x)
+            if len(calls) == 1:
+                raise ValueError("first call fails")
+            return x
+
+        with patch.object(performance, '_cache_enabled', True):
+            with self.assertRaises(ValueError):
+                flaky(1)
+            self.assertEqual(flaky(1), 1)
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(performance._in_flight, {})
+
+
+    def test_recursive_miss_on_same_key_computes_directly(self):
+        """Test a thread re-entering its own in-flight key does not wait."""
+        calls = []
+
+        @performance.cached(ttl=60)
+        def recurse(x):
+            calls.append(x)
+            if len(calls) == 1:
+                return recurse(x) + 1
+            return x
+
+        with patch.object(performance, '_cache_enabled', True):
+            result = []
+            thread = threading.Thread(target=lambda: result.append(recurse(3)))
+            thread.start()
+            thread.join(5)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(result, [4])
+        self.assertEqual(calls, [3, 3])
+        self.assertEqual(performance._in_flight, {})
+
+    def test_waiter_computes_after_timeout(self):
+        """Test a miss stops waiting on a stuck owner and computes itself."""
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        @performance.cached(ttl=60)
+        def stuck(x):
+            calls.append(threading.get_ident())
+            if len(calls) == 1:
+                started.set()
+                release.wait(5)
+            return x
+
+        with patch.object(performance, '_cache_enabled', True), \
+                patch.object(performance.config, 'CACHE_WAIT_TIMEOUT', 0.05):
+            owner = threading.Thread(target=stuck, args=(7,))
+            owner.start()
+            started.wait(5)
+            try:
+                self.assertEqual(stuck(7), 7)
+            finally:
+                release.set()
+                owner.join(5)
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(performance._in_flight, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
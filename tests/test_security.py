@@ -0,0 +1,258 @@
+"""
+Test cases for file security validation.
+
+Tests FileValidator and SecurityUtils functionality including:
+- Dangerous content detection
+- Path and extension validation
+- Filename and input sanitization
+"""
+
+import unittest
+import hashlib
+import sys
+import os
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules import security
+from modules.security import FileValidator, SecurityUtils
+
+
+class TestFileContentValidation(unittest.TestCase):
+    """Test dangerous pattern detection in file content."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _backends(self):
+        """Yield a label for each available scanner with it active."""
+        if security._HS_DATABASE is not None:
+            yield 'hyperscan'
+        with patch.object(security, '_HS_DATABASE', None):
+            yield 'regex'
+
+    def _write(self, content: str, name: str = "data.csv") -> str:
+        """Write content to a temporary file and return its path."""
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def test_dangerous_patterns_rejected(self):
+        """Test each dangerous pattern is detected regardless of case."""
+        samples = [
+            '<script type="text/javascript">',
+            '<SCRIPT>',
+            'JavaScript:alert(1)',
+            'vbscript:msgbox',
+            'data:text/html;base64,xyz',
+            'eval (x)',
+            'exec(x)',
+            'system  (x)',
+        ]
+
+        for backend in self._backends():
+            for sample in samples:
+                with self.subTest(backend=backend, sample=sample):
+                    path = self._write(f"name,value\nA,{sample}\n")
+                    with self.assertRaises(security.FileSecurityError) as ctx:
+                        FileValidator.validate_file_content(path, "csv")
+                    self.assertEqual(ctx.exception.context['reason'], "dangerous_content")
+
+    def test_content_scanned_without_decoding(self):
+        """Test non-UTF-8 bytes are scanned rather than rejected."""
+        path = os.path.join(self.temp_dir, "latin1.csv")
+        with open(path, 'wb') as f:
+            f.write("name\nJosé\n".encode('latin-1'))
+
+        self.assertTrue(FileValidator.validate_file_content(path, "csv"))
+
+        with open(path, 'ab') as f:
+            f.write(b'\xff<script>\n')
+        with self.assertRaises(security.FileSecurityError):
+            FileValidator.validate_file_content(path, "csv")
+
+    def test_safe_content_accepted(self):
+        """Test ordinary CSV content passes."""
+        path = self._write("name,title\nAlice,Evaluator\nBob,System admin\n")
+
+        for backend in self._backends():
+            with self.subTest(backend=backend):
+                self.assertTrue(FileValidator.validate_file_content(path, "csv"))
+
+
+class TestCombinedValidation(unittest.TestCase):
+    """Test the combined CSV and image validators."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.temp_dir, "people.csv")
+        with open(self.csv_path, 'w', encoding='utf-8') as f:
+            f.write("name,title\nAlice,Engineer\n")
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_size_taken_from_open_file(self):
+        """Test the size check uses the open descriptor, not the path."""
+        with patch.object(security.os, 'stat', side_effect=AssertionError("path stat")):
+            self.assertTrue(FileValidator.validate_csv_file(self.csv_path))
+
+    def test_rejections(self):
+        """Test oversized, unsafe and missing files are rejected."""
+        with patch.object(security.config, 'MAX_FILE_SIZE', 10):
+            with self.assertRaises(security.FileSecurityError) as ctx:
+                FileValidator.validate_csv_file(self.csv_path)
+        self.assertEqual(ctx.exception.context['reason'], "file_too_large")
+
+        with open(self.csv_path, 'a', encoding='utf-8') as f:
+            f.write("Bob,<script>\n")
+        with self.assertRaises(security.FileSecurityError) as ctx:
+            FileValidator.validate_csv_file(self.csv_path)
+        self.assertEqual(ctx.exception.context['reason'], "dangerous_content")
+
+        missing = os.path.join(self.temp_dir, "missing.png")
+        with self.assertRaises(security.FileSecurityError) as ctx:
+            FileValidator.validate_image_file(missing)
+        self.assertEqual(ctx.exception.context['reason'], "access_error")
+
+
+class TestPathValidation(unittest.TestCase):
+    """Test path and extension validation."""
+
+    def test_accepted_paths(self):
+        """Test safe paths pass with and without an allowed-extension list."""
+        test_cases = [
+            ('data/people.csv', {'.csv'}),
+            ('data/PEOPLE.CSV', {'.csv'}),
+            ('/tmp/photo.png', None),
+            ('data/no_extension', None),
+        ]
+
+        for path, allowed in test_cases:
+            with self.subTest(path=path):
+                self.assertTrue(FileValidator.validate_file_path(path, allowed))
+
+    def test_accepted_paths_are_cached(self):
+        """Test a repeated safe path is answered without rechecking it."""
+        path, allowed = 'data/cached_only_here.csv', frozenset({'.csv'})
+        self.assertTrue(FileValidator.validate_file_path(path, allowed))
+
+        with patch.object(FileValidator, '_has_safe_chars', side_effect=AssertionError("rechecked")):
+            self.assertTrue(FileValidator.validate_file_path(path, allowed))
+            with self.assertRaises(AssertionError):
+                FileValidator.validate_file_path(path, {'.csv'})
+
+    def test_rejected_paths(self):
+        """Test each unsafe path is rejected with the matching reason."""
+        test_cases = [
+            ('', None, 'empty_path'),
+            ('data/../secret.csv', None, 'path_traversal'),
+            ('~/data.csv', None, 'path_traversal'),
+            ('data/my file.csv', None, 'unsafe_chars'),
+            ('data/caf\u00e9.csv', None, 'unsafe_chars'),
+            ('data/people.csv\n', None, 'unsafe_chars'),
+            ('data/people.txt', {'.csv'}, 'disallowed_extension'),
+            ('data/run.PY', None, 'dangerous_extension'),
+            ('data/archive.csv.exe', None, 'dangerous_extension'),
+        ]
+
+        for path, allowed, reason in test_cases:
+            with self.subTest(path=path):
+                with self.assertRaises(security.FileSecurityError) as ctx:
+                    FileValidator.validate_file_path(path, allowed)
+                self.assertEqual(ctx.exception.context['reason'], reason)
+
+class TestSanitization(unittest.TestCase):
+    """Test filename and input sanitization."""
+
+    def test_sanitize_filename(self):
+        """Test unsafe characters are removed and whitespace is tidied."""
+        test_cases = [
+            ('report.pdf', 'report.pdf'),
+            ('a<b>c:d"e|f?g*h.png', 'abcdefgh.png'),
+            ('tab\there\x00\x1f\x7f.svg', 'tabhere.svg'),
+            ('  many   spaces\n here . ', 'many spaces here'),
+            ('..hidden..', 'hidden'),
+            ('<>?*', 'unnamed_file'),
+        ]
+
+        for filename, expected in test_cases:
+            with self.subTest(filename=filename):
+                self.assertEqual(FileValidator.sanitize_filename(filename), expected)
+
+    def test_long_filename_keeps_extension(self):
+        """Test truncation to 255 characters preserves the extension."""
+        sanitized = FileValidator.sanitize_filename('x' * 300 + '.png')
+
+        self.assertEqual(len(sanitized), 255)
+        self.assertTrue(sanitized.endswith('.png'))
+
+    def test_sanitize_input(self):
+        """Test control characters are removed and newlines and tabs kept."""
+        test_cases = [
+            ('', ''),
+            ('  plain text  ', 'plain text'),
+            ('a\x00b\x01c\x7fd', 'abcd'),
+            ('line\none\tcol\r\n', 'line\none\tcol'),
+            ('caf\u00e9\x00\x1b[0m', 'caf\u00e9[0m'),
+        ]
+
+        for text, expected in test_cases:
+            with self.subTest(text=text):
+                self.assertEqual(SecurityUtils.sanitize_input(text), expected)
+
+        self.assertEqual(SecurityUtils.sanitize_input('abcdef', max_length=3), 'abc')
+
+
+class TestSafeHash(unittest.TestCase):
+    """Test SHA256 hashing helpers."""
+
+    def test_hash_matches_salted_concatenation(self):
+        """Test single and batch hashes equal sha256 of data followed by salt."""
+        items = ['', 'alice', 'José']
+
+        for salt in ('', 'pepper'):
+            with self.subTest(salt=salt):
+                expected = [hashlib.sha256(f"{item}{salt}".encode('utf-8')).hexdigest() for item in items]
+                self.assertEqual([SecurityUtils.generate_safe_hash(item, salt) for item in items], expected)
+                self.assertEqual(SecurityUtils.generate_safe_hashes(iter(items), salt), expected)
+
+
+class TestURLValidation(unittest.TestCase):
+    """Test URL safety checks."""
+
+    def test_validate_url(self):
+        """Test only http(s) URLs to non-local hosts are accepted."""
+        test_cases = [
+            ('https://example.com/image.png', True),
+            ('HTTP://Example.com:8080/a?b=1#c', True),
+            ('ftp://example.com/file', False),
+            ('javascript:alert(1)', False),
+            ('http://localhost/admin', False),
+            ('http://user@LOCALHOST:80/', False),
+            ('http://127.0.0.1#@example.com', False),
+            ('http://[::1]/', False),
+            (' http://localhost/', False),
+        ]
+
+        for url, expected in test_cases:
+            with self.subTest(url=url):
+                self.assertIs(SecurityUtils.validate_url(url), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
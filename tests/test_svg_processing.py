@@ -257,6 +257,20 @@ class TestSVGProcessing(unittest.TestCase):
                                    f"Color {input_color} not properly converted")
 
 
+class TestDisplayStyle(unittest.TestCase):
+    """Test reading and writing display values in style attributes."""
+    
+    def test_display_style_round_trip(self):
+        """Test display values are read from and replaced in style attributes."""
+        element = etree.Element('g', style='fill:red;display : none;stroke:blue')
+
+        self.assertEqual(SVGElementProcessor.get_display_attribute(element), 'none')
+        SVGElementProcessor.set_display_value(element, 'inline')
+        self.assertEqual(element.get('style'), 'fill:red;stroke:blue; display:inline')
+        self.assertEqual(SVGElementProcessor.get_display_attribute(element), 'inline')
+        self.assertEqual(SVGElementProcessor.get_display_attribute(etree.Element('g')), 'inline')
+
+
 class TestCSVProcessingWithSVG(unittest.TestCase):
     """Test CSV processing with SVG integration."""
     